@@ -0,0 +1,14 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Analytics Admin
+"""
+
+# System
+from django.contrib import admin
+
+# Project
+from apps.analytics.models import ClickEvent, ClickRollup
+
+admin.site.register(ClickEvent)
+admin.site.register(ClickRollup)
@@ -0,0 +1,12 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Analytics Config
+"""
+
+from django.apps import AppConfig
+
+
+class AnalyticsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.analytics"
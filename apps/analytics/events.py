@@ -0,0 +1,190 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Click Event Buffer
+"""
+
+# System
+import os
+import json
+import time
+import threading
+from collections import deque
+from datetime import datetime
+from django.conf import settings
+
+# Project
+from core.flusher import BackgroundFlusher, spawn
+from apps.analytics.models import ClickEvent
+
+
+class DatabaseSink:
+    """
+    ClickEvent 테이블에 bulk_create로 기록
+    """
+
+    def write(self, events, batch_size):
+        ClickEvent.objects.bulk_create(
+            [
+                ClickEvent(
+                    short_url_id=short_url_id,
+                    clicked_at=datetime.fromtimestamp(clicked_at),
+                    referrer=referrer,
+                    user_agent=user_agent,
+                    ip=ip,
+                )
+                for short_url_id, clicked_at, referrer, user_agent, ip in events
+            ],
+            batch_size=batch_size,
+        )
+
+
+class NDJSONSink:
+    """
+    NDJSON 파일에 이어서 기록
+    파일 이름에 시간(rotate 형식)과 프로세스 id를 붙여 시간 단위로 교체하고, 워커끼리 같은 파일에 쓰지 않습니다.
+    """
+
+    def __init__(self, directory, rotate):
+        self.directory = directory
+        self.rotate = rotate
+
+    def get_path(self, now=None):
+        stamp = (now or datetime.now()).strftime(self.rotate)
+        return os.path.join(self.directory, f"clicks-{stamp}-{os.getpid()}.ndjson")
+
+    def write(self, events, batch_size):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.get_path(), "a", encoding="utf-8") as f:
+            for short_url_id, clicked_at, referrer, user_agent, ip in events:
+                row = {"short_url_id": short_url_id, "clicked_at": clicked_at, "referrer": referrer, "user_agent": user_agent, "ip": ip}
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class ClickEvents:
+    """
+    Redirect 클릭 이벤트 수집기
+    Redirect 요청에서는 (short_url_id, timestamp, referrer, user_agent, ip) 튜플을 ring buffer에 넣기만 하고,
+    백그라운드 스레드가 BATCH_SIZE 단위로 sink(ClickEvent 테이블 또는 NDJSON 파일)에 기록합니다.
+    FLUSH_INTERVAL이 0이면(스레드 없음) BATCH_SIZE가 쌓인 요청에서 직접 기록합니다.
+    버퍼가 가득 차면 가장 오래된 이벤트부터 버립니다.
+    """
+
+    REFERRER_LENGTH = 512
+    USER_AGENT_LENGTH = 255
+
+    _buffer = None
+    _sink = None
+    _flusher = None
+    _lock = threading.Lock()
+
+    # 버퍼가 가득 차서 버린 이벤트 수 (근사값)
+    dropped = 0
+
+    @classmethod
+    def _get_config(cls):
+        return settings.CLICK_ANALYTICS
+
+    @classmethod
+    def _setup(cls):
+        with cls._lock:
+            if cls._flusher is not None:
+                return
+
+            config = cls._get_config()
+            if config["SINK"] == "ndjson":
+                cls._sink = NDJSONSink(directory=config["NDJSON_DIR"], rotate=config["NDJSON_ROTATE"])
+            else:
+                cls._sink = DatabaseSink()
+            cls._buffer = deque(maxlen=config["BUFFER_SIZE"])
+            cls._flusher = BackgroundFlusher(
+                name="click-events", flush=cls.flush, interval=config["FLUSH_INTERVAL"], flush_at_exit=config["FLUSH_AT_EXIT"]
+            )
+
+    @classmethod
+    def _add(cls, short_url_id, referrer, user_agent, ip):
+        """
+        클릭 이벤트를 버퍼에 추가하고 flush가 필요한지(BATCH_SIZE 이상 쌓임) 반환
+        """
+        config = cls._get_config()
+        if not config["ENABLED"]:
+            return False
+
+        if cls._flusher is None:
+            cls._setup()
+        cls._flusher.start()
+
+        buffer = cls._buffer
+        if len(buffer) == buffer.maxlen:
+            cls.dropped += 1
+
+        # deque.append는 스레드 안전
+        buffer.append((short_url_id, time.time(), (referrer or "")[: cls.REFERRER_LENGTH], (user_agent or "")[: cls.USER_AGENT_LENGTH], ip or None))
+
+        return len(buffer) >= config["BATCH_SIZE"]
+
+    @classmethod
+    def record(cls, short_url_id, referrer="", user_agent="", ip=None):
+        """
+        클릭 이벤트 추가
+        버퍼가 BATCH_SIZE 이상 쌓이면 flush를 요청하고, FLUSH_INTERVAL이 0이면(스레드 없음) 직접 flush 합니다.
+        """
+        if cls._add(short_url_id, referrer, user_agent, ip):
+            if cls._flusher.interval > 0:
+                cls._flusher.wake()
+            else:
+                cls._flusher.flush()
+
+    @classmethod
+    async def arecord(cls, short_url_id, referrer="", user_agent="", ip=None):
+        """
+        record의 비동기 버전 (async view용)
+        버퍼 추가는 이벤트 루프에서 바로 하고, 직접 flush 해야 하면 기다리지 않고 스레드에서 실행합니다.
+        """
+        if cls._add(short_url_id, referrer, user_agent, ip):
+            if cls._flusher.interval > 0:
+                cls._flusher.wake()
+            else:
+                spawn(cls._flusher.flush)
+
+    @classmethod
+    def drain(cls):
+        """
+        버퍼에 쌓인 이벤트를 순서대로 꺼냄
+        """
+        events = []
+        buffer = cls._buffer
+        while True:
+            try:
+                events.append(buffer.popleft())
+            except IndexError:
+                return events
+
+    @classmethod
+    def flush(cls):
+        """
+        버퍼에 쌓인 이벤트를 BATCH_SIZE 단위로 sink에 기록
+        """
+        if cls._buffer is None:
+            return
+
+        events = cls.drain()
+        batch_size = cls._get_config()["BATCH_SIZE"]
+        for start in range(0, len(events), batch_size):
+            try:
+                cls._sink.write(events[start : start + batch_size], batch_size=batch_size)
+            except Exception:
+                # 기록하지 못한 이벤트는 순서를 유지해 버퍼 앞쪽으로 되돌림 (버퍼 크기를 넘는 만큼은 버림)
+                cls._buffer.extendleft(reversed(events[start:]))
+                raise
+
+    @classmethod
+    def reset(cls):
+        """
+        버퍼 초기화 (설정 변경, 테스트 용도)
+        """
+        with cls._lock:
+            cls._buffer = None
+            cls._sink = None
+            cls._flusher = None
+            cls.dropped = 0
@@ -0,0 +1,48 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Click Rollup Command
+"""
+
+# System
+import os
+import glob
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Project
+from apps.analytics.events import NDJSONSink
+from apps.analytics.rollup import ClickRollupJob
+
+
+class Command(BaseCommand):
+    help = "클릭 이벤트(ClickEvent 테이블, NDJSON 파일)를 Short URL별 시간, 일 단위로 집계합니다. (cron 등으로 주기 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="한 번에 집계할 이벤트 수")
+        parser.add_argument("--lag", type=int, default=None, help="최근 N초 이내 클릭은 다음 실행에서 집계")
+        parser.add_argument("--prune", action="store_true", help="집계한 ClickEvent 삭제")
+        parser.add_argument("--ndjson", action="store_true", help="NDJSON_DIR의 교체가 끝난 파일도 집계 (집계 후 .done으로 이름 변경)")
+
+    def get_closed_files(self):
+        """
+        현재 기록 중인 시간대 이전의 NDJSON 파일 목록
+        """
+        config = settings.CLICK_ANALYTICS
+        current = os.path.basename(NDJSONSink(directory=config["NDJSON_DIR"], rotate=config["NDJSON_ROTATE"]).get_path()).split("-")[1]
+        paths = sorted(glob.glob(os.path.join(config["NDJSON_DIR"], "clicks-*.ndjson")))
+        return [path for path in paths if os.path.basename(path).split("-")[1] < current]
+
+    def handle(self, *args, **options):
+        count = ClickRollupJob.rollup_events(batch_size=options["batch_size"], lag=options["lag"], prune=options["prune"])
+        self.stdout.write(f"click_event: {count} events")
+
+        if options["ndjson"]:
+            for path in self.get_closed_files():
+                count = ClickRollupJob.rollup_ndjson(path)
+                # 집계 기록은 커밋되었으므로 이름 변경 전에 중단되어도 다음 실행에서 이름만 변경
+                os.rename(path, f"{path}.done")
+                if count is None:
+                    self.stdout.write(f"{os.path.basename(path)}: already rolled up")
+                else:
+                    self.stdout.write(f"{os.path.basename(path)}: {count} events")
@@ -0,0 +1,88 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ClickEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("short_url_id", models.BigIntegerField(verbose_name="short url id")),
+                ("clicked_at", models.DateTimeField(verbose_name="클릭 시간")),
+                (
+                    "referrer",
+                    models.CharField(blank=True, default="", max_length=512, verbose_name="referrer"),
+                ),
+                (
+                    "user_agent",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=255,
+                        verbose_name="user agent",
+                    ),
+                ),
+                (
+                    "ip",
+                    models.GenericIPAddressField(blank=True, null=True, verbose_name="ip"),
+                ),
+            ],
+            options={
+                "db_table": "click_event",
+            },
+        ),
+        migrations.CreateModel(
+            name="ClickRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("short_url_id", models.BigIntegerField(verbose_name="short url id")),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("hour", "hour"), ("day", "day")],
+                        max_length=4,
+                        verbose_name="집계 단위",
+                    ),
+                ),
+                ("bucket", models.DateTimeField(verbose_name="집계 시작 시간")),
+                (
+                    "country",
+                    models.CharField(blank=True, default="", max_length=2, verbose_name="국가 코드"),
+                ),
+                ("clicks", models.BigIntegerField(default=0, verbose_name="클릭 수")),
+            ],
+            options={
+                "db_table": "click_rollup",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="clickrollup",
+            constraint=models.UniqueConstraint(
+                fields=("short_url_id", "period", "bucket", "country"),
+                name="click_rollup_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:47
+
+from django.db import migrations, models
+
+
+def move_watermark(apps, schema_editor):
+    """
+    code_sequence에 저장하던 ClickEvent 집계 위치("click_rollup" 행)를 click_rollup_state로 옮기기
+    """
+    CodeSequence = apps.get_model("core", "CodeSequence")
+    ClickRollupState = apps.get_model("analytics", "ClickRollupState")
+
+    sequence = CodeSequence.objects.filter(name="click_rollup").first()
+    if sequence is not None:
+        ClickRollupState.objects.create(name="click_event", next_event_id=sequence.next_value)
+        sequence.delete()
+
+
+def restore_watermark(apps, schema_editor):
+    CodeSequence = apps.get_model("core", "CodeSequence")
+    ClickRollupState = apps.get_model("analytics", "ClickRollupState")
+
+    state = ClickRollupState.objects.filter(name="click_event").first()
+    if state is not None:
+        CodeSequence.objects.update_or_create(name="click_rollup", defaults={"next_value": state.next_event_id})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClickRollupFile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=255, unique=True, verbose_name="파일 이름"),
+                ),
+                (
+                    "events",
+                    models.BigIntegerField(default=0, verbose_name="집계한 이벤트 수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="집계 일시"),
+                ),
+            ],
+            options={
+                "db_table": "click_rollup_file",
+            },
+        ),
+        migrations.CreateModel(
+            name="ClickRollupState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=50, unique=True, verbose_name="이름"),
+                ),
+                (
+                    "next_event_id",
+                    models.BigIntegerField(default=0, verbose_name="다음에 집계할 ClickEvent id"),
+                ),
+            ],
+            options={
+                "db_table": "click_rollup_state",
+            },
+        ),
+        migrations.RunPython(move_watermark, restore_watermark),
+    ]
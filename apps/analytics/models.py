@@ -0,0 +1,74 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Analytics Model
+"""
+
+# System
+from django.db import models
+
+
+class ClickEvent(models.Model):
+    """
+    Redirect 클릭 이벤트 (append-only)
+    기록 비용을 줄이기 위해 Short URL은 FK 없이 id만 저장하고, 인덱스는 PK만 사용합니다.
+    조회는 rollup_clicks로 집계한 ClickRollup에서 합니다.
+    """
+
+    short_url_id = models.BigIntegerField(verbose_name="short url id")
+    clicked_at = models.DateTimeField(verbose_name="클릭 시간")
+    referrer = models.CharField(max_length=512, blank=True, default="", verbose_name="referrer")
+    user_agent = models.CharField(max_length=255, blank=True, default="", verbose_name="user agent")
+    ip = models.GenericIPAddressField(null=True, blank=True, verbose_name="ip")
+
+    class Meta:
+        db_table = "click_event"
+
+
+class ClickRollup(models.Model):
+    """
+    Short URL별 시간, 일 단위 클릭 수 집계
+    """
+
+    PERIOD_HOUR = "hour"
+    PERIOD_DAY = "day"
+    PERIOD_CHOICES = [(PERIOD_HOUR, "hour"), (PERIOD_DAY, "day")]
+
+    short_url_id = models.BigIntegerField(verbose_name="short url id")
+    period = models.CharField(max_length=4, choices=PERIOD_CHOICES, verbose_name="집계 단위")
+    bucket = models.DateTimeField(verbose_name="집계 시작 시간")
+    country = models.CharField(max_length=2, blank=True, default="", verbose_name="국가 코드")
+    clicks = models.BigIntegerField(default=0, verbose_name="클릭 수")
+
+    class Meta:
+        db_table = "click_rollup"
+        constraints = [
+            # 통계 조회(short_url_id, period, bucket 범위)도 이 unique index를 사용
+            models.UniqueConstraint(fields=["short_url_id", "period", "bucket", "country"], name="click_rollup_unique"),
+        ]
+
+
+class ClickRollupState(models.Model):
+    """
+    rollup_clicks 진행 상태 (name마다 한 행)
+    ClickEvent는 next_event_id부터 집계하고, 집계 중에는 이 행을 잠가(select_for_update) 동시에 실행되지 않도록 합니다.
+    """
+
+    name = models.CharField(max_length=50, unique=True, verbose_name="이름")
+    next_event_id = models.BigIntegerField(default=0, verbose_name="다음에 집계할 ClickEvent id")
+
+    class Meta:
+        db_table = "click_rollup_state"
+
+
+class ClickRollupFile(models.Model):
+    """
+    집계를 마친 NDJSON 파일 (집계와 같은 트랜잭션에서 기록하여 같은 파일을 다시 집계하지 않음)
+    """
+
+    name = models.CharField(max_length=255, unique=True, verbose_name="파일 이름")
+    events = models.BigIntegerField(default=0, verbose_name="집계한 이벤트 수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="집계 일시")
+
+    class Meta:
+        db_table = "click_rollup_file"
@@ -0,0 +1,174 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Click Rollup
+"""
+
+# System
+import os
+import json
+from collections import Counter
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Project
+from apps.analytics.models import ClickEvent, ClickRollup, ClickRollupFile, ClickRollupState
+
+
+class ClickRollupJob:
+    """
+    클릭 이벤트를 Short URL별 시간, 일 단위 ClickRollup으로 집계
+    ClickEvent는 마지막으로 집계한 id(ClickRollupState)부터 순서대로 집계하고, NDJSON 파일은 집계한 파일 이름(ClickRollupFile)을
+    같은 트랜잭션에서 기록하므로 여러 번 실행하거나 중간에 중단되어도 중복 집계하지 않습니다.
+    국가 코드는 이 단계에서 COUNTRY_RESOLVER로 IP를 변환해 채웁니다.
+    """
+
+    STATE_NAME = "click_event"
+    CHUNK_SIZE = 500
+
+    BUCKETS = {
+        ClickRollup.PERIOD_HOUR: lambda clicked_at: clicked_at.replace(minute=0, second=0, microsecond=0),
+        ClickRollup.PERIOD_DAY: lambda clicked_at: clicked_at.replace(hour=0, minute=0, second=0, microsecond=0),
+    }
+
+    @classmethod
+    def _get_config(cls):
+        return settings.CLICK_ANALYTICS
+
+    @classmethod
+    def get_country_resolver(cls):
+        """
+        IP -> 국가 코드 변환 함수 (설정이 없으면 None)
+        """
+        path = cls._get_config()["COUNTRY_RESOLVER"]
+        return import_string(path) if path else None
+
+    @classmethod
+    def _lock_state(cls):
+        """
+        진행 상태 행을 잠그고 반환 (트랜잭션 안에서 호출, ClickRollup을 수정하는 작업끼리 동시에 실행되지 않음)
+        """
+        state, _ = ClickRollupState.objects.select_for_update().get_or_create(name=cls.STATE_NAME)
+        return state
+
+    @classmethod
+    def aggregate(cls, events, resolver=None):
+        """
+        (short_url_id, clicked_at, ip) 목록을 (short_url_id, period, bucket, country)별 클릭 수로 집계
+        """
+        counts = Counter()
+        for short_url_id, clicked_at, ip in events:
+            country = ((resolver(ip) if resolver and ip else None) or "")[:2].upper()
+            for period, bucket in cls.BUCKETS.items():
+                counts[(short_url_id, period, bucket(clicked_at), country)] += 1
+        return counts
+
+    @classmethod
+    def apply(cls, counts):
+        """
+        집계 결과를 ClickRollup에 더함 (기존 행은 bulk_update, 새 행은 bulk_create)
+        동시에 실행되지 않도록 호출하는 쪽에서 진행 상태 행을 잠근 상태여야 합니다. (_lock_state)
+        """
+        if not counts:
+            return
+
+        short_url_ids = sorted({key[0] for key in counts})
+        first_bucket = min(key[2] for key in counts)
+        last_bucket = max(key[2] for key in counts)
+
+        # 집계 대상 Short URL, 시간 범위의 기존 행 조회 (IN 조회는 CHUNK_SIZE 단위)
+        existing = {}
+        for start in range(0, len(short_url_ids), cls.CHUNK_SIZE):
+            rollups = ClickRollup.objects.filter(
+                short_url_id__in=short_url_ids[start : start + cls.CHUNK_SIZE], bucket__range=(first_bucket, last_bucket)
+            )
+            for rollup in rollups.iterator():
+                existing[(rollup.short_url_id, rollup.period, rollup.bucket, rollup.country)] = rollup
+
+        updated, created = [], []
+        for key, clicks in counts.items():
+            rollup = existing.get(key)
+            if rollup:
+                rollup.clicks += clicks
+                updated.append(rollup)
+            else:
+                short_url_id, period, bucket, country = key
+                created.append(ClickRollup(short_url_id=short_url_id, period=period, bucket=bucket, country=country, clicks=clicks))
+
+        ClickRollup.objects.bulk_update(updated, ["clicks"], batch_size=cls.CHUNK_SIZE)
+        ClickRollup.objects.bulk_create(created, batch_size=cls.CHUNK_SIZE)
+
+    @classmethod
+    def rollup_events(cls, batch_size=None, lag=None, prune=False):
+        """
+        아직 집계하지 않은 ClickEvent를 batch_size 단위로 집계하고 집계한 이벤트 수 반환
+        다른 워커가 아직 커밋하지 않은 앞 번호 이벤트를 건너뛰지 않도록, 최근 lag초 이내 클릭을 만나면 그 앞까지만 집계합니다.
+        prune이면 집계한 이벤트는 삭제합니다.
+        """
+        config = cls._get_config()
+        batch_size = batch_size or config["ROLLUP_BATCH_SIZE"]
+        cutoff = datetime.now() - timedelta(seconds=config["ROLLUP_LAG"] if lag is None else lag)
+        resolver = cls.get_country_resolver()
+
+        total = 0
+        while True:
+            with transaction.atomic():
+                state = cls._lock_state()
+
+                events = list(
+                    ClickEvent.objects.filter(id__gte=state.next_event_id)
+                    .order_by("id")
+                    .values_list("id", "short_url_id", "clicked_at", "ip")[:batch_size]
+                )
+                for index, event in enumerate(events):
+                    if event[2] > cutoff:
+                        events = events[:index]
+                        break
+                if not events:
+                    return total
+
+                cls.apply(cls.aggregate([(short_url_id, clicked_at, ip) for _, short_url_id, clicked_at, ip in events], resolver=resolver))
+
+                last_id = events[-1][0]
+                state.next_event_id = last_id + 1
+                state.save(update_fields=["next_event_id"])
+
+                if prune:
+                    ClickEvent.objects.filter(id__lte=last_id).delete()
+
+            total += len(events)
+            if len(events) < batch_size:
+                return total
+
+    @classmethod
+    def rollup_ndjson(cls, path):
+        """
+        NDJSON sink 파일 하나를 집계하고 집계한 이벤트 수 반환 (이미 집계한 파일이면 None)
+        집계 결과와 파일 이름(ClickRollupFile)을 한 트랜잭션으로 저장하므로, 집계 후 파일 이름 변경(.done) 전에 중단되어도
+        다음 실행은 파일을 다시 집계하지 않고 이름만 변경합니다.
+        """
+        name = os.path.basename(path)
+        if ClickRollupFile.objects.filter(name=name).exists():
+            return None
+
+        resolver = cls.get_country_resolver()
+
+        events = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                events.append((row["short_url_id"], datetime.fromtimestamp(row["clicked_at"]), row.get("ip")))
+
+        with transaction.atomic():
+            # rollup_events와 동시에 ClickRollup을 수정하지 않도록 같은 행을 잠그고, 잠근 뒤 다시 확인
+            cls._lock_state()
+            if ClickRollupFile.objects.filter(name=name).exists():
+                return None
+            cls.apply(cls.aggregate(events, resolver=resolver))
+            ClickRollupFile.objects.create(name=name, events=len(events))
+
+        return len(events)
@@ -0,0 +1,84 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Analytics Serializers
+"""
+
+# System
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db.models import Sum
+from rest_framework import serializers
+
+# Project
+from core.constants import SYSTEM_CODE
+from core.exception import raise_exception
+from core.algorithm import Algorithm
+from apps.short_url.models import ShortURL
+from apps.analytics.models import ClickRollup
+
+
+class ClickStatsSerializer(serializers.Serializer):
+    # 기본 조회 범위
+    DEFAULT_RANGES = {
+        ClickRollup.PERIOD_HOUR: timedelta(hours=48),
+        ClickRollup.PERIOD_DAY: timedelta(days=30),
+    }
+
+    request_url = serializers.CharField(max_length=settings.SHORT_URL_ALIAS["MAX_LENGTH"], required=True, write_only=True, label="Short URL")
+    period = serializers.ChoiceField(choices=ClickRollup.PERIOD_CHOICES, default=ClickRollup.PERIOD_DAY, label="[Input]집계 단위 (hour, day)")
+    start = serializers.DateTimeField(required=False, label="[Input]조회 시작 (기본 hour: 48시간 전, day: 30일 전)")
+    end = serializers.DateTimeField(required=False, label="[Input]조회 끝 (기본 현재)")
+
+    encoded = serializers.CharField(read_only=True, label="[Output]Short URL")
+    total_clicks = serializers.IntegerField(read_only=True, label="[Output]전체 클릭 수")
+    series = serializers.ListField(read_only=True, label="[Output]집계 단위별 클릭 수 [{bucket, clicks}]")
+    countries = serializers.ListField(read_only=True, label="[Output]조회 범위의 국가별 클릭 수 [{country, clicks}]")
+
+    def validate_request_url(self, data):
+        decoded = Algorithm.resolve_code(data)
+        if decoded is None:
+            raise_exception(code=SYSTEM_CODE.SHORT_URL_NOT_FOUND)
+
+        # 본인의 Short URL만 조회
+        short_url = ShortURL.objects.with_request_count().filter(live_hash_value=decoded, user=self.context["request"].user).first()
+        if not short_url:
+            raise_exception(code=SYSTEM_CODE.SHORT_URL_NOT_FOUND)
+        return short_url
+
+    def validate(self, data):
+        data.setdefault("end", datetime.now())
+        data.setdefault("start", data["end"] - self.DEFAULT_RANGES[data["period"]])
+        if data["start"] > data["end"]:
+            raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+        return data
+
+    def create(self, validated_data):
+        """
+        ClickRollup(rollup_clicks 집계 결과)에서 통계 조회
+        아직 집계되지 않은 최근 클릭은 포함되지 않습니다.
+        """
+        short_url = validated_data["request_url"]
+        rollups = ClickRollup.objects.filter(
+            short_url_id=short_url.id,
+            period=validated_data["period"],
+            bucket__range=(validated_data["start"], validated_data["end"]),
+        )
+
+        series = [
+            {"bucket": row["bucket"], "clicks": row["clicks"]} for row in rollups.values("bucket").annotate(clicks=Sum("clicks")).order_by("bucket")
+        ]
+        countries = [
+            {"country": row["country"], "clicks": row["clicks"]}
+            for row in rollups.values("country").annotate(clicks=Sum("clicks")).order_by("-clicks", "country")
+        ]
+
+        return {
+            "encoded": short_url.alias or Algorithm.base62_encode(short_url.hash_value),
+            "total_clicks": short_url.total_request_count,
+            "period": validated_data["period"],
+            "start": validated_data["start"],
+            "end": validated_data["end"],
+            "series": series,
+            "countries": countries,
+        }
@@ -0,0 +1,130 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Click Event Buffer Test
+"""
+
+# System
+import json
+import asyncio
+import tempfile
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+# Project
+from core import flusher
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+from apps.analytics.events import ClickEvents
+from apps.analytics.models import ClickEvent
+
+
+class ClickEventsTest(TestCase):
+    """
+    클릭 이벤트 ring buffer, sink 테스트
+    """
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.short_url = ShortURL.objects.create(url=cls.origin_url, hash_value=Algorithm.hash_url(cls.origin_url), user=user)
+        cls.encoded = Algorithm.base62_encode(cls.short_url.hash_value)
+
+    def setUp(self):
+        ClickEvents.reset()
+        ShortURLCache.clear()
+        cache.clear()
+        self.addCleanup(ClickEvents.reset)
+
+    # 버퍼에 누적 후 flush 시 ClickEvent로 기록
+    def test_record_flush(self):
+        ClickEvents.record(self.short_url.id, referrer="https://example.com", user_agent="test-agent", ip="127.0.0.1")
+        self.assertFalse(ClickEvent.objects.exists())
+
+        ClickEvents.flush()
+
+        event = ClickEvent.objects.get()
+        self.assertEqual(event.short_url_id, self.short_url.id)
+        self.assertEqual(event.referrer, "https://example.com")
+        self.assertEqual(event.user_agent, "test-agent")
+        self.assertEqual(event.ip, "127.0.0.1")
+
+    # 버퍼가 가득 차면 가장 오래된 이벤트부터 버림
+    @override_settings(CLICK_ANALYTICS={**settings.CLICK_ANALYTICS, "BUFFER_SIZE": 2})
+    def test_record_ring_buffer(self):
+        for referrer in ("a", "b", "c"):
+            ClickEvents.record(self.short_url.id, referrer=referrer)
+        ClickEvents.flush()
+
+        self.assertEqual(list(ClickEvent.objects.order_by("id").values_list("referrer", flat=True)), ["b", "c"])
+        self.assertEqual(ClickEvents.dropped, 1)
+
+    # FLUSH_INTERVAL이 0이면(스레드 없음) BATCH_SIZE가 쌓인 요청에서 직접 기록
+    @override_settings(CLICK_ANALYTICS={**settings.CLICK_ANALYTICS, "BATCH_SIZE": 2, "FLUSH_INTERVAL": 0})
+    def test_record_inline_flush(self):
+        ClickEvents.record(self.short_url.id, referrer="a")
+        self.assertFalse(ClickEvent.objects.exists())
+
+        ClickEvents.record(self.short_url.id, referrer="b")
+        self.assertEqual(list(ClickEvent.objects.order_by("id").values_list("referrer", flat=True)), ["a", "b"])
+        self.assertEqual(len(ClickEvents._buffer), 0)
+
+    # async view용 기록은 직접 flush를 기다리지 않고 스레드에서 실행
+    async def test_arecord_inline_flush(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        config = {**settings.CLICK_ANALYTICS, "SINK": "ndjson", "NDJSON_DIR": directory.name, "BATCH_SIZE": 2, "FLUSH_INTERVAL": 0}
+        with override_settings(CLICK_ANALYTICS=config):
+            await ClickEvents.arecord(self.short_url.id)
+            await ClickEvents.arecord(self.short_url.id)
+            await asyncio.gather(*flusher._tasks)
+            path = ClickEvents._sink.get_path()
+
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    # 비활성화 시 기록하지 않음
+    @override_settings(CLICK_ANALYTICS={**settings.CLICK_ANALYTICS, "ENABLED": False})
+    def test_record_disabled(self):
+        ClickEvents.record(self.short_url.id)
+        ClickEvents.flush()
+
+        self.assertFalse(ClickEvent.objects.exists())
+
+    # NDJSON sink는 시간 단위 파일에 이어서 기록
+    def test_record_ndjson(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        with override_settings(CLICK_ANALYTICS={**settings.CLICK_ANALYTICS, "SINK": "ndjson", "NDJSON_DIR": directory.name}):
+            ClickEvents.record(self.short_url.id, user_agent="test-agent")
+            ClickEvents.flush()
+            path = ClickEvents._sink.get_path()
+
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["short_url_id"], self.short_url.id)
+        self.assertEqual(rows[0]["user_agent"], "test-agent")
+        self.assertFalse(ClickEvent.objects.exists())
+
+    # Redirect 요청의 referrer, user agent 기록
+    def test_redirect_record(self):
+        url = reverse("get-redirect", kwargs={"url": self.encoded})
+        response = self.client.get(path=url, HTTP_REFERER="https://example.com", HTTP_USER_AGENT="test-agent")
+        self.assertEqual(response.status_code, 302)
+
+        ClickEvents.flush()
+
+        event = ClickEvent.objects.get()
+        self.assertEqual(event.short_url_id, self.short_url.id)
+        self.assertEqual(event.referrer, "https://example.com")
+        self.assertEqual(event.user_agent, "test-agent")
@@ -0,0 +1,115 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Click Rollup Test
+"""
+
+# System
+import os
+import json
+import tempfile
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+# Project
+from apps.analytics.models import ClickEvent, ClickRollup
+from apps.analytics.rollup import ClickRollupJob
+
+
+def resolve_country(ip):
+    """
+    테스트용 IP -> 국가 코드 변환
+    """
+    return "kr" if ip.startswith("1.") else None
+
+
+class ClickRollupTest(TestCase):
+    """
+    클릭 이벤트 시간, 일 단위 집계 테스트
+    """
+
+    clicked_at = datetime(2024, 5, 1, 10, 30)
+
+    def create_events(self, *offsets, short_url_id=1, ip=None):
+        ClickEvent.objects.bulk_create([ClickEvent(short_url_id=short_url_id, clicked_at=self.clicked_at + offset, ip=ip) for offset in offsets])
+
+    def get_clicks(self, period):
+        return dict(ClickRollup.objects.filter(period=period).values_list("bucket", "clicks"))
+
+    # 시간, 일 단위로 집계
+    def test_rollup_events(self):
+        self.create_events(timedelta(0), timedelta(minutes=10), timedelta(hours=1))
+
+        count = ClickRollupJob.rollup_events()
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            self.get_clicks(ClickRollup.PERIOD_HOUR),
+            {datetime(2024, 5, 1, 10): 2, datetime(2024, 5, 1, 11): 1},
+        )
+        self.assertEqual(self.get_clicks(ClickRollup.PERIOD_DAY), {datetime(2024, 5, 1): 3})
+
+    # 다시 실행하면 이후에 추가된 이벤트만 더함
+    def test_rollup_events_incremental(self):
+        self.create_events(timedelta(0))
+        ClickRollupJob.rollup_events()
+
+        self.create_events(timedelta(minutes=5))
+        self.assertEqual(ClickRollupJob.rollup_events(batch_size=1), 1)
+        self.assertEqual(ClickRollupJob.rollup_events(), 0)
+
+        self.assertEqual(self.get_clicks(ClickRollup.PERIOD_DAY), {datetime(2024, 5, 1): 2})
+
+    # 최근 lag초 이내 클릭은 다음 실행으로 미룸
+    def test_rollup_events_lag(self):
+        self.create_events(timedelta(0))
+        ClickEvent.objects.create(short_url_id=1, clicked_at=datetime.now())
+
+        self.assertEqual(ClickRollupJob.rollup_events(lag=60), 1)
+        self.assertEqual(ClickRollupJob.rollup_events(lag=0), 1)
+
+    # 집계한 이벤트 삭제
+    def test_rollup_events_prune(self):
+        self.create_events(timedelta(0), timedelta(minutes=1))
+
+        ClickRollupJob.rollup_events(prune=True)
+
+        self.assertFalse(ClickEvent.objects.exists())
+        self.assertEqual(self.get_clicks(ClickRollup.PERIOD_DAY), {datetime(2024, 5, 1): 2})
+
+    # 집계 시 IP로 국가 코드를 채움
+    @override_settings(
+        CLICK_ANALYTICS={
+            **settings.CLICK_ANALYTICS,
+            "COUNTRY_RESOLVER": "apps.analytics.tests.rollup.test_click_rollup.resolve_country",
+        }
+    )
+    def test_rollup_events_country(self):
+        self.create_events(timedelta(0), ip="1.1.1.1")
+        self.create_events(timedelta(0), ip="8.8.8.8")
+
+        ClickRollupJob.rollup_events()
+
+        countries = dict(ClickRollup.objects.filter(period=ClickRollup.PERIOD_DAY).values_list("country", "clicks"))
+        self.assertEqual(countries, {"KR": 1, "": 1})
+
+    # NDJSON sink 파일 집계
+    def test_rollup_ndjson(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        path = os.path.join(directory.name, "clicks-2024050110-1.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(2):
+                f.write(json.dumps({"short_url_id": 1, "clicked_at": self.clicked_at.timestamp(), "ip": None}) + "\n")
+
+        self.create_events(timedelta(0))
+        ClickRollupJob.rollup_events()
+
+        self.assertEqual(ClickRollupJob.rollup_ndjson(path), 2)
+        self.assertEqual(self.get_clicks(ClickRollup.PERIOD_DAY), {datetime(2024, 5, 1): 3})
+
+        # 이름 변경(.done) 전에 중단되어 같은 파일을 다시 집계해도 중복 집계하지 않음
+        self.assertIsNone(ClickRollupJob.rollup_ndjson(path))
+        self.assertEqual(self.get_clicks(ClickRollup.PERIOD_DAY), {datetime(2024, 5, 1): 3})
@@ -0,0 +1,85 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Click Stats Test
+"""
+
+# System
+from datetime import datetime
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core.jwt import CustomJWTAuthentication
+from core.constants import SYSTEM_CODE
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.models import ShortURL
+from apps.analytics.models import ClickRollup
+
+
+class GetShortURLStatsTest(APITestCase):
+    """
+    Short URL 클릭 통계 조회 테스트
+    """
+
+    reverse_url = "api-analytics:get-short-url-stats"
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.other_user = User.objects.create_user(email="other@test.com", password="password1234")
+        cls.short_url = ShortURL.objects.create(
+            url=cls.origin_url,
+            hash_value=Algorithm.hash_url(cls.origin_url),
+            request_count=3,
+            user=cls.user,
+        )
+        cls.encoded = Algorithm.base62_encode(cls.short_url.hash_value)
+
+        ClickRollup.objects.bulk_create(
+            [
+                ClickRollup(short_url_id=cls.short_url.id, period="day", bucket=datetime(2024, 5, 1), country="KR", clicks=2),
+                ClickRollup(short_url_id=cls.short_url.id, period="day", bucket=datetime(2024, 5, 1), country="", clicks=1),
+                ClickRollup(short_url_id=cls.short_url.id, period="day", bucket=datetime(2024, 5, 3), country="KR", clicks=4),
+                ClickRollup(short_url_id=cls.short_url.id, period="hour", bucket=datetime(2024, 5, 1, 10), country="KR", clicks=2),
+            ]
+        )
+
+    def get(self, user, url=None, **params):
+        path = reverse(self.reverse_url, kwargs={"url": url or self.encoded})
+        token = CustomJWTAuthentication.create_access_token(user=user)
+        return self.client.get(path=path, data=params, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    # 일 단위 클릭 통계 조회 성공
+    def test_get_stats_success(self):
+        response = self.get(self.user, start="2024-05-01T00:00:00", end="2024-05-31T00:00:00")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.data["data"]
+        self.assertEqual(data["total_clicks"], 3)
+        self.assertEqual([row["clicks"] for row in data["series"]], [3, 4])
+        self.assertEqual(data["countries"], [{"country": "KR", "clicks": 6}, {"country": "", "clicks": 1}])
+
+    # 시간 단위 조회
+    def test_get_stats_hour(self):
+        response = self.get(self.user, period="hour", start="2024-05-01T00:00:00", end="2024-05-02T00:00:00")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["clicks"] for row in response.data["data"]["series"]], [2])
+
+    # 다른 유저의 Short URL은 조회 불가
+    def test_get_stats_other_user(self):
+        response = self.get(self.other_user)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["code"], SYSTEM_CODE.SHORT_URL_NOT_FOUND[0])
+
+    # 올바르지 않은 집계 단위
+    def test_get_stats_invalid_period(self):
+        response = self.get(self.user, period="week")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["code"], SYSTEM_CODE.INVALID_FORMAT[0])
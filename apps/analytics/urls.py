@@ -0,0 +1,19 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Analytics Url
+"""
+
+# System
+from django.urls import path
+
+# Project
+from apps.analytics.views import AnalyticsViewSet
+
+urlpatterns = [
+    path(
+        "/shorturl/<str:url>/stats",
+        AnalyticsViewSet.as_view({"get": "get_short_url_stats"}),
+        name="get-short-url-stats",
+    ),
+]
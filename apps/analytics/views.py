@@ -0,0 +1,61 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Analytics View
+"""
+
+# System
+from rest_framework.viewsets import ViewSet
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+# Project
+from core.constants import SYSTEM_CODE
+from core.db_router import ReplicaRouter
+from core.exception import raise_exception
+from core.response import create_response
+from core.swagger import common_response_schema
+from apps.analytics.serializers import ClickStatsSerializer
+
+
+@extend_schema(
+    tags=["[Analytics]"],
+)
+class AnalyticsViewSet(ViewSet):
+    """
+    클릭 통계에 관련된 ViewSet
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Short URL 클릭 통계",
+        description="rollup_clicks로 집계된 시간, 일 단위 클릭 수와 국가별 클릭 수를 반환합니다.",
+        parameters=[
+            OpenApiParameter(name="url", description="Short URL", type=str, location="path"),
+            OpenApiParameter(name="period", description="집계 단위 (hour, day)", type=str, location="query"),
+            OpenApiParameter(name="start", description="조회 시작", type=str, location="query"),
+            OpenApiParameter(name="end", description="조회 끝", type=str, location="query"),
+        ],
+    )
+    @common_response_schema(
+        status_code=200,
+        description="Short URL 클릭 통계 조회 성공",
+        serializer=ClickStatsSerializer,
+    )
+    def get_short_url_stats(self, request, url):
+        """
+        Short URL 클릭 통계 API
+        """
+
+        serializer = ClickStatsSerializer(data={"request_url": url, **request.query_params.dict()}, context={"request": request})
+
+        # 통계는 replica에서 조회 (rollup 결과는 주기적으로 집계되므로 복제 지연 허용)
+        with ReplicaRouter.read_replica(user=request.user):
+            # Validation Check
+            if not serializer.is_valid():
+                raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+
+            serializer.save()
+
+        return create_response(data=serializer.data)
@@ -8,6 +8,7 @@
 from django.contrib import admin
 
 # Project
-from apps.short_url.models import ShortURL
+from apps.short_url.models import ShortURL, ShortURLArchive
 
 admin.site.register(ShortURL)
+admin.site.register(ShortURLArchive)
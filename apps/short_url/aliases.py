@@ -0,0 +1,120 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Alias
+"""
+
+# System
+import threading
+from django.conf import settings
+from django.urls import get_resolver
+
+# Project
+from core.trie import Trie
+from core.algorithm import ALIAS_PATTERN, Algorithm
+from core.constants import SYSTEM_CODE
+from apps.short_url.cache import ShortURLCache
+
+
+class ShortURLAlias:
+    """
+    사용자 지정 코드(alias) 검사
+
+    alias는 Algorithm.resolve_code로 hash value로 변환하여 생성 코드와 같은 컬럼(live_hash_value unique index)에 저장하므로
+    Redirect, 캐시, Bloom filter, 삭제, 통계는 생성 코드와 같은 경로로 처리됩니다.
+    예약어는 프로세스 내부 Trie 하나로 검사합니다.
+    - RESERVED_WORDS, URL 경로의 첫 부분(admin, api 등): alias 전체가 일치하면 사용 불가
+    - BLOCKED_WORDS (비속어 등): alias 어디에 포함되어도 사용 불가
+    """
+
+    KIND_RESERVED = "reserved"
+    KIND_BLOCKED = "blocked"
+
+    _trie = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_config(cls):
+        return settings.SHORT_URL_ALIAS
+
+    @staticmethod
+    def get_route_words():
+        """
+        Redirect(/<코드>), 삭제(/api/shorturl/<코드>) 경로와 겹치는 URL 경로 단어
+        (config/urls.py 각 경로의 첫 부분, apps/short_url/urls.py의 경로)
+        """
+        # 순환 참조 방지
+        from apps.short_url.urls import short_url_urls
+
+        words = set()
+        for pattern in (*get_resolver().url_patterns, *short_url_urls):
+            word = str(pattern.pattern).lstrip("^/").split("/")[0]
+            if word and ALIAS_PATTERN.match(word):
+                words.add(word)
+        return words
+
+    @classmethod
+    def get_trie(cls):
+        """
+        예약어 Trie (최초 사용 시 생성)
+        """
+        if cls._trie is None:
+            with cls._lock:
+                if cls._trie is None:
+                    config = cls._get_config()
+                    trie = Trie()
+                    for word in (*config["RESERVED_WORDS"], *cls.get_route_words()):
+                        trie.add(word, kind=cls.KIND_RESERVED, exact=True)
+                    for word in config["BLOCKED_WORDS"]:
+                        trie.add(word, kind=cls.KIND_BLOCKED, exact=False)
+                    cls._trie = trie
+        return cls._trie
+
+    @classmethod
+    def validate(cls, alias):
+        """
+        alias 형식, 예약어 검사
+        사용할 수 없으면 SYSTEM_CODE, 사용할 수 있으면 None 반환
+        앞자리 0은 Base62 디코딩 값이 0을 뺀 alias와 같으므로("0sale" == "sale", WIDTH로 0을 채운 생성 코드와도 같은 값) 사용할 수 없습니다.
+        MIN_LENGTH보다 짧은 alias("1" == 1)는 생성기가 발급하는 작은 hash value를 차지하므로 사용할 수 없습니다.
+        """
+        config = cls._get_config()
+        if not isinstance(alias, str) or not config["MIN_LENGTH"] <= len(alias) <= config["MAX_LENGTH"] or not ALIAS_PATTERN.match(alias):
+            return SYSTEM_CODE.ALIAS_INVALID
+        if alias.startswith("0"):
+            return SYSTEM_CODE.ALIAS_INVALID
+
+        if cls.get_trie().match(alias):
+            return SYSTEM_CODE.ALIAS_RESERVED
+        return None
+
+    @classmethod
+    def is_taken(cls, hash_value):
+        """
+        hash value를 이미 사용 중인지 확인 (삭제되지 않은 행, 만료된 행 포함)
+        Redirect 캐시로 확인하므로 Bloom filter에 없는 값은 DB 조회 없이, 나머지는 LRU -> 공유 캐시 -> DB 순으로 확인합니다.
+        """
+        return ShortURLCache.resolve(hash_value) is not None
+
+    @classmethod
+    def check_availability(cls, aliases):
+        """
+        alias 목록의 사용 가능 여부를 입력 순서대로 반환 [{alias, available, code, msg}]
+        캐시 기준이므로 다른 워커에서 방금 생성한 alias는 LRU_TTL 동안 사용 가능으로 보일 수 있고,
+        실제 생성은 unique index로 다시 검사합니다.
+        """
+        results = []
+        for alias in aliases:
+            code = cls.validate(alias)
+            if code is None and cls.is_taken(Algorithm.resolve_code(alias)):
+                code = SYSTEM_CODE.ALIAS_ALREADY
+            code = code or SYSTEM_CODE.SUCCESS
+            results.append({"alias": alias, "available": code == SYSTEM_CODE.SUCCESS, "code": code[0], "msg": code[1]})
+        return results
+
+    @classmethod
+    def reset(cls):
+        """
+        예약어 Trie 초기화 (설정 변경, 테스트 용도)
+        """
+        cls._trie = None
@@ -10,3 +10,7 @@ from django.apps import AppConfig
 class ShortUrlConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.short_url"
+
+    def ready(self):
+        # Signal 등록
+        import apps.short_url.signals  # noqa
@@ -0,0 +1,81 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Benchmark Dataset
+"""
+
+# System
+from datetime import datetime, timedelta
+
+# Project
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.models import ShortURL
+
+BENCHMARK_EMAIL = "benchmark@example.com"
+BENCHMARK_PASSWORD = "benchmark1234"
+BENCHMARK_URL = "https://benchmark.example.com/{}"
+
+
+def get_benchmark_user():
+    """
+    벤치마크 데이터 소유 유저
+    """
+    user = User.objects.filter(email=BENCHMARK_EMAIL).first()
+    if not user:
+        user = User.objects.create_user(email=BENCHMARK_EMAIL, password=BENCHMARK_PASSWORD)
+    return user
+
+
+def benchmark_url(index):
+    return BENCHMARK_URL.format(index)
+
+
+def seed_short_urls(user, rows, batch_size=5000, stdout=None):
+    """
+    벤치마크 유저의 Short URL이 rows개가 되도록 채워 넣음
+    10건 중 1건은 삭제, 1건은 만료된 URL로 생성합니다.
+    """
+    start = ShortURL.objects.filter(user=user).count()
+    now = datetime.now()
+
+    for offset in range(start, rows, batch_size):
+        objs = []
+        for index in range(offset, min(offset + batch_size, rows)):
+            url = benchmark_url(index)
+            objs.append(
+                ShortURL(
+                    url=url,
+                    hash_value=Algorithm.hash_url(url),
+                    deleted_at=now if index % 10 == 1 else None,
+                    expiration_date=now - timedelta(days=1) if index % 10 == 2 else None,
+                    user=user,
+                )
+            )
+        # hash 충돌(유효 hash unique) 행은 건너뜀
+        ShortURL.objects.bulk_create(objs, batch_size=batch_size, ignore_conflicts=True)
+
+        if stdout:
+            stdout.write(f"seeded {offset + len(objs)}/{rows}")
+
+    return max(rows - start, 0)
+
+
+def get_benchmark_codes(user, count, offset=0):
+    """
+    Redirect 가능한 (삭제, 만료되지 않은) 벤치마크 Short URL 코드 목록
+    """
+    hash_values = (
+        ShortURL.objects.filter(user=user, deleted_at=None, expiration_date=None)
+        .order_by("id")
+        .values_list("hash_value", flat=True)[offset : offset + count]
+    )
+    return Algorithm.base62_encode_many(hash_values)
+
+
+def delete_benchmark_data():
+    """
+    벤치마크 유저와 데이터 삭제
+    """
+    ShortURL.objects.filter(user__email=BENCHMARK_EMAIL).delete()
+    User.objects.filter(email=BENCHMARK_EMAIL).delete()
@@ -0,0 +1,227 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Bloom Filter
+"""
+
+# System
+import os
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Max
+
+# Project
+from core.bloom import BloomFilter
+from core.flusher import BackgroundFlusher
+from apps.short_url.models import ShortURL
+
+logger = logging.getLogger("django")
+
+
+class ShortURLBloom:
+    """
+    유효한 hash value의 Bloom filter (Redirect 조회에서 존재할 수 없는 코드를 DB 조회 없이 걸러냄)
+
+    워커마다 snapshot(SNAPSHOT_PATH, build_short_url_bloom)을 mmap으로 열거나 DB 전체를 읽어 만들고,
+    이후에는 마지막으로 읽은 id 이후의 행만 추가합니다.
+    - 생성 시 공유 캐시의 version을 올리고(notify), 필터에 없는 코드를 조회한 워커는 version이 바뀌었으면 새 행을 읽은 뒤 다시 확인합니다.
+    - 늦게 커밋된 행을 놓치지 않도록 REFRESH_INTERVAL마다 최근 REFRESH_LAG초 이내 생성된 행부터 다시 읽습니다.
+    필터가 준비되기 전이나 비활성화 상태에서는 모든 코드를 존재할 수 있는 것으로 판단합니다.
+    """
+
+    VERSION_KEY = "short_url:bloom:version"
+
+    _filter = None
+    _version = None
+    # 마지막으로 읽은 id, 늦게 커밋된 행이 없다고 볼 수 있는 id
+    _seen = 0
+    _watermark = 0
+    _flusher = None
+    _lock = threading.Lock()
+    _setup_lock = threading.Lock()
+
+    @classmethod
+    def _get_config(cls):
+        return settings.SHORT_URL_BLOOM
+
+    @classmethod
+    def _get_shared(cls):
+        return caches[cls._get_config()["ALIAS"]]
+
+    @classmethod
+    def _setup(cls):
+        with cls._setup_lock:
+            if cls._flusher is None:
+                # 종료 시에는 다시 읽을 필요가 없으므로 flush_at_exit 사용 안 함
+                cls._flusher = BackgroundFlusher(
+                    name="short-url-bloom", flush=cls.rescan, interval=cls._get_config()["REFRESH_INTERVAL"], flush_at_exit=False
+                )
+
+    @classmethod
+    def scan(cls, bloom, after, chunk_size, lag):
+        """
+        id가 after보다 큰 유효 행을 chunk_size 단위로 읽어 필터에 추가
+        (마지막으로 읽은 id, 생성 후 lag초가 지난 마지막 id) 반환
+        """
+        cutoff = datetime.now() - timedelta(seconds=lag)
+        seen = watermark = after
+        queryset = ShortURL.objects.filter(deleted_at=None).order_by("id").values_list("id", "hash_value", "created_at")
+        while True:
+            rows = list(queryset.filter(id__gt=seen)[:chunk_size])
+            for id, hash_value, created_at in rows:
+                bloom.add(hash_value)
+                if created_at <= cutoff:
+                    watermark = id
+            if rows:
+                seen = rows[-1][0]
+            if len(rows) < chunk_size:
+                return seen, watermark
+
+    @classmethod
+    def build(cls):
+        """
+        DB 전체를 읽어 새 필터 생성 (watermark 포함)
+        """
+        config = cls._get_config()
+        last_id = ShortURL.objects.aggregate(last=Max("id"))["last"] or 0
+        bloom = BloomFilter.create(capacity=max(config["CAPACITY"], last_id), error_rate=config["ERROR_RATE"])
+        _, bloom.watermark = cls.scan(bloom, after=0, chunk_size=config["CHUNK_SIZE"], lag=config["REFRESH_LAG"])
+        return bloom
+
+    @classmethod
+    def _initialize(cls):
+        """
+        snapshot이 있으면 열고, 없으면 DB 전체를 읽어 필터 준비
+        """
+        started = time.perf_counter()
+        path = cls._get_config()["SNAPSHOT_PATH"]
+        bloom = None
+        if path and os.path.exists(path):
+            try:
+                bloom = BloomFilter.load(path)
+            except (OSError, ValueError) as e:
+                logger.error(f"short url bloom snapshot load failed: {e}")
+
+        bloom = bloom or cls.build()
+        cls._seen = cls._watermark = bloom.watermark
+        cls._filter = bloom
+        logger.info(f"short url bloom ready: {len(bloom)} values in {time.perf_counter() - started:.1f}s")
+
+    @classmethod
+    def refresh(cls, rescan=False):
+        """
+        필터 준비, 새로 생성된 행 추가
+        rescan이면 마지막으로 읽은 id 대신 watermark부터 다시 읽어 늦게 커밋된 행도 추가합니다.
+        """
+        config = cls._get_config()
+        with cls._lock:
+            # 다른 워커의 notify가 읽는 중에 발생하면 다음 확인 때 다시 읽도록 먼저 version 조회
+            version = cls._get_shared().get(cls.VERSION_KEY)
+
+            if cls._filter is None:
+                cls._initialize()
+
+            seen, watermark = cls.scan(
+                cls._filter,
+                after=cls._watermark if rescan else cls._seen,
+                chunk_size=config["CHUNK_SIZE"],
+                lag=config["REFRESH_LAG"],
+            )
+            cls._seen = max(cls._seen, seen)
+            cls._watermark = max(cls._watermark, watermark)
+            cls._version = version
+
+    @classmethod
+    def rescan(cls):
+        cls.refresh(rescan=True)
+
+    @classmethod
+    def _get_filter(cls):
+        """
+        준비된 필터 반환, 준비 중이면 None (백그라운드 스레드에서 준비)
+        """
+        if cls._flusher is None:
+            cls._setup()
+        cls._flusher.start()
+        if cls._filter is None and cls._flusher.interval > 0:
+            cls._flusher.wake()
+        return cls._filter
+
+    @classmethod
+    def might_exist(cls, hash_value):
+        """
+        존재할 수 있는 hash value이면 True, 확실히 존재하지 않으면 False
+        """
+        if not cls._get_config()["ENABLED"]:
+            return True
+
+        bloom = cls._get_filter()
+        if bloom is None:
+            if cls._flusher.interval > 0:
+                return True
+            cls.refresh()
+        elif hash_value in bloom:
+            return True
+        elif cls._get_shared().get(cls.VERSION_KEY) != cls._version:
+            cls.refresh()
+        else:
+            return False
+        return hash_value in cls._filter
+
+    @classmethod
+    async def amight_exist(cls, hash_value):
+        """
+        might_exist의 비동기 버전 (DB 조회가 필요하면 스레드에서 실행)
+        """
+        if not cls._get_config()["ENABLED"]:
+            return True
+
+        bloom = cls._get_filter()
+        if bloom is None:
+            if cls._flusher.interval > 0:
+                return True
+            await sync_to_async(cls.refresh)()
+        elif hash_value in bloom:
+            return True
+        elif await cls._get_shared().aget(cls.VERSION_KEY) != cls._version:
+            await sync_to_async(cls.refresh)()
+        else:
+            return False
+        return hash_value in cls._filter
+
+    @classmethod
+    def notify(cls, hash_values):
+        """
+        Short URL 생성 후(커밋 이후) 호출
+        현재 워커의 필터에 바로 추가하고, 다른 워커가 새 행을 읽도록 공유 version을 올립니다.
+        """
+        config = cls._get_config()
+        if not config["ENABLED"]:
+            return
+
+        bloom = cls._filter
+        if bloom is not None:
+            for hash_value in hash_values:
+                bloom.add(hash_value)
+
+        shared = cls._get_shared()
+        try:
+            shared.incr(cls.VERSION_KEY)
+        except ValueError:
+            shared.add(cls.VERSION_KEY, 1, timeout=None)
+
+    @classmethod
+    def reset(cls):
+        """
+        필터 초기화 (설정 변경, 테스트 용도)
+        """
+        with cls._lock:
+            cls._filter = None
+            cls._version = None
+            cls._seen = cls._watermark = 0
+            cls._flusher = None
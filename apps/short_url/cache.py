@@ -0,0 +1,276 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Resolve Cache
+"""
+
+# System
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+
+# Project
+from core.cache import LRUCache
+from core.instrumentation import Instrumentation
+from core.db_router import ReplicaRouter
+from apps.short_url.bloom import ShortURLBloom
+from apps.short_url.models import ShortURL
+
+
+class ShortURLCache:
+    """
+    Redirect 조회용 2단계 캐시
+    1차: 프로세스 내부 LRU (TTL, 크기 제한)
+    2차: Django cache backend (기본 locmem, 운영은 redis 등)
+    두 단계 모두 없으면 DB(replica가 있으면 replica)에서 조회 후 채워 넣습니다.
+    존재하지 않는 URL도 NOT_FOUND로 짧게 캐싱합니다.
+    LRU에 없는 코드는 Bloom filter(SHORT_URL_BLOOM)로 먼저 확인하여, 존재할 수 없는 코드는 캐싱하지 않고 바로 None을 반환합니다.
+    hot key(ShortURLHotKeys)는 LRU보다 먼저 조회하는 고정(pinned) tier에 두어 만료, 제거 없이 사용하고,
+    ShortURLHotKeys가 주기적으로 DB에서 다시 읽어 갱신합니다.
+    """
+
+    KEY_PREFIX = "short_url"
+    NOT_FOUND = "__not_found__"
+
+    _local = None
+    # hash value -> Short URL 정보 (만료, 크기 제한 없음)
+    _pinned = {}
+
+    @classmethod
+    def _get_config(cls):
+        return settings.SHORT_URL_CACHE
+
+    @classmethod
+    def _get_local(cls):
+        """
+        프로세스 내부 LRU (최초 사용 시 생성)
+        """
+        if cls._local is None:
+            config = cls._get_config()
+            cls._local = LRUCache(maxsize=config["LRU_SIZE"], ttl=config["LRU_TTL"])
+        return cls._local
+
+    @classmethod
+    def _get_shared(cls):
+        """
+        공유 캐시 (Django cache backend)
+        """
+        return caches[cls._get_config()["ALIAS"]]
+
+    @classmethod
+    def make_key(cls, hash_value):
+        return f"{cls.KEY_PREFIX}:{hash_value}"
+
+    @classmethod
+    def _get_timeouts(cls, entry):
+        """
+        캐시 항목별 (LRU TTL, 공유 캐시 TTL) 반환
+        존재하지 않거나 이미 만료된 URL은 negative TTL을 사용합니다.
+        """
+        config = cls._get_config()
+        negative_ttl = config["NEGATIVE_TTL"]
+
+        if entry == cls.NOT_FOUND:
+            return min(config["LRU_TTL"], negative_ttl), negative_ttl
+
+        expiration_date = entry["expiration_date"]
+        if expiration_date and expiration_date < datetime.now():
+            return min(config["LRU_TTL"], negative_ttl), negative_ttl
+
+        return config["LRU_TTL"], config["TTL"]
+
+    @classmethod
+    def _get_queryset(cls, hash_value):
+        """
+        유효 hash value unique index로 Redirect에 필요한 최소 필드만 조회
+        """
+        return ShortURL.objects.filter(live_hash_value=hash_value).values("id", "url", "expiration_date")
+
+    @classmethod
+    def _load(cls, hash_value):
+        """
+        DB 조회 (replica가 있으면 replica에서 조회)
+        replica에 없으면 아직 복제되지 않은 코드일 수 있으므로 primary에서 다시 확인합니다. (FALLBACK_ON_MISS)
+        """
+        replica = ReplicaRouter.get_replica()
+        queryset = cls._get_queryset(hash_value)
+
+        entry = queryset.using(replica).first() if replica else None
+        if entry is None and (replica is None or settings.DATABASE_REPLICA["FALLBACK_ON_MISS"]):
+            entry = queryset.using(DEFAULT_DB_ALIAS).first()
+        return entry or cls.NOT_FOUND
+
+    @classmethod
+    async def _aload(cls, hash_value):
+        """
+        _load의 비동기 버전
+        """
+        replica = ReplicaRouter.get_replica()
+        queryset = cls._get_queryset(hash_value)
+
+        entry = await queryset.using(replica).afirst() if replica else None
+        if entry is None and (replica is None or settings.DATABASE_REPLICA["FALLBACK_ON_MISS"]):
+            entry = await queryset.using(DEFAULT_DB_ALIAS).afirst()
+        return entry or cls.NOT_FOUND
+
+    @classmethod
+    def resolve(cls, hash_value):
+        """
+        hash value에 해당하는 Short URL 정보 반환
+        {"id", "url", "expiration_date"} 또는 존재하지 않으면 None
+        """
+        entry = cls._pinned.get(hash_value)
+        if entry is not None:
+            Instrumentation.cache("short_url", hit=True)
+            return entry
+
+        key = cls.make_key(hash_value)
+        local = cls._get_local()
+
+        entry = local.get(key)
+        hit = True
+        if entry is None:
+            # 무작위 코드로 LRU가 밀려나지 않도록 존재할 수 없는 코드는 캐싱하지 않음
+            if not ShortURLBloom.might_exist(hash_value):
+                # Bloom filter로 DB 조회 없이 응답한 경우도 hit
+                Instrumentation.cache("short_url", hit=True)
+                return None
+
+            shared = cls._get_shared()
+            entry = shared.get(key)
+            if entry is None:
+                hit = False
+                entry = cls._load(hash_value)
+                shared.set(key, entry, timeout=cls._get_timeouts(entry)[1])
+            local.set(key, entry, ttl=cls._get_timeouts(entry)[0])
+
+        Instrumentation.cache("short_url", hit=hit)
+        if entry == cls.NOT_FOUND:
+            return None
+        return entry
+
+    @classmethod
+    async def aresolve(cls, hash_value):
+        """
+        resolve의 비동기 버전 (async view용)
+        LRU 조회는 이벤트 루프에서 바로 처리하고, 공유 캐시와 DB만 await 합니다.
+        """
+        entry = cls._pinned.get(hash_value)
+        if entry is not None:
+            Instrumentation.cache("short_url", hit=True)
+            return entry
+
+        key = cls.make_key(hash_value)
+        local = cls._get_local()
+
+        entry = local.get(key)
+        hit = True
+        if entry is None:
+            if not await ShortURLBloom.amight_exist(hash_value):
+                # Bloom filter로 DB 조회 없이 응답한 경우도 hit
+                Instrumentation.cache("short_url", hit=True)
+                return None
+
+            shared = cls._get_shared()
+            entry = await shared.aget(key)
+            if entry is None:
+                hit = False
+                entry = await cls._aload(hash_value)
+                await shared.aset(key, entry, timeout=cls._get_timeouts(entry)[1])
+            local.set(key, entry, ttl=cls._get_timeouts(entry)[0])
+
+        Instrumentation.cache("short_url", hit=hit)
+        if entry == cls.NOT_FOUND:
+            return None
+        return entry
+
+    @classmethod
+    def _load_many(cls, hash_values):
+        """
+        여러 hash value를 유효 hash value unique index로 한 번에 조회, {hash value: Short URL 정보} 반환 (없는 코드는 제외)
+        _load와 같이 replica에 없는 코드는 primary에서 다시 확인합니다.
+        """
+        replica = ReplicaRouter.get_replica()
+        queryset = ShortURL.objects.values("live_hash_value", "id", "url", "expiration_date")
+
+        def fetch(alias, values):
+            return {row.pop("live_hash_value"): row for row in queryset.using(alias).filter(live_hash_value__in=values)}
+
+        entries = fetch(replica, hash_values) if replica else {}
+        missing = [hash_value for hash_value in hash_values if hash_value not in entries]
+        if missing and (replica is None or settings.DATABASE_REPLICA["FALLBACK_ON_MISS"]):
+            entries.update(fetch(DEFAULT_DB_ALIAS, missing))
+        return entries
+
+    @classmethod
+    def pin_many(cls, hash_values):
+        """
+        여러 hash value를 고정 tier에 DB에서 읽은 최신 값으로 추가하거나 갱신 (DB 조회 한 번, 공유 캐시 set_many)
+        고정한 hash value 집합을 반환하고, 존재하지 않는 코드는 고정하지 않습니다.
+        """
+        hash_values = list(hash_values)
+        if not hash_values:
+            return set()
+
+        entries = cls._load_many(hash_values)
+        for hash_value in hash_values:
+            if hash_value not in entries:
+                cls._pinned.pop(hash_value, None)
+
+        # 고정 해제 후에도 최신 값을 사용하도록 공유 캐시도 갱신 (만료된 URL은 negative TTL이므로 TTL별로 나누어 저장)
+        by_timeout = {}
+        for hash_value, entry in entries.items():
+            cls._pinned[hash_value] = entry
+            by_timeout.setdefault(cls._get_timeouts(entry)[1], {})[cls.make_key(hash_value)] = entry
+        shared = cls._get_shared()
+        for timeout, items in by_timeout.items():
+            shared.set_many(items, timeout=timeout)
+        return set(entries)
+
+    @classmethod
+    def pin(cls, hash_value):
+        """
+        hash value를 고정 tier에 DB에서 읽은 최신 값으로 추가하거나 갱신
+        존재하지 않는 코드는 고정하지 않고 False를 반환합니다.
+        """
+        return hash_value in cls.pin_many([hash_value])
+
+    @classmethod
+    def unpin(cls, hash_value):
+        cls._pinned.pop(hash_value, None)
+
+    @classmethod
+    def get_pinned(cls):
+        return set(cls._pinned)
+
+    @classmethod
+    def invalidate(cls, hash_value):
+        """
+        캐시 무효화 (생성, 삭제, 수정 시)
+        다른 워커의 LRU는 LRU_TTL, 고정 tier는 ShortURLHotKeys 갱신 주기 이내에 반영됩니다.
+        """
+        key = cls.make_key(hash_value)
+        cls._pinned.pop(hash_value, None)
+        cls._get_local().delete(key)
+        cls._get_shared().delete(key)
+
+    @classmethod
+    def invalidate_many(cls, hash_values):
+        """
+        여러 건 캐시 무효화 (bulk_create 등 signal이 발생하지 않는 경우)
+        """
+        keys = [cls.make_key(hash_value) for hash_value in hash_values]
+        local = cls._get_local()
+        for hash_value, key in zip(hash_values, keys):
+            cls._pinned.pop(hash_value, None)
+            local.delete(key)
+        cls._get_shared().delete_many(keys)
+
+    @classmethod
+    def clear(cls):
+        """
+        프로세스 내부 LRU, 고정 tier 초기화 (설정 변경, 테스트 용도)
+        """
+        cls._local = None
+        cls._pinned = {}
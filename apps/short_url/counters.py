@@ -0,0 +1,247 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Click Counter
+"""
+
+# System
+import random
+import threading
+from collections import defaultdict
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+
+# Project
+from core.flusher import BackgroundFlusher, spawn
+from apps.short_url.models import ShortURL, ShortURLCounterShard
+
+
+class LocalClickBuffer:
+    """
+    워커 프로세스 메모리에 클릭 수를 모으는 버퍼
+    """
+
+    def __init__(self):
+        self._counts = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, short_url_id, count, shards=1):
+        """
+        클릭 수 누적 후 현재 버퍼 크기 반환 (워커 메모리이므로 shards는 사용하지 않음)
+        """
+        with self._lock:
+            self._counts[short_url_id] += count
+            return len(self._counts)
+
+    def drain(self):
+        """
+        누적된 클릭 수를 꺼내고 버퍼를 비움
+        """
+        with self._lock:
+            counts, self._counts = self._counts, defaultdict(int)
+        return counts
+
+
+class CacheClickBuffer:
+    """
+    공유 캐시(redis 등)에 클릭 수를 모으는 버퍼
+    카운트는 모든 워커가 공유하고, 이 워커가 증가시킨 키 목록만 메모리에 보관합니다.
+    hot key는 shards개의 키 중 하나를 무작위로 골라 증가시켜 한 키에 모든 워커의 증가가 몰리지 않도록 합니다.
+    여러 워커가 같은 키를 동시에 drain 할 수 있으므로 차감(decr) 결과로 가져갈 양을 정합니다.
+    (음수를 허용하는 원자적 incr/decr이 필요하므로 redis, locmem 등에서 사용, 0 미만으로 내려가지 않는 memcached는 사용 불가)
+    키는 생성 또는 마지막 drain 후 ttl초가 지나면 사라집니다. (클릭이 없는 Short URL의 키가 남지 않음)
+    """
+
+    KEY_PREFIX = "click_count"
+
+    def __init__(self, alias, ttl=86400):
+        self._cache = caches[alias]
+        self._ttl = ttl
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def make_key(self, short_url_id, shard=0):
+        # shard 0은 기존 키와 같은 형식
+        if shard:
+            return f"{self.KEY_PREFIX}:{short_url_id}:{shard}"
+        return f"{self.KEY_PREFIX}:{short_url_id}"
+
+    def _mark_dirty(self, short_url_id, shard):
+        with self._lock:
+            self._dirty.add((short_url_id, shard))
+            return len(self._dirty)
+
+    def add(self, short_url_id, count, shards=1):
+        shard = random.randrange(shards) if shards > 1 else 0
+        key = self.make_key(short_url_id, shard)
+        self._cache.add(key, 0, timeout=self._ttl)
+        try:
+            self._cache.incr(key, count)
+        except ValueError:
+            # add 이후 다른 워커의 drain 또는 TTL로 키가 사라진 경우
+            self._cache.set(key, count, timeout=self._ttl)
+
+        return self._mark_dirty(short_url_id, shard)
+
+    def _claim(self, key, count):
+        """
+        키에서 count만큼 차감하고 실제로 가져간 양 반환
+        다른 워커가 같은 값을 먼저 가져가 차감 결과가 음수이면 모자란 만큼 되돌리고 나머지만 가져갑니다.
+        (차감한 양은 가져가거나 되돌리므로 두 번 반영되지 않음)
+        """
+        try:
+            remaining = self._cache.decr(key, count)
+        except ValueError:
+            # 읽은 뒤 TTL로 사라진 키
+            return 0
+
+        if remaining >= 0:
+            return count
+
+        refund = min(count, -remaining)
+        self._cache.incr(key, refund)
+        return count - refund
+
+    def drain(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+
+        keys = {self.make_key(short_url_id, shard): (short_url_id, shard) for short_url_id, shard in dirty}
+        counts = defaultdict(int)
+        for key, count in self._cache.get_many(list(keys)).items():
+            if not count or count < 0:
+                continue
+
+            # 읽은 값이 아니라 차감 결과로 가져간 만큼만 반영 (그 사이 증가한 값은 다음 flush로 넘김)
+            claimed = self._claim(key, count)
+            if claimed:
+                counts[keys[key][0]] += claimed
+            if claimed < count:
+                # 되돌린 값은 다음 flush에서 다시 가져감
+                self._mark_dirty(*keys[key])
+            # 클릭이 계속되는 키는 drain마다 TTL 연장, 더 이상 증가하지 않는 키는 TTL 후 사라짐
+            self._cache.touch(key, self._ttl)
+        return counts
+
+
+class ClickCounter:
+    """
+    Redirect 클릭 수 카운터
+    Redirect 요청에서는 버퍼에 누적만 하고, 백그라운드 스레드가 주기적으로
+    Short URL별 UPDATE ... SET request_count = request_count + N 으로 반영합니다.
+    SHARDS가 0보다 크면 short_url 행 대신 ShortURLCounterShard의 무작위 shard에 더하고,
+    compact_short_url_counters가 주기적으로 request_count에 합칩니다.
+    """
+
+    _buffer = None
+    _flusher = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_config(cls):
+        return settings.CLICK_COUNTER
+
+    @classmethod
+    def _setup(cls):
+        with cls._lock:
+            if cls._flusher is not None:
+                return
+
+            config = cls._get_config()
+            if config["BACKEND"] == "cache":
+                cls._buffer = CacheClickBuffer(alias=config["ALIAS"], ttl=config["KEY_TTL"])
+            else:
+                cls._buffer = LocalClickBuffer()
+            cls._flusher = BackgroundFlusher(
+                name="click-counter", flush=cls.flush, interval=config["FLUSH_INTERVAL"], flush_at_exit=config["FLUSH_AT_EXIT"]
+            )
+
+    @classmethod
+    def record(cls, short_url_id, count=1, shards=1):
+        """
+        클릭 수 누적 (DB 쓰기를 기다리지 않음)
+        버퍼가 MAX_BUFFER를 넘으면 flush를 요청합니다.
+        shards는 hot key처럼 여러 워커가 동시에 증가시키는 Short URL의 공유 카운터 분산 수입니다.
+        """
+        if cls._flusher is None:
+            cls._setup()
+        cls._flusher.start()
+
+        size = cls._buffer.add(short_url_id, count, shards)
+        if size >= cls._get_config()["MAX_BUFFER"]:
+            if cls._flusher.interval > 0:
+                cls._flusher.wake()
+            else:
+                cls._flusher.flush()
+
+    @classmethod
+    async def arecord(cls, short_url_id, count=1, shards=1):
+        """
+        record의 비동기 버전 (async view용)
+        메모리 버퍼는 이벤트 루프에서 바로 누적하고,
+        I/O가 필요한 작업(공유 캐시 버퍼, 즉시 flush)은 기다리지 않고 스레드에서 실행합니다.
+        """
+        if cls._flusher is None:
+            cls._setup()
+        cls._flusher.start()
+
+        if not isinstance(cls._buffer, LocalClickBuffer):
+            spawn(cls.record, short_url_id, count, shards)
+            return
+
+        size = cls._buffer.add(short_url_id, count, shards)
+        if size >= cls._get_config()["MAX_BUFFER"]:
+            if cls._flusher.interval > 0:
+                cls._flusher.wake()
+            else:
+                spawn(cls._flusher.flush)
+
+    @classmethod
+    def flush(cls):
+        """
+        누적된 클릭 수를 DB에 반영
+        증가량이 같은 Short URL은 하나의 UPDATE로 묶습니다.
+        """
+        if cls._buffer is None:
+            return
+
+        counts = cls._buffer.drain()
+        if not counts:
+            return
+
+        shards = cls._get_config()["SHARDS"]
+        if shards > 0:
+            try:
+                ShortURLCounterShard.objects.increment_many(counts, shards)
+            except Exception:
+                # 하나의 트랜잭션이므로 전부 버퍼로 되돌림
+                for short_url_id, count in counts.items():
+                    cls._buffer.add(short_url_id, count)
+                raise
+            return
+
+        grouped = defaultdict(list)
+        for short_url_id, count in counts.items():
+            grouped[count].append(short_url_id)
+
+        flushed = set()
+        try:
+            for count, short_url_ids in grouped.items():
+                ShortURL.objects.filter(id__in=short_url_ids).update(request_count=F("request_count") + count)
+                flushed.update(short_url_ids)
+        except Exception:
+            # 반영하지 못한 클릭 수는 버퍼로 되돌림
+            for short_url_id, count in counts.items():
+                if short_url_id not in flushed:
+                    cls._buffer.add(short_url_id, count)
+            raise
+
+    @classmethod
+    def reset(cls):
+        """
+        버퍼 초기화 (설정 변경, 테스트 용도)
+        """
+        with cls._lock:
+            cls._buffer = None
+            cls._flusher = None
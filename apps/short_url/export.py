@@ -0,0 +1,104 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Export
+"""
+
+# System
+import csv
+import json
+
+# Project
+from core.algorithm import Algorithm
+
+
+class Echo:
+    """
+    csv.writer가 쓴 한 줄을 그대로 반환하는 버퍼
+    """
+
+    def write(self, value):
+        return value
+
+
+class ShortURLExporter:
+    """
+    유저의 Short URL 목록을 CSV, NDJSON으로 스트리밍
+    id 순서로 chunk_size건씩 keyset 조회(id > 마지막 id)하고 values_list로 필요한 컬럼만 읽으므로,
+    행 수와 관계없이 메모리는 chunk 하나 크기로 일정합니다.
+    (MySQL 드라이버는 iterator()도 결과 전체를 메모리에 올리므로 OFFSET 없는 chunk 조회를 사용)
+    """
+
+    FIELDS = ("code", "url", "request_count", "expiration_date", "created_at")
+    FORMATS = {
+        "csv": "text/csv; charset=utf-8",
+        "ndjson": "application/x-ndjson",
+    }
+
+    def __init__(self, queryset, chunk_size=2000):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self):
+        """
+        chunk 단위 행 목록 (code, url, request_count, expiration_date, created_at)
+        Base62 인코딩은 chunk 단위로 한 번에 처리합니다. (alias가 있으면 alias)
+        """
+        # 클릭 수는 아직 합치지 않은 shard를 더한 값
+        queryset = (
+            self.queryset.with_request_count()
+            .order_by("id")
+            .values_list("id", "hash_value", "alias", "url", "total_request_count", "expiration_date", "created_at")
+        )
+
+        last_id = 0
+        while True:
+            rows = list(queryset.filter(id__gt=last_id)[: self.chunk_size])
+            if not rows:
+                return
+
+            codes = Algorithm.base62_encode_many([row[1] for row in rows])
+            # 사용자 지정 코드(alias)는 alias 그대로
+            yield [(row[2] or code, *row[3:]) for code, row in zip(codes, rows)]
+
+            if len(rows) < self.chunk_size:
+                return
+            last_id = rows[-1][0]
+
+    @staticmethod
+    def format_datetime(value):
+        return value.isoformat() if value else ""
+
+    def iter_csv(self):
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.FIELDS)
+        for chunk in self.iter_chunks():
+            yield "".join(
+                writer.writerow((code, url, request_count, self.format_datetime(expiration_date), self.format_datetime(created_at)))
+                for code, url, request_count, expiration_date, created_at in chunk
+            )
+
+    def iter_ndjson(self):
+        for chunk in self.iter_chunks():
+            yield "".join(
+                json.dumps(
+                    {
+                        "code": code,
+                        "url": url,
+                        "request_count": request_count,
+                        "expiration_date": self.format_datetime(expiration_date) or None,
+                        "created_at": self.format_datetime(created_at),
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+                for code, url, request_count, expiration_date, created_at in chunk
+            )
+
+    def stream(self, format):
+        """
+        format(csv, ndjson)에 맞는 문자열 iterator (chunk 단위)
+        """
+        if format == "csv":
+            return self.iter_csv()
+        return self.iter_ndjson()
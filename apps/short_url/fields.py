@@ -0,0 +1,46 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Fields
+"""
+
+# System
+from django.db import models
+
+# Project
+from core.algorithm import Algorithm
+
+
+class URLDigestField(models.CharField):
+    """
+    저장할 때 source 필드(URL)의 digest(Algorithm.digest_url)를 채우는 필드
+    null_if 필드에 값이 있으면(삭제일시 등) NULL로 저장하여 unique 검사에서 제외합니다.
+    save(), bulk_create() 모두 pre_save를 거치므로 어떤 경로로 생성해도 유효한 행은 digest를 가집니다.
+    """
+
+    def __init__(self, *args, source="url", null_if=None, **kwargs):
+        self.source = source
+        self.null_if = null_if
+        kwargs["max_length"] = 64
+        kwargs["null"] = True
+        kwargs["blank"] = True
+        kwargs["editable"] = False
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        for key in ("max_length", "null", "blank", "editable"):
+            kwargs.pop(key, None)
+        kwargs["source"] = self.source
+        if self.null_if:
+            kwargs["null_if"] = self.null_if
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        source = getattr(model_instance, self.source)
+        if source is None or (self.null_if and getattr(model_instance, self.null_if) is not None):
+            value = None
+        else:
+            value = Algorithm.digest_url(source)
+        setattr(model_instance, self.attname, value)
+        return value
@@ -0,0 +1,164 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Hot Key Tracker
+"""
+
+# System
+import os
+import random
+import socket
+import threading
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import caches
+
+# Project
+from core.flusher import BackgroundFlusher
+from core.heavy_hitters import SpaceSaving
+from apps.short_url.cache import ShortURLCache
+
+
+class ShortURLHotKeys:
+    """
+    Redirect가 몰리는 코드(hot key) 추적, 고정
+
+    워커마다 Redirect 성공한 hash value를 Space-Saving tracker(CAPACITY개 카운터)에 기록하고,
+    REFRESH_INTERVAL마다 상위 TOP_K 중 MIN_COUNT 이상인 코드를 hot key로 정합니다.
+    - hot key는 ShortURLCache 고정 tier에 DB에서 다시 읽은 값으로 두고(만료, 제거 없음), 매 주기마다 갱신합니다.
+    - hot key 클릭 수는 공유 카운터를 COUNTER_SHARDS개로 나누어 누적합니다.
+      (CLICK_COUNTER["BACKEND"]가 "cache"일 때만 적용, 메모리 버퍼는 워커별이라 나누지 않고 DB shard 수는 CLICK_COUNTER["SHARDS"])
+    - 주기마다 카운터에 DECAY를 곱해 오래전에 몰렸던 코드는 점차 hot key에서 빠집니다.
+    - 워커별 상위 코드를 공유 캐시에 기록하여 다른 프로세스(관리 API)에서 조회할 수 있습니다.
+    """
+
+    REPORT_KEY_PREFIX = "short_url:hot_keys"
+    WORKERS_KEY = "short_url:hot_keys:workers"
+
+    _tracker = None
+    _flusher = None
+    # 현재 hot key (고정 tier에 있는 hash value)
+    _hot = frozenset()
+    _lock = threading.Lock()
+    _setup_lock = threading.Lock()
+
+    @classmethod
+    def _get_config(cls):
+        return settings.SHORT_URL_HOT_KEYS
+
+    @classmethod
+    def _get_shared(cls):
+        return caches[cls._get_config()["ALIAS"]]
+
+    @staticmethod
+    def get_worker_name():
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    @classmethod
+    def _setup(cls):
+        with cls._setup_lock:
+            if cls._flusher is None:
+                config = cls._get_config()
+                cls._tracker = SpaceSaving(capacity=config["CAPACITY"])
+                # 종료 시에는 갱신할 필요가 없으므로 flush_at_exit 사용 안 함
+                cls._flusher = BackgroundFlusher(
+                    name="short-url-hot-keys", flush=cls.refresh, interval=config["REFRESH_INTERVAL"], flush_at_exit=False
+                )
+
+    @classmethod
+    def observe(cls, hash_value):
+        """
+        Redirect 성공 시 호출, 클릭 수 카운터 shard 수 반환 (hot key이면 COUNTER_SHARDS, 아니면 1)
+        반환 값은 CLICK_COUNTER["BACKEND"]가 "cache"일 때만 공유 카운터 키 분산에 사용되고, 다른 backend는 무시합니다.
+        SAMPLE_RATE 비율의 요청만 tracker에 기록합니다.
+        """
+        config = cls._get_config()
+        if not config["ENABLED"]:
+            return 1
+
+        if cls._flusher is None:
+            cls._setup()
+        cls._flusher.start()
+
+        rate = config["SAMPLE_RATE"]
+        if rate >= 1 or random.random() < rate:
+            cls._tracker.add(hash_value)
+
+        return config["COUNTER_SHARDS"] if hash_value in cls._hot else 1
+
+    @classmethod
+    def refresh(cls):
+        """
+        hot key 선정, 고정 tier 갱신 (REFRESH_INTERVAL마다 백그라운드 스레드에서 실행)
+        """
+        if cls._tracker is None:
+            return
+
+        config = cls._get_config()
+        with cls._lock:
+            top = cls._tracker.top(config["TOP_K"])
+            # 샘플링한 횟수는 전체 요청 기준으로 환산하여 비교
+            threshold = config["MIN_COUNT"] * min(config["SAMPLE_RATE"], 1)
+            candidates = {hash_value for hash_value, count, _ in top if count >= threshold}
+
+            for hash_value in cls._hot - candidates:
+                ShortURLCache.unpin(hash_value)
+            # 새로 hot key가 된 코드는 고정하고, 기존 hot key는 DB에서 다시 읽어 갱신 (삭제된 코드는 제외, 쿼리 한 번)
+            cls._hot = frozenset(ShortURLCache.pin_many(candidates))
+
+            cls._report(top)
+            cls._tracker.decay(config["DECAY"])
+
+    @classmethod
+    def _report(cls, top):
+        """
+        워커별 상위 코드를 공유 캐시에 기록 (REPORT_TTL 동안 갱신이 없으면 사라짐)
+        """
+        shared = cls._get_shared()
+        name = cls.get_worker_name()
+        shared.set(
+            f"{cls.REPORT_KEY_PREFIX}:{name}",
+            {
+                "worker": name,
+                "updated_at": datetime.now(),
+                "total": cls._tracker.total,
+                "keys": [
+                    {"hash_value": hash_value, "count": count, "error": error, "hot": hash_value in cls._hot} for hash_value, count, error in top
+                ],
+            },
+            timeout=cls._get_config()["REPORT_TTL"],
+        )
+
+        workers = shared.get(cls.WORKERS_KEY) or []
+        if name not in workers:
+            shared.set(cls.WORKERS_KEY, [*workers, name], timeout=None)
+
+    @classmethod
+    def get_reports(cls):
+        """
+        모든 워커의 최근 기록 목록 (기록이 만료된 워커는 목록에서 제거)
+        """
+        shared = cls._get_shared()
+        workers = shared.get(cls.WORKERS_KEY) or []
+        reports = shared.get_many([f"{cls.REPORT_KEY_PREFIX}:{name}" for name in workers])
+
+        alive = [name for name in workers if f"{cls.REPORT_KEY_PREFIX}:{name}" in reports]
+        if len(alive) != len(workers):
+            shared.set(cls.WORKERS_KEY, alive, timeout=None)
+        return [reports[f"{cls.REPORT_KEY_PREFIX}:{name}"] for name in alive]
+
+    @classmethod
+    def is_hot(cls, hash_value):
+        return hash_value in cls._hot
+
+    @classmethod
+    def reset(cls):
+        """
+        tracker, hot key 초기화 (설정 변경, 테스트 용도)
+        """
+        with cls._lock:
+            for hash_value in cls._hot:
+                ShortURLCache.unpin(hash_value)
+            cls._tracker = None
+            cls._flusher = None
+            cls._hot = frozenset()
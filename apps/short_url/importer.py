@@ -0,0 +1,199 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Import
+"""
+
+# System
+import csv
+import json
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+
+# Project
+from core.algorithm import Algorithm
+from apps.short_url.bloom import ShortURLBloom
+from apps.short_url.aliases import ShortURLAlias
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+
+# 원본 URL 최대 길이 (MySQL에서 bulk_create(ignore_conflicts=True)는 INSERT IGNORE이므로 넘는 URL은 에러 없이 잘려 저장됨)
+URL_MAX_LENGTH = ShortURL._meta.get_field("url").max_length
+
+
+class ShortURLImporter:
+    """
+    CSV, NDJSON 행(url, code, expiration_date, request_count)을 Short URL로 가져오기
+    내보내기(ShortURLExporter) 형식을 그대로 읽을 수 있으며, code가 없으면 설정된 코드 생성기로 생성합니다.
+
+    chunk_size 행마다 하나의 트랜잭션에서 batch_size 단위 bulk_create(ignore_conflicts=True)로 넣고,
+    실제로 저장된 코드를 다시 조회해 생성한 코드가 다른 URL과 충돌한 행만 다음 코드로 한 건씩 재시도합니다.
+    지정한 code가 다른 URL에 사용 중이면 conflict로 건너뜁니다.
+    """
+
+    FORMATS = ("csv", "ndjson")
+
+    def __init__(self, user, batch_size=1000, chunk_size=10000):
+        self.user = user
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.stats = {"read": 0, "imported": 0, "invalid": 0, "conflict": 0}
+
+        # 행별 검증에 사용하는 필드 (행마다 Serializer를 만들지 않음)
+        self.url_field = serializers.URLField(max_length=URL_MAX_LENGTH)
+        self.expiration_date_field = serializers.DateTimeField(allow_null=True)
+        self.request_count_field = serializers.IntegerField(min_value=0, allow_null=True)
+
+    @staticmethod
+    def read_rows(stream, type):
+        """
+        스트림에서 한 행씩 dict로 읽음 (해석할 수 없는 NDJSON 행은 None, 빈 행은 건너뜀)
+        """
+        if type == "csv":
+            yield from csv.DictReader(stream)
+            return
+
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield row if isinstance(row, dict) else None
+
+    def parse_row(self, row):
+        """
+        행 하나를 (url, hash_value, alias, expiration_date, request_count)로 변환
+        code가 없으면 hash_value는 None, Base62 코드가 아니면 alias로 검사하고, 올바르지 않은 행(URL 형식, 길이 포함)이면 None 반환
+        """
+        if not row:
+            return None
+
+        try:
+            url = self.url_field.run_validation(row.get("url"))
+            expiration_date = self.expiration_date_field.run_validation(row.get("expiration_date") or None)
+            request_count = self.request_count_field.run_validation(row.get("request_count") or None) or 0
+        except serializers.ValidationError:
+            return None
+
+        code = row.get("code") or None
+        hash_value = alias = None
+        if code is not None:
+            code = str(code)
+            hash_value = Algorithm.base62_decode(code)
+            if hash_value is None:
+                if ShortURLAlias.validate(code):
+                    return None
+                alias, hash_value = code, Algorithm.resolve_code(code)
+
+        return url, hash_value, alias, expiration_date, request_count
+
+    def _create_with_retry(self, obj):
+        """
+        생성한 코드가 충돌한 행을 다음 코드로 다시 생성 (재시도 횟수를 모두 사용하면 None)
+        """
+        for attempt in range(1, settings.SHORT_URL_CODE["MAX_ATTEMPTS"]):
+            obj.hash_value = Algorithm.generate_code(url=obj.url, attempt=attempt)
+            try:
+                with transaction.atomic():
+                    obj.save(force_insert=True)
+                return obj
+            except IntegrityError:
+                continue
+        return None
+
+    def import_chunk(self, rows):
+        """
+        파싱한 행 목록을 하나의 트랜잭션으로 저장
+        INSERT IGNORE가 URL을 잘라 저장하지 않도록 parse_row를 거치지 않은 행도 URL을 다시 검사해 invalid로 건너뜁니다.
+        """
+        objs, generated, used = [], set(), set()
+        for url, hash_value, alias, expiration_date, request_count in rows:
+            try:
+                self.url_field.run_validation(url)
+            except serializers.ValidationError:
+                self.stats["invalid"] += 1
+                continue
+
+            if hash_value is None:
+                # chunk 안에서 생성한 코드가 겹치지 않도록 다음 시도 코드 사용
+                attempt = 0
+                hash_value = Algorithm.generate_code(url=url, attempt=attempt)
+                while hash_value in used:
+                    attempt += 1
+                    hash_value = Algorithm.generate_code(url=url, attempt=attempt)
+                generated.add(hash_value)
+            elif hash_value in used:
+                self.stats["conflict"] += 1
+                continue
+
+            used.add(hash_value)
+            objs.append(
+                ShortURL(url=url, hash_value=hash_value, alias=alias, expiration_date=expiration_date, request_count=request_count, user=self.user)
+            )
+
+        imported = []
+        with transaction.atomic():
+            ShortURL.objects.bulk_create(objs, batch_size=self.batch_size, ignore_conflicts=True)
+
+            # ignore_conflicts로 건너뛴 행 확인 (같은 코드에 같은 URL이 이미 있으면 가져온 것으로 처리)
+            stored = {}
+            hash_values = [obj.hash_value for obj in objs]
+            for start in range(0, len(hash_values), self.batch_size):
+                queryset = ShortURL.objects.filter(live_hash_value__in=hash_values[start : start + self.batch_size])
+                stored.update(queryset.values_list("live_hash_value", "url"))
+
+            # 같은 URL이 이미 유효하면(url_digest unique) 코드를 바꿔도 생성할 수 없으므로 재시도하지 않음
+            missing = [obj.url_digest for obj in objs if stored.get(obj.hash_value) != obj.url]
+            duplicated = set()
+            for start in range(0, len(missing), self.batch_size):
+                queryset = ShortURL.objects.filter(url_digest__in=missing[start : start + self.batch_size])
+                duplicated.update(queryset.values_list("url_digest", flat=True))
+
+            for obj in objs:
+                if stored.get(obj.hash_value) == obj.url:
+                    imported.append(obj.hash_value)
+                elif obj.hash_value in generated and obj.url_digest not in duplicated and self._create_with_retry(obj):
+                    imported.append(obj.hash_value)
+                else:
+                    self.stats["conflict"] += 1
+
+        # 가져오기 전에 NOT_FOUND로 캐싱된 코드 무효화, Bloom filter 추가
+        ShortURLCache.invalidate_many(imported)
+        ShortURLBloom.notify(imported)
+        self.stats["imported"] += len(imported)
+
+    def run(self, stream, type, offset=0, on_progress=None):
+        """
+        스트림의 offset번째 행부터 가져오기
+        chunk를 커밋할 때마다 지금까지 처리한 행 위치로 on_progress(position)를 호출하므로,
+        중단되면 마지막으로 전달된 위치를 offset으로 지정해 이어서 가져올 수 있습니다.
+        """
+        chunk, pending, position = [], 0, offset
+        for index, row in enumerate(self.read_rows(stream, type)):
+            if index < offset:
+                continue
+
+            position = index + 1
+            pending += 1
+            self.stats["read"] += 1
+
+            parsed = self.parse_row(row)
+            if parsed is None:
+                self.stats["invalid"] += 1
+            else:
+                chunk.append(parsed)
+
+            if pending >= self.chunk_size:
+                self.import_chunk(chunk)
+                chunk, pending = [], 0
+                if on_progress:
+                    on_progress(position)
+
+        if pending:
+            self.import_chunk(chunk)
+            if on_progress:
+                on_progress(position)
+        return self.stats
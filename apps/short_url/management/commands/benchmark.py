@@ -0,0 +1,221 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : API Benchmark Suite Command
+"""
+
+# System
+import json
+import time
+import http.client
+from datetime import datetime
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+# Project
+from core.algorithm import Algorithm
+from core.jwt import CustomJWTAuthentication
+from core.benchmark import BenchmarkServer, measure, measure_concurrent, summarize
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.counters import ClickCounter
+from apps.short_url.models import ShortURL
+from apps.short_url.benchmark import (
+    BENCHMARK_EMAIL,
+    BENCHMARK_PASSWORD,
+    delete_benchmark_data,
+    get_benchmark_codes,
+    get_benchmark_user,
+    seed_short_urls,
+)
+
+
+class Command(BaseCommand):
+    help = "벤치마크 데이터를 시딩하고 API별 응답 시간(p50/p95/p99)과 처리량을 측정하여 JSON으로 출력합니다."
+
+    SCENARIOS = ("create", "redirect_hot", "redirect_cold", "delete", "sign_in", "token_refresh")
+    SERVER_SCENARIOS = ("create", "redirect_hot", "redirect_cold")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="시딩할 Short URL 수 (10^4 ~ 10^7)")
+        parser.add_argument("--repeat", type=int, default=1000, help="시나리오별 요청 횟수")
+        parser.add_argument("--auth-repeat", type=int, default=20, help="sign_in, token_refresh 요청 횟수 (비밀번호 해싱 비용이 큼)")
+        parser.add_argument("--hot-keys", type=int, default=100, help="redirect_hot에 사용할 Short URL 수")
+        parser.add_argument("--concurrency", type=int, default=8, help="WSGI 서버 부하 측정 동시 요청 수, 0이면 서버 측정 생략")
+        parser.add_argument("--scenario", action="append", choices=self.SCENARIOS, help="측정할 시나리오 (여러 번 지정 가능, 기본 전체)")
+        parser.add_argument("--output", help="결과 JSON 파일 경로")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+        parser.add_argument("--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음")
+
+    def log(self, message):
+        if not self.quiet:
+            self.stdout.write(message)
+
+    def prepare(self, user, options):
+        """
+        시나리오에서 사용할 코드, 토큰 준비 (측정 제외)
+        hot key는 미리 한 번씩 조회하여 캐시에 올리고, cold key는 hot key와 겹치지 않는 코드를 요청마다 한 번씩만 사용합니다.
+        """
+        repeat = options["repeat"]
+        hot_keys = options["hot_keys"]
+
+        self.hot_codes = get_benchmark_codes(user=user, count=hot_keys)
+        self.cold_codes = get_benchmark_codes(user=user, count=repeat * 2, offset=hot_keys)
+        if not self.hot_codes:
+            raise CommandError("Redirect 가능한 벤치마크 데이터가 없습니다. --rows를 늘려주세요.")
+        if len(self.cold_codes) < repeat * 2:
+            self.log(f"cold key가 부족하여 재사용합니다. ({len(self.cold_codes)}/{repeat * 2})")
+            self.cold_codes = self.cold_codes or self.hot_codes
+
+        self.access_token = CustomJWTAuthentication.create_access_token(user=user)
+        self.refresh_token = CustomJWTAuthentication.create_refresh_token(user=user)
+        self.run_id = int(time.time() * 1000)
+
+        ShortURLCache.clear()
+        cache.clear()
+
+    def create_delete_codes(self, user, count):
+        """
+        delete 시나리오용 Short URL 생성 (측정 제외)
+        """
+        items = [(f"https://benchmark.example.com/delete/{self.run_id}/{i}", None) for i in range(count)]
+        short_urls = ShortURL.objects.bulk_create_short_urls(items=items, user=user)
+        return Algorithm.base62_encode_many([short_url.hash_value for short_url in short_urls if short_url])
+
+    def run_client(self, user, scenarios, options):
+        """
+        Django test client로 측정 (WSGI 서버 없이 Django 전체 스택)
+        """
+        client = Client()
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {self.access_token}"}
+        repeat = options["repeat"]
+        cold_codes = self.cold_codes[:repeat]
+
+        def create(i):
+            url = f"https://benchmark.example.com/create/{self.run_id}/client/{i}"
+            client.post(reverse("api-short-url:post-short-url"), data={"url": url}, content_type="application/json", **auth)
+
+        def redirect_hot(i):
+            client.get(reverse("get-redirect", kwargs={"url": self.hot_codes[i % len(self.hot_codes)]}))
+
+        def redirect_cold(i):
+            client.get(reverse("get-redirect", kwargs={"url": cold_codes[i % len(cold_codes)]}))
+
+        def sign_in(i):
+            data = {"email": BENCHMARK_EMAIL, "password": BENCHMARK_PASSWORD}
+            client.post(reverse("api-users:sign-in"), data=data, content_type="application/json")
+
+        def token_refresh(i):
+            data = {"token": self.refresh_token}
+            client.post(reverse("api-users:token-refresh"), data=data, content_type="application/json", **auth)
+
+        delete_codes = []
+
+        def delete(i):
+            client.delete(reverse("api-short-url:delete-short-url", kwargs={"url": delete_codes[i]}), **auth)
+
+        requests = {
+            "create": (create, repeat),
+            "redirect_hot": (redirect_hot, repeat),
+            "redirect_cold": (redirect_cold, repeat),
+            "delete": (delete, repeat),
+            "sign_in": (sign_in, options["auth_repeat"]),
+            "token_refresh": (token_refresh, options["auth_repeat"]),
+        }
+
+        # hot key 캐시 적재
+        for i in range(len(self.hot_codes)):
+            redirect_hot(i)
+
+        results = {}
+        for name in scenarios:
+            func, count = requests[name]
+            if name == "delete":
+                delete_codes += self.create_delete_codes(user=user, count=count)
+                count = len(delete_codes)
+            results[name] = summarize(measure(func, count))
+            self.log(self.format_result("client", name, results[name]))
+        return results
+
+    def run_server(self, scenarios, options):
+        """
+        실제 WSGI 서버(config.wsgi, Redirect dispatcher 포함)에 동시 요청으로 부하를 주어 측정
+        """
+        # 순환 참조 방지 (Django 초기화 이후 import)
+        from config.wsgi import application
+
+        repeat = options["repeat"]
+        concurrency = options["concurrency"]
+        cold_codes = self.cold_codes[repeat:] or self.cold_codes
+        headers = {"Authorization": f"Bearer {self.access_token}", "Content-Type": "application/json"}
+
+        results = {}
+        with BenchmarkServer(application) as server:
+
+            def request(method, path, body=None, request_headers=None):
+                conn = http.client.HTTPConnection(server.host, server.port, timeout=30)
+                try:
+                    conn.request(method, path, body=body, headers=request_headers or {})
+                    conn.getresponse().read()
+                finally:
+                    conn.close()
+
+            requests = {
+                "create": lambda i: request(
+                    "POST",
+                    reverse("api-short-url:post-short-url"),
+                    body=json.dumps({"url": f"https://benchmark.example.com/create/{self.run_id}/server/{i}"}),
+                    request_headers=headers,
+                ),
+                "redirect_hot": lambda i: request("GET", f"/{self.hot_codes[i % len(self.hot_codes)]}"),
+                "redirect_cold": lambda i: request("GET", f"/{cold_codes[i % len(cold_codes)]}"),
+            }
+
+            for name in scenarios:
+                if name not in self.SERVER_SCENARIOS:
+                    continue
+                samples, elapsed = measure_concurrent(requests[name], repeat, concurrency)
+                results[name] = summarize(samples, elapsed=elapsed)
+                self.log(self.format_result("server", name, results[name]))
+        return results
+
+    def format_result(self, mode, name, result):
+        return f"[{mode}] {name}: p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms ops/s={result['ops_per_sec']}"
+
+    def handle(self, *args, **options):
+        self.quiet = options["json"]
+        scenarios = options["scenario"] or self.SCENARIOS
+
+        user = get_benchmark_user()
+        started = time.perf_counter()
+        seed_short_urls(user=user, rows=options["rows"], stdout=None if self.quiet else self.stdout)
+        self.log(f"seeded in {time.perf_counter() - started:.1f}s")
+
+        self.prepare(user=user, options=options)
+
+        report = {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "vendor": connection.vendor,
+            "rows": ShortURL.objects.count(),
+            "repeat": options["repeat"],
+            "auth_repeat": options["auth_repeat"],
+            "hot_keys": len(self.hot_codes),
+            "concurrency": options["concurrency"],
+            "client": self.run_client(user=user, scenarios=scenarios, options=options),
+            "server": self.run_server(scenarios=scenarios, options=options) if options["concurrency"] > 0 else None,
+        }
+
+        # 누적된 클릭 수 반영 후 정리
+        ClickCounter.flush()
+        if not options["keep"]:
+            delete_benchmark_data()
+
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.log(f"saved: {options['output']}")
+        if options["json"]:
+            self.stdout.write(output)
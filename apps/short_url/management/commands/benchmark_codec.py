@@ -0,0 +1,104 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Base62 Codec Benchmark Command
+"""
+
+# System
+import json
+import random
+import time
+from django.core.management.base import BaseCommand
+
+# Project
+from core import codec
+from core.algorithm import MAX_HASH_VALUE
+
+
+def reference_encode(value):
+    """
+    기존 구현(pybase62 encode)과 같은 방식 (한 자리씩 divmod, 문자열 index)
+    """
+    if value == 0:
+        return codec.CHARSET[0]
+    encoded = ""
+    while value > 0:
+        value, remainder = divmod(value, codec.BASE)
+        encoded = codec.CHARSET[remainder] + encoded
+    return encoded
+
+
+def reference_decode(encoded):
+    """
+    기존 구현(pybase62 decode)과 같은 방식 (한 자리씩 str.index)
+    """
+    value = 0
+    length = len(encoded)
+    for index, char in enumerate(encoded):
+        value += codec.CHARSET.index(char) * (codec.BASE ** (length - (index + 1)))
+    return value
+
+
+class Command(BaseCommand):
+    help = "Base62 인코딩/디코딩 처리 시간을 기존 구현(한 자리씩 변환)과 core.codec(lookup table, batch API) 간에 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=100000, help="변환할 값 개수")
+        parser.add_argument("--repeat", type=int, default=5, help="방식별 반복 횟수")
+        parser.add_argument("--bits", type=int, default=40, help="값의 bit 수 (기본 40bit hash value)")
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+
+    @staticmethod
+    def run(func, values, repeat):
+        """
+        repeat번 실행 중 가장 빠른 시간 기준으로 값당 처리 시간, 처리량 반환
+        """
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(values)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return {
+            "total_ms": round(best * 1000, 3),
+            "ns_per_value": round(best / len(values) * 1e9, 1),
+            "values_per_sec": round(len(values) / best, 1),
+        }
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        limit = min(2 ** options["bits"] - 1, MAX_HASH_VALUE)
+        values = [rng.randint(0, limit) for _ in range(max(options["count"], 1))]
+        codes = codec.encode_many(values)
+
+        # 기존 구현과 결과가 같은지 먼저 확인
+        if codes != [reference_encode(value) for value in values] or codec.decode_many(codes) != values:
+            raise RuntimeError("codec 결과가 기존 구현과 다릅니다.")
+
+        repeat = options["repeat"]
+        report = {
+            "count": len(values),
+            "bits": options["bits"],
+            "encode": {
+                "reference": self.run(lambda items: [reference_encode(value) for value in items], values, repeat),
+                "codec": self.run(lambda items: [codec.encode(value) for value in items], values, repeat),
+                "codec_many": self.run(codec.encode_many, values, repeat),
+            },
+            "decode": {
+                "reference": self.run(lambda items: [reference_decode(code) for code in items], codes, repeat),
+                "codec": self.run(lambda items: [codec.decode(code) for code in items], codes, repeat),
+                "codec_many": self.run(codec.decode_many, codes, repeat),
+            },
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
+            return
+
+        self.stdout.write(f"count: {report['count']}, bits: {report['bits']}")
+        for operation in ("encode", "decode"):
+            baseline = report[operation]["reference"]["total_ms"]
+            for label, result in report[operation].items():
+                speedup = round(baseline / result["total_ms"], 2) if result["total_ms"] else 0.0
+                self.stdout.write(f"[{operation}:{label}] total={result['total_ms']}ms ns/value={result['ns_per_value']} x{speedup}")
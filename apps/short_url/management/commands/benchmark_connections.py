@@ -0,0 +1,129 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Redirect DB Connection Benchmark Command
+"""
+
+# System
+import json
+import time
+from wsgiref.util import setup_testing_defaults
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Project
+from core.algorithm import Algorithm
+from core.benchmark import measure, summarize
+from core.backends.pool import PooledDatabaseWrapperMixin
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.redirect import RedirectWSGIMiddleware
+from apps.short_url.benchmark import delete_benchmark_data, get_benchmark_codes, get_benchmark_user, seed_short_urls
+
+
+class Command(BaseCommand):
+    help = "Redirect 캐시 miss(DB 조회) 요청 처리 시간을 connection 재사용 방식별로 비교합니다. (요청마다 연결, persistent, pool)"
+
+    # 측정 방식별 (CONN_MAX_AGE, POOL SIZE)
+    MODES = {
+        "new_connection": (0, 0),
+        "persistent": (None, 0),
+        "pooled": (0, 4),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="시딩할 Short URL 수")
+        parser.add_argument("--repeat", type=int, default=1000, help="방식별 요청 횟수")
+        parser.add_argument("--keys", type=int, default=100, help="요청에 사용할 Short URL 수")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+        parser.add_argument("--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음")
+
+    def configure(self, conn_max_age, pool_size):
+        """
+        default connection을 닫고 재사용 설정 변경 (다음 요청부터 적용)
+        """
+        connection = connections[DEFAULT_DB_ALIAS]
+        connection.close()
+        pool = connection.get_pool() if isinstance(connection, PooledDatabaseWrapperMixin) else None
+        if pool is not None:
+            pool.clear()
+
+        connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+        connection.settings_dict["POOL"] = {**(connection.settings_dict.get("POOL") or {}), "SIZE": pool_size}
+
+    def run_redirect(self, application, codes, repeat):
+        """
+        WSGI Redirect dispatcher를 직접 호출하여 측정
+        요청마다 캐시를 비워 DB 조회(요청 시작, 끝의 connection 관리 포함)를 거치도록 합니다.
+        """
+
+        def start_response(status, headers):
+            if not status.startswith("302"):
+                raise RuntimeError(f"unexpected status: {status}")
+
+        samples = []
+        for i in range(repeat):
+            code = codes[i % len(codes)]
+            ShortURLCache.invalidate(Algorithm.base62_decode(code))
+            environ = {"PATH_INFO": f"/{code}", "REQUEST_METHOD": "GET"}
+            setup_testing_defaults(environ)
+
+            started = time.perf_counter()
+            b"".join(application(environ, start_response))
+            samples.append(time.perf_counter() - started)
+        return summarize(samples)
+
+    def run_connect(self, repeat):
+        """
+        connection 생성, 종료만 측정 (pool 없이)
+        """
+        connection = connections[DEFAULT_DB_ALIAS]
+
+        def connect(i):
+            connection.connect()
+            connection.close()
+
+        return summarize(measure(connect, repeat))
+
+    def handle(self, *args, **options):
+        repeat = options["repeat"]
+
+        user = get_benchmark_user()
+        seed_short_urls(user=user, rows=options["rows"], stdout=None if options["json"] else self.stdout)
+        codes = get_benchmark_codes(user=user, count=options["keys"])
+
+        application = RedirectWSGIMiddleware(get_wsgi_application())
+        connection = connections[DEFAULT_DB_ALIAS]
+        original = (connection.settings_dict["CONN_MAX_AGE"], (connection.settings_dict.get("POOL") or {}).get("SIZE", 0))
+
+        report = {"engine": connection.settings_dict["ENGINE"], "keys": len(codes)}
+        try:
+            self.configure(0, 0)
+            report["connect"] = self.run_connect(min(repeat, 200))
+
+            for label, (conn_max_age, pool_size) in self.MODES.items():
+                if pool_size and not isinstance(connection, PooledDatabaseWrapperMixin):
+                    # pool은 core.backends.* ENGINE에서만 사용 가능
+                    report[label] = None
+                    continue
+
+                self.configure(conn_max_age, pool_size)
+                # 첫 요청(연결, 캐시 적재)은 측정에서 제외
+                self.run_redirect(application, codes, len(codes))
+                report[label] = self.run_redirect(application, codes, repeat)
+        finally:
+            self.configure(*original)
+            if not options["keep"]:
+                delete_benchmark_data()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
+            return
+
+        self.stdout.write(f"engine: {report['engine']}, keys: {report['keys']}")
+        for label in ("connect", *self.MODES):
+            result = report[label]
+            if result is None:
+                self.stdout.write(f"[{label}] skipped (ENGINE이 core.backends.* 가 아님)")
+                continue
+            self.stdout.write(f"[{label}] p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms ops/s={result['ops_per_sec']}")
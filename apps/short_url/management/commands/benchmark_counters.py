@@ -0,0 +1,106 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Click Counter Benchmark Command
+"""
+
+# System
+import json
+import time
+import threading
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import F
+
+# Project
+from core.benchmark import summarize
+from apps.short_url.models import ShortURL, ShortURLCounterShard
+from apps.short_url.benchmark import benchmark_url, delete_benchmark_data, get_benchmark_user
+
+
+class Command(BaseCommand):
+    help = "같은 Short URL 하나의 클릭 수를 동시에 증가시킬 때 처리량을 short_url 행 UPDATE와 shard(ShortURLCounterShard) 방식으로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", default="1,2,4,8,16", help="동시 스레드 수 목록 (쉼표 구분)")
+        parser.add_argument("--repeat", type=int, default=2000, help="동시 스레드 수별 전체 증가 횟수")
+        parser.add_argument("--shards", type=int, default=16, help="shard 방식의 Short URL당 shard 수")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+        parser.add_argument("--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음")
+
+    @staticmethod
+    def run(func, repeat, concurrency):
+        """
+        concurrency개 스레드가 func를 나누어 총 repeat번 실행 (스레드마다 DB connection 하나, autocommit)
+        """
+        samples, errors = [], []
+        lock = threading.Lock()
+        barrier = threading.Barrier(concurrency)
+
+        def worker(count):
+            local_samples, local_errors = [], 0
+            try:
+                barrier.wait()
+                for _ in range(count):
+                    started = time.perf_counter()
+                    try:
+                        func()
+                    except Exception:
+                        local_errors += 1
+                        continue
+                    local_samples.append(time.perf_counter() - started)
+            finally:
+                connections.close_all()
+                with lock:
+                    samples.extend(local_samples)
+                    errors.append(local_errors)
+
+        threads = [threading.Thread(target=worker, args=(repeat // concurrency + (i < repeat % concurrency),)) for i in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        return {**summarize(samples, elapsed=elapsed), "errors": sum(errors)}
+
+    def handle(self, *args, **options):
+        concurrency_levels = [int(value) for value in options["concurrency"].split(",") if value.strip()]
+        repeat, shards = options["repeat"], options["shards"]
+
+        user = get_benchmark_user()
+        short_url = ShortURL.objects.create_short_url(url=benchmark_url(f"counter/{int(time.time() * 1000)}"), user=user)
+        short_url_id = short_url.id
+
+        modes = {
+            "row": lambda: ShortURL.objects.filter(id=short_url_id).update(request_count=F("request_count") + 1),
+            "sharded": lambda: ShortURLCounterShard.objects.increment_many({short_url_id: 1}, shards),
+        }
+
+        report = {"engine": connections[DEFAULT_DB_ALIAS].settings_dict["ENGINE"], "repeat": repeat, "shards": shards}
+        try:
+            for label, func in modes.items():
+                report[label] = {str(concurrency): self.run(func, repeat, concurrency) for concurrency in concurrency_levels}
+
+            # 두 방식의 증가가 모두 반영되었는지 확인 (compaction 후 합계)
+            ShortURLCounterShard.objects.compact()
+            short_url.refresh_from_db()
+            expected = sum(repeat - result["errors"] for label in modes for result in report[label].values())
+            report["verified"] = short_url.request_count == expected
+        finally:
+            ShortURLCounterShard.objects.filter(short_url_id=short_url_id).delete()
+            if not options["keep"]:
+                delete_benchmark_data()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
+            return
+
+        self.stdout.write(f"engine: {report['engine']}, repeat: {repeat}, shards: {shards}, verified: {report['verified']}")
+        for concurrency in concurrency_levels:
+            line = [f"[concurrency={concurrency}]"]
+            for label in modes:
+                result = report[label][str(concurrency)]
+                line.append(f"{label}: ops/s={result['ops_per_sec']} p99={result['p99_ms']}ms errors={result['errors']}")
+            self.stdout.write(" ".join(line))
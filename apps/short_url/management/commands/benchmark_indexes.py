@@ -0,0 +1,124 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Index Benchmark Command
+"""
+
+# System
+import json
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+# Project
+from core.algorithm import Algorithm
+from core.benchmark import measure, summarize
+from apps.short_url.models import ShortURL
+from apps.short_url.benchmark import (
+    benchmark_url,
+    delete_benchmark_data,
+    get_benchmark_user,
+    seed_short_urls,
+)
+
+
+class Rollback(Exception):
+    """
+    인덱스 삭제를 되돌리기 위한 예외
+    """
+
+
+class Command(BaseCommand):
+    help = "Short URL 조회 쿼리의 실행 계획과 응답 시간을 인덱스 유무에 따라 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000, help="시딩할 Short URL 수")
+        parser.add_argument("--repeat", type=int, default=200, help="쿼리별 반복 횟수")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+        parser.add_argument("--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음")
+
+    def get_queries(self, user, rows, legacy=False):
+        """
+        측정할 쿼리 목록 (Redirect 조회, URL 중복 검사, 유저별 삭제 조회, 유저별 목록 조회(첫 페이지, 깊은 페이지))
+        legacy이면 Redirect, 삭제 조회를 live_hash_value 이전 방식(hash_value, deleted_at)으로 조회합니다.
+        """
+
+        # 목록 조회: 깊은 페이지(80% 지점)를 OFFSET, keyset(cursor)으로 조회
+        live = ShortURL.objects.filter(user=user, deleted_at=None)
+        depth = int(live.count() * 0.8)
+        cursor = live.order_by("-created_at", "-id").values("created_at", "id")[depth : depth + 1].first() or {"created_at": None, "id": 0}
+
+        def hash_lookup(i):
+            hash_value = Algorithm.hash_url(benchmark_url((i * 7919) % rows))
+            if legacy:
+                return {"hash_value": hash_value, "deleted_at": None}
+            return {"live_hash_value": hash_value}
+
+        return {
+            "redirect": lambda i: ShortURL.objects.filter(**hash_lookup(i)),
+            "duplicate_check": lambda i: ShortURL.objects.filter(url_digest=Algorithm.digest_url(benchmark_url((i * 7919) % rows))),
+            "delete_lookup": lambda i: ShortURL.objects.filter(**hash_lookup(i), user=user),
+            "user_list": lambda i: ShortURL.objects.filter(user=user, deleted_at=None).order_by("-created_at")[:10],
+            "user_list_offset_deep": lambda i: live.order_by("-created_at", "-id")[depth : depth + 10],
+            "user_list_keyset_deep": lambda i: live.filter(
+                Q(created_at__lt=cursor["created_at"]) | Q(id__lt=cursor["id"]), created_at__lte=cursor["created_at"]
+            ).order_by("-created_at", "-id")[:10],
+        }
+
+    def run_queries(self, queries, repeat):
+        results = {}
+        for name, queryset in queries.items():
+            results[name] = {
+                "plan": queryset(0).explain(),
+                **summarize(measure(lambda i: list(queryset(i)), repeat)),
+            }
+        return results
+
+    def run_without_indexes(self, queries, repeat):
+        """
+        트랜잭션 안에서 인덱스를 삭제하고 (legacy 쿼리로) 측정 후 롤백
+        DDL 롤백을 지원하지 않는 DB(MySQL)는 migrate short_url 0001 이후 다시 실행하여 비교합니다.
+        """
+        if not connection.features.can_rollback_ddl:
+            return None
+
+        results = None
+        try:
+            with connection.schema_editor() as editor:
+                for index in ShortURL._meta.indexes:
+                    editor.remove_index(ShortURL, index)
+                results = self.run_queries(queries, repeat)
+                raise Rollback
+        except Rollback:
+            pass
+        return results
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        repeat = options["repeat"]
+
+        user = get_benchmark_user()
+        seed_short_urls(user=user, rows=rows, stdout=None if options["json"] else self.stdout)
+
+        report = {
+            "vendor": connection.vendor,
+            "rows": ShortURL.objects.count(),
+            "with_indexes": self.run_queries(self.get_queries(user=user, rows=rows), repeat),
+            "without_indexes": self.run_without_indexes(self.get_queries(user=user, rows=rows, legacy=True), repeat),
+        }
+
+        if not options["keep"]:
+            delete_benchmark_data()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
+            return
+
+        self.stdout.write(f"vendor: {report['vendor']}, rows: {report['rows']}")
+        for label in ("with_indexes", "without_indexes"):
+            if report[label] is None:
+                self.stdout.write(f"[{label}] skipped (DDL rollback 미지원, 'migrate short_url 0001' 후 다시 실행하여 비교)")
+                continue
+            for name, result in report[label].items():
+                self.stdout.write(f"[{label}] {name}: p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms")
+                self.stdout.write(f"    {result['plan']}")
@@ -0,0 +1,124 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Redirect Benchmark Command
+"""
+
+# System
+import json
+import asyncio
+from wsgiref.util import setup_testing_defaults
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+
+# Project
+from core.benchmark import measure, summarize
+from apps.short_url.models import ShortURL
+from apps.short_url.redirect import RedirectASGIMiddleware, RedirectWSGIMiddleware
+from apps.short_url.benchmark import delete_benchmark_data, get_benchmark_codes, get_benchmark_user, seed_short_urls
+
+
+class Command(BaseCommand):
+    help = "Redirect 요청 처리 시간을 Django 전체 스택과 Redirect dispatcher(WSGI, ASGI)로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="시딩할 Short URL 수")
+        parser.add_argument("--repeat", type=int, default=2000, help="경로별 요청 횟수")
+        parser.add_argument("--keys", type=int, default=100, help="요청에 사용할 Short URL 수 (hot key)")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+        parser.add_argument("--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음")
+
+    def run_wsgi(self, application, codes, repeat):
+        """
+        서버 없이 WSGI application을 직접 호출하여 측정 (핸들러 처리 시간만 측정)
+        """
+
+        def start_response(status, headers):
+            if not status.startswith("302"):
+                raise RuntimeError(f"unexpected status: {status}")
+
+        def request(i):
+            environ = {"PATH_INFO": f"/{codes[i % len(codes)]}", "REQUEST_METHOD": "GET"}
+            setup_testing_defaults(environ)
+            b"".join(application(environ, start_response))
+
+        return summarize(measure(request, repeat))
+
+    def run_asgi(self, application, codes, repeat):
+        """
+        하나의 이벤트 루프에서 ASGI application을 직접 호출하여 측정
+        """
+
+        def make_receive():
+            messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                # 요청 본문 이후에는 연결 종료(http.disconnect)를 기다리는 상태 유지
+                await asyncio.Event().wait()
+
+            return receive
+
+        async def send(message):
+            if message["type"] == "http.response.start" and message["status"] != 302:
+                raise RuntimeError(f"unexpected status: {message['status']}")
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            samples = []
+            for i in range(repeat):
+                scope = {
+                    "type": "http",
+                    "asgi": {"version": "3.0"},
+                    "http_version": "1.1",
+                    "method": "GET",
+                    "scheme": "http",
+                    "path": f"/{codes[i % len(codes)]}",
+                    "raw_path": f"/{codes[i % len(codes)]}".encode(),
+                    "query_string": b"",
+                    "headers": [(b"host", b"localhost")],
+                    "server": ("localhost", 80),
+                }
+                started = loop.time()
+                await application(scope, make_receive(), send)
+                samples.append(loop.time() - started)
+            return samples
+
+        return summarize(asyncio.run(run()))
+
+    def handle(self, *args, **options):
+        repeat = options["repeat"]
+
+        user = get_benchmark_user()
+        seed_short_urls(user=user, rows=options["rows"], stdout=None if options["json"] else self.stdout)
+        codes = get_benchmark_codes(user=user, count=options["keys"])
+
+        wsgi_application = get_wsgi_application()
+        asgi_application = get_asgi_application()
+
+        # 첫 요청(캐시 적재)은 측정에서 제외
+        for application in (wsgi_application, RedirectWSGIMiddleware(wsgi_application)):
+            self.run_wsgi(application, codes, len(codes))
+
+        report = {
+            "rows": ShortURL.objects.count(),
+            "keys": len(codes),
+            "wsgi_django": self.run_wsgi(wsgi_application, codes, repeat),
+            "wsgi_dispatcher": self.run_wsgi(RedirectWSGIMiddleware(wsgi_application), codes, repeat),
+            "asgi_django": self.run_asgi(asgi_application, codes, repeat),
+            "asgi_dispatcher": self.run_asgi(RedirectASGIMiddleware(asgi_application), codes, repeat),
+        }
+
+        if not options["keep"]:
+            delete_benchmark_data()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
+            return
+
+        self.stdout.write(f"rows: {report['rows']}, keys: {report['keys']}")
+        for label in ("wsgi_django", "wsgi_dispatcher", "asgi_django", "asgi_dispatcher"):
+            result = report[label]
+            self.stdout.write(f"[{label}] p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms ops/s={result['ops_per_sec']}")
@@ -0,0 +1,35 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Bloom Filter Snapshot Command
+"""
+
+# System
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Project
+from apps.short_url.bloom import ShortURLBloom
+
+
+class Command(BaseCommand):
+    help = "유효한 Short URL 코드로 Bloom filter를 만들어 snapshot 파일로 저장합니다. 워커는 시작 시 이 파일을 mmap으로 엽니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="저장할 파일 경로 (기본 SHORT_URL_BLOOM[SNAPSHOT_PATH])")
+
+    def handle(self, *args, **options):
+        path = options["output"] or settings.SHORT_URL_BLOOM["SNAPSHOT_PATH"]
+        if not path:
+            raise CommandError("--output 또는 SHORT_URL_BLOOM_SNAPSHOT_PATH를 지정해주세요.")
+
+        started = time.perf_counter()
+        bloom = ShortURLBloom.build()
+        bloom.save(path)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"saved {path}: {len(bloom)} values, {bloom.size // 8} bytes, {bloom.hashes} hashes in {time.perf_counter() - started:.1f}s"
+            )
+        )
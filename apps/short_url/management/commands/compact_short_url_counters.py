@@ -0,0 +1,32 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Click Counter Compaction Command
+"""
+
+# System
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Project
+from apps.short_url.models import ShortURLCounterShard
+
+
+class Command(BaseCommand):
+    help = "클릭 수 shard(ShortURLCounterShard)를 ShortURL.request_count에 합치고 삭제합니다. --interval을 지정하면 주기적으로 반복합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, help="한 트랜잭션에서 합칠 shard 수 (기본 CLICK_COUNTER 설정)")
+        parser.add_argument("--interval", type=int, default=0, help="반복 주기(초), 0이면 한 번만 실행")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"] or settings.CLICK_COUNTER["COMPACT_BATCH_SIZE"]
+        while True:
+            started = time.perf_counter()
+            compacted = ShortURLCounterShard.objects.compact(batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f"compacted {compacted} counter shards in {time.perf_counter() - started:.1f}s"))
+
+            if options["interval"] <= 0:
+                return
+            time.sleep(options["interval"])
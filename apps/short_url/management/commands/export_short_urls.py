@@ -0,0 +1,51 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Export Command
+"""
+
+# System
+from django.core.management.base import BaseCommand, CommandError
+
+# Project
+from apps.users.models import User
+from apps.short_url.export import ShortURLExporter
+from apps.short_url.serializers import ShortURLListSerializer
+
+
+class Command(BaseCommand):
+    help = "유저의 Short URL 목록(code, url, request_count, expiration_date, created_at)을 CSV 또는 NDJSON으로 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", required=True, help="내보낼 유저 이메일")
+        parser.add_argument("--type", choices=list(ShortURLExporter.FORMATS), default="csv", help="파일 형식")
+        parser.add_argument(
+            "--status",
+            choices=[
+                ShortURLListSerializer.STATUS_ALL,
+                ShortURLListSerializer.STATUS_ACTIVE,
+                ShortURLListSerializer.STATUS_EXPIRED,
+                ShortURLListSerializer.STATUS_DELETED,
+            ],
+            default=ShortURLListSerializer.STATUS_ALL,
+            help="상태 필터",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000, help="한 번에 조회할 행 수")
+        parser.add_argument("--output", help="저장할 파일 경로 (기본 stdout)")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"유저를 찾을 수 없습니다: {options['email']}")
+
+        queryset = ShortURLListSerializer.filter_status(user.short_urls.all(), options["status"])
+        exporter = ShortURLExporter(queryset, chunk_size=options["chunk_size"])
+
+        if not options["output"]:
+            for content in exporter.stream(options["type"]):
+                self.stdout.write(content, ending="")
+            return
+
+        with open(options["output"], "w", encoding="utf-8", newline="") as f:
+            for content in exporter.stream(options["type"]):
+                f.write(content)
@@ -0,0 +1,84 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Import Command
+"""
+
+# System
+import io
+import os
+import sys
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+# Project
+from apps.users.models import User
+from apps.short_url.importer import ShortURLImporter
+
+
+class Command(BaseCommand):
+    help = "CSV 또는 NDJSON 파일(또는 stdin)의 URL 목록을 Short URL로 가져옵니다. 중단되면 --offset 또는 --checkpoint로 이어서 가져올 수 있습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", nargs="?", default="-", help="가져올 파일 경로 (기본 stdin: -)")
+        parser.add_argument("--email", required=True, help="가져온 Short URL을 소유할 유저 이메일")
+        parser.add_argument("--type", choices=ShortURLImporter.FORMATS, help="파일 형식 (기본: 확장자가 .ndjson, .jsonl이면 ndjson, 그 외 csv)")
+        parser.add_argument("--batch-size", type=int, default=1000, help="INSERT 한 번에 넣을 행 수")
+        parser.add_argument("--chunk-size", type=int, default=10000, help="트랜잭션 하나에 넣을 행 수")
+        parser.add_argument("--offset", type=int, help="건너뛸 행 수 (헤더 제외)")
+        parser.add_argument("--checkpoint", help="커밋한 행 위치를 기록할 파일 (있으면 그 위치부터 이어서 가져옴)")
+
+    def get_type(self, path):
+        return "ndjson" if os.path.splitext(path)[1] in (".ndjson", ".jsonl") else "csv"
+
+    def read_checkpoint(self, path):
+        if not path or not os.path.exists(path):
+            return 0
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+
+    def write_checkpoint(self, path, position):
+        # 중간에 중단되어도 파일이 비지 않도록 임시 파일을 쓴 뒤 교체
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(str(position))
+        os.replace(temp_path, path)
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"유저를 찾을 수 없습니다: {options['email']}")
+
+        checkpoint = options["checkpoint"]
+        offset = options["offset"] if options["offset"] is not None else self.read_checkpoint(checkpoint)
+        type = options["type"] or self.get_type(options["input"])
+
+        importer = ShortURLImporter(user=user, batch_size=options["batch_size"], chunk_size=options["chunk_size"])
+        started = time.perf_counter()
+
+        def on_progress(position):
+            if checkpoint:
+                self.write_checkpoint(checkpoint, position)
+            stats = importer.stats
+            rate = stats["read"] / max(time.perf_counter() - started, 1e-9)
+            self.stdout.write(
+                f"offset={position} imported={stats['imported']} invalid={stats['invalid']} conflict={stats['conflict']} rows/s={rate:.0f}"
+            )
+
+        if offset:
+            self.stdout.write(f"resume from offset {offset}")
+
+        if options["input"] == "-":
+            stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+            importer.run(stream, type, offset=offset, on_progress=on_progress)
+        else:
+            with open(options["input"], encoding="utf-8", newline="") as stream:
+                importer.run(stream, type, offset=offset, on_progress=on_progress)
+
+        stats = importer.stats
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"read={stats['read']} imported={stats['imported']} invalid={stats['invalid']} conflict={stats['conflict']} elapsed={elapsed:.1f}s"
+            )
+        )
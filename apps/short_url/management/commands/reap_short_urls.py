@@ -0,0 +1,39 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Reaper Command
+"""
+
+# System
+import time
+from django.core.management.base import BaseCommand
+
+# Project
+from apps.short_url.reaper import ShortURLReaper
+
+
+class Command(BaseCommand):
+    help = "삭제 또는 만료 후 보관 기간이 지난 Short URL을 보관 테이블로 옮기고 삭제합니다. --interval을 지정하면 주기적으로 반복합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retention-days", type=int, help="삭제일시 또는 만료일시부터 보관할 일 수 (기본 SHORT_URL_REAPER 설정)")
+        parser.add_argument("--batch-size", type=int, help="한 트랜잭션에서 검사할 PK 범위 크기")
+        parser.add_argument("--sleep", type=float, help="배치 사이 대기 시간(초)")
+        parser.add_argument("--no-archive", action="store_true", help="보관하지 않고 삭제")
+        parser.add_argument("--interval", type=int, default=0, help="반복 주기(초), 0이면 한 번만 실행")
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            deleted = ShortURLReaper.reap(
+                retention_days=options["retention_days"],
+                batch_size=options["batch_size"],
+                sleep=options["sleep"],
+                archive=False if options["no_archive"] else None,
+                stdout=self.stdout,
+            )
+            self.stdout.write(self.style.SUCCESS(f"reaped {deleted} short urls in {time.perf_counter() - started:.1f}s"))
+
+            if options["interval"] <= 0:
+                return
+            time.sleep(options["interval"])
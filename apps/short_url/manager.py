@@ -0,0 +1,291 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Manager
+"""
+
+# System
+import random
+from collections import defaultdict
+from datetime import datetime
+from django.conf import settings
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.constants import OnConflict
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save
+
+# Project
+from core.algorithm import Algorithm
+
+
+class ShortURLQuerySet(models.QuerySet):
+    def with_request_count(self):
+        """
+        request_count에 아직 합치지 않은 클릭 수 shard(ShortURLCounterShard)를 더한 total_request_count 추가
+        shard는 (short_url, shard) unique index로 Short URL마다 최대 SHARDS개만 읽습니다.
+        """
+        if "total_request_count" in self.query.annotations:
+            return self
+
+        shard_model = self.model._meta.get_field("counter_shards").related_model
+        shards = shard_model.objects.filter(short_url=OuterRef("pk")).order_by().values("short_url").annotate(total=Sum("count")).values("total")
+        return self.annotate(
+            total_request_count=F("request_count") + Coalesce(Subquery(shards, output_field=models.BigIntegerField()), Value(0)),
+        )
+
+
+class ShortURLManager(models.Manager.from_queryset(ShortURLQuerySet)):
+    """
+    Short URL 모델 관리자로, 코드 생성과 함께 Short URL 생성을 처리합니다.
+    """
+
+    def _get_write_db(self):
+        """
+        쓰기용 DB alias (self.db는 조회용이므로 replica일 수 있음)
+        """
+        return self._db or router.db_for_write(self.model)
+
+    def create_short_url(self, url, user, expiration_date=None):
+        """
+        설정된 코드 생성기로 Short URL을 생성하여 반환합니다.
+
+        코드가 이미 사용 중이면(unique 충돌) 다음 코드로 다시 시도하고,
+        재시도 횟수를 모두 사용하면 None을 반환합니다.
+        """
+        for attempt in range(settings.SHORT_URL_CODE["MAX_ATTEMPTS"]):
+            hash_value = Algorithm.generate_code(url=url, attempt=attempt)
+            try:
+                with transaction.atomic(using=self._get_write_db()):
+                    return self.create(
+                        url=url,
+                        hash_value=hash_value,
+                        expiration_date=expiration_date,
+                        user=user,
+                    )
+            except IntegrityError:
+                continue
+        return None
+
+    def create_alias_short_url(self, url, alias, user, expiration_date=None):
+        """
+        사용자 지정 코드(alias)로 Short URL을 생성하여 반환합니다.
+        alias 또는 URL이 이미 사용 중이면(unique 충돌) None을 반환합니다.
+        """
+        try:
+            with transaction.atomic(using=self._get_write_db()):
+                return self.create(
+                    url=url,
+                    alias=alias,
+                    hash_value=Algorithm.resolve_code(alias),
+                    expiration_date=expiration_date,
+                    user=user,
+                )
+        except IntegrityError:
+            return None
+
+    def _insert_sql(self, connection, url, url_digest, hash_value, user, expiration_date, on_conflict=None):
+        """
+        Short URL 한 건 INSERT 문과 파라미터 (on_conflict가 있으면 충돌을 무시하는 INSERT)
+        """
+        ops = connection.ops
+        now = ops.adapt_datetimefield_value(datetime.now())
+
+        columns = ["url", "url_digest", "hash_value", "request_count", "expiration_date", "user_id", "created_at", "updated_at"]
+        params = [url, url_digest, hash_value, 0, ops.adapt_datetimefield_value(expiration_date), user.pk, now, now]
+        sql = "{insert} {table} ({columns}) VALUES ({values}) {suffix}".format(
+            insert=ops.insert_statement(on_conflict=on_conflict),
+            table=ops.quote_name(self.model._meta.db_table),
+            columns=", ".join(ops.quote_name(column) for column in columns),
+            values=", ".join(["%s"] * len(columns)),
+            suffix=ops.on_conflict_suffix_sql([], on_conflict, [], []),
+        )
+        return sql.strip(), params, now
+
+    def _insert_or_get(self, url, url_digest, hash_value, user, expiration_date):
+        """
+        INSERT 한 번으로 생성하거나 같은 url_digest를 가진 기존 행의 코드를 가져옵니다.
+        (id, hash value, 생성 여부)를 반환하고, 생성한 코드가 다른 URL과 충돌하면 None을 반환합니다.
+        기존 행은 요청한 사용자의 만료되지 않은 행일 때만 코드를 반환하고, 아니면 hash value는 None입니다.
+        (삭제된 행은 url_digest가 NULL이므로 충돌하지 않음)
+
+        - PostgreSQL, SQLite: ON CONFLICT (url_digest) DO UPDATE ... RETURNING
+          생성 여부는 반환된 created_at이 이번에 넣은 값과 같은지로 판단합니다.
+        - MySQL: RETURNING이 없으므로 _insert_ignore_or_get
+        """
+        connection = connections[self._get_write_db()]
+        if connection.vendor == "mysql":
+            return self._insert_ignore_or_get(url, url_digest, hash_value, user, expiration_date)
+
+        sql, params, now = self._insert_sql(connection, url, url_digest, hash_value, user, expiration_date)
+        try:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                # 만료일시 NULL 검사는 COALESCE로 (SQLite 3.40에서 upsert RETURNING의 "IS NULL"이 NULL 값에도 거짓으로 평가됨)
+                cursor.execute(
+                    sql + " ON CONFLICT (url_digest) DO UPDATE SET url_digest = EXCLUDED.url_digest "
+                    "RETURNING id, hash_value, created_at = %s, user_id = %s AND COALESCE(expiration_date > %s, TRUE)",
+                    params + [now, user.pk, now],
+                )
+                id, stored_hash_value, created, usable = cursor.fetchone()
+                if not created and not usable:
+                    stored_hash_value = None
+                return id, stored_hash_value, bool(created)
+        except IntegrityError:
+            return None
+
+    def _insert_ignore_or_get(self, url, url_digest, hash_value, user, expiration_date):
+        """
+        _insert_or_get과 같은 결과를 충돌을 무시하는 INSERT(MySQL INSERT IGNORE) 후 url_digest 조회로 구합니다.
+        INSERT 되지 않았는데 같은 url_digest가 없으면 코드(hash_value) 충돌입니다.
+        (INSERT IGNORE는 unique 충돌 외의 오류도 경고로 바꾸지만, 값은 serializer에서 검증하므로 unique 충돌만 발생)
+        """
+        connection = connections[self._get_write_db()]
+        sql, params, _ = self._insert_sql(connection, url, url_digest, hash_value, user, expiration_date, on_conflict=OnConflict.IGNORE)
+
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                if cursor.rowcount == 1:
+                    return cursor.lastrowid, hash_value, True
+
+            existing = (
+                self.using(connection.alias).filter(url_digest=url_digest).values_list("id", "hash_value", "user_id", "expiration_date").first()
+            )
+        if existing is None:
+            return None
+
+        id, stored_hash_value, user_id, existing_expiration_date = existing
+        if user_id != user.pk or (existing_expiration_date and existing_expiration_date <= datetime.now()):
+            stored_hash_value = None
+        return id, stored_hash_value, False
+
+    def create_or_get_short_url(self, url, user, expiration_date=None):
+        """
+        URL digest unique index를 이용해 Short URL을 생성하거나, 이미 유효한 같은 URL이 있으면 그 코드를 반환합니다.
+        (hash value, 생성 여부)를 반환하고, 코드 충돌로 재시도 횟수를 모두 사용하면 None을 반환합니다.
+        같은 URL이 다른 사용자의 행이거나 만료되었거나 코드 없이 저장된 기존 행이면 hash value는 None입니다.
+        (url_digest는 사용자와 관계없이 unique이므로 새로 만들 수 없고, 다른 사용자의 코드는 알려주지 않음)
+
+        중복 확인과 생성이 하나의 INSERT 문이므로 동시에 같은 URL을 요청해도 하나만 생성됩니다.
+        """
+        url_digest = Algorithm.digest_url(url)
+        for attempt in range(settings.SHORT_URL_CODE["MAX_ATTEMPTS"]):
+            result = self._insert_or_get(url, url_digest, Algorithm.generate_code(url=url, attempt=attempt), user, expiration_date)
+            if result is None:
+                continue
+
+            id, hash_value, created = result
+            if created:
+                # raw INSERT는 signal이 발생하지 않으므로 직접 보냄 (Redirect 캐시 무효화, Bloom filter 추가)
+                instance = self.model(id=id, url=url, url_digest=url_digest, hash_value=hash_value, expiration_date=expiration_date, user=user)
+                post_save.send(sender=self.model, instance=instance, created=True, update_fields=None, raw=False, using=self._get_write_db())
+            return hash_value, created
+        return None
+
+    def bulk_create_short_urls(self, items, user, batch_size=1000):
+        """
+        (url, expiration_date) 목록을 batch_size 단위 bulk_create로 생성하고,
+        입력 순서대로 생성된 Short URL(실패 시 None) 목록을 반환합니다.
+
+        배치 안에서 코드가 겹치지 않도록 생성하고,
+        기존 코드 또는 URL과 충돌해 배치가 실패하면 해당 배치만 한 건씩 생성-또는-조회로 재시도합니다.
+        (요청한 사용자의 만료되지 않은 같은 URL이 있으면 그 코드를 가진 저장되지 않은 Short URL을 반환)
+        """
+        created = []
+        for start in range(0, len(items), batch_size):
+            batch = items[start : start + batch_size]
+
+            objs = []
+            used = set()
+            for url, expiration_date in batch:
+                attempt = 0
+                hash_value = Algorithm.generate_code(url=url, attempt=attempt)
+                while hash_value in used:
+                    attempt += 1
+                    hash_value = Algorithm.generate_code(url=url, attempt=attempt)
+                used.add(hash_value)
+                objs.append(self.model(url=url, hash_value=hash_value, expiration_date=expiration_date, user=user))
+
+            try:
+                with transaction.atomic(using=self._get_write_db()):
+                    created += self.bulk_create(objs)
+            except IntegrityError:
+                for url, expiration_date in batch:
+                    result = self.create_or_get_short_url(url=url, user=user, expiration_date=expiration_date)
+                    hash_value = result and result[0]
+                    created.append(
+                        None if hash_value is None else self.model(url=url, hash_value=hash_value, expiration_date=expiration_date, user=user)
+                    )
+        return created
+
+
+class ShortURLCounterShardManager(models.Manager):
+    """
+    Short URL 클릭 수 shard 관리자로, shard 증가, 합산 조회, request_count로 합치기(compaction)를 처리합니다.
+    """
+
+    def increment_many(self, counts, shards, batch_size=1000):
+        """
+        {Short URL id: 증가량}을 Short URL마다 무작위 shard 하나에 더함
+        batch_size건씩 INSERT 한 번으로 처리하고, 이미 있는 shard는 충돌 시 더합니다.
+        (여러 워커가 같은 Short URL을 동시에 증가시켜도 잠금이 shard 수만큼 나뉨)
+        """
+        connection = connections[router.db_for_write(self.model)]
+        ops = connection.ops
+        table = ops.quote_name(self.model._meta.db_table)
+        count_column = ops.quote_name("count")
+        if connection.vendor == "mysql":
+            suffix = f"ON DUPLICATE KEY UPDATE {count_column} = {count_column} + VALUES({count_column})"
+        else:
+            suffix = f"ON CONFLICT (short_url_id, shard) DO UPDATE SET {count_column} = {table}.{count_column} + EXCLUDED.{count_column}"
+
+        # 동시에 실행되는 INSERT끼리 잠금 순서가 같도록 정렬
+        rows = sorted((short_url_id, random.randrange(shards), count) for short_url_id, count in counts.items())
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                cursor.execute(
+                    f"INSERT INTO {table} (short_url_id, shard, {count_column}) VALUES {', '.join(['(%s, %s, %s)'] * len(batch))} {suffix}",
+                    [value for row in batch for value in row],
+                )
+
+    def get_totals(self, short_url_ids):
+        """
+        Short URL별 아직 request_count에 합치지 않은 클릭 수 {id: 합계}
+        """
+        queryset = self.filter(short_url_id__in=short_url_ids).values("short_url_id").annotate(total=Sum("count")).order_by()
+        return {row["short_url_id"]: row["total"] for row in queryset}
+
+    def compact(self, batch_size=1000):
+        """
+        shard를 id 순서로 batch_size건씩 ShortURL.request_count에 더하고 삭제 (합친 shard 수 반환)
+        배치마다 shard 행을 잠근 뒤(select_for_update) Short URL을 UPDATE 하므로, 그 사이 들어온 증가는 다음 실행에서 합칩니다.
+        """
+        short_url_model = self.model._meta.get_field("short_url").related_model
+        compacted = 0
+        last_id = 0
+        while True:
+            with transaction.atomic(using=router.db_for_write(self.model)):
+                rows = list(self.filter(id__gt=last_id).order_by("id").select_for_update().values_list("id", "short_url_id", "count")[:batch_size])
+                if not rows:
+                    return compacted
+
+                totals = defaultdict(int)
+                for _, short_url_id, count in rows:
+                    totals[short_url_id] += count
+
+                # 증가량이 같은 Short URL은 하나의 UPDATE로 묶음
+                grouped = defaultdict(list)
+                for short_url_id, total in totals.items():
+                    if total:
+                        grouped[total].append(short_url_id)
+                for total, short_url_ids in grouped.items():
+                    short_url_model.objects.filter(id__in=short_url_ids).update(request_count=F("request_count") + total)
+
+                # 이번 배치에서 잠그고 합친 shard만 삭제
+                self.filter(id__in=[row[0] for row in rows]).delete()
+
+            compacted += len(rows)
+            last_id = rows[-1][0]
+            if len(rows) < batch_size:
+                return compacted
@@ -0,0 +1,75 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:07
+
+import logging
+from datetime import datetime
+from django.conf import settings
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+
+def soft_delete_live_duplicates(apps, schema_editor):
+    """
+    unique index 추가 전 같은 hash value를 가진 삭제되지 않은 행 정리
+    (hash value를 잘라 쓰던 코드 생성으로 이미 충돌한 행이 있을 수 있음)
+    가장 먼저 생성된(id가 작은) 행만 남기고 나머지는 soft delete 하며, 정리한 id를 로그로 남깁니다.
+    """
+    ShortURL = apps.get_model("short_url", "ShortURL")
+
+    duplicates = (
+        ShortURL.objects.filter(deleted_at=None, hash_value__isnull=False)
+        .values("hash_value")
+        .annotate(count=models.Count("id"), first_id=models.Min("id"))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    now = datetime.now()
+    for row in list(duplicates):
+        ids = list(ShortURL.objects.filter(deleted_at=None, hash_value=row["hash_value"]).exclude(id=row["first_id"]).values_list("id", flat=True))
+        ShortURL.objects.filter(id__in=ids).update(deleted_at=now)
+        logger.warning("short_url %s: kept id %s, soft deleted duplicate live ids %s", row["hash_value"], row["first_id"], ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shorturl",
+            name="live_hash_value",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(deleted_at__isnull=True, then=models.F("hash_value")),
+                    default=None,
+                ),
+                output_field=models.CharField(max_length=100, null=True),
+                verbose_name="유효 hash value",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shorturl",
+            index=models.Index(fields=["hash_value", "deleted_at"], name="short_url_hash_deleted_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="shorturl",
+            index=models.Index(fields=["url", "deleted_at"], name="short_url_url_deleted_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="shorturl",
+            index=models.Index(
+                fields=["user", "deleted_at", "created_at"],
+                name="short_url_user_deleted_idx",
+            ),
+        ),
+        # 이미 충돌한 hash value는 가장 오래된 행만 남기고 정리한 뒤 unique index 추가
+        migrations.RunPython(soft_delete_live_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="shorturl",
+            constraint=models.UniqueConstraint(fields=("live_hash_value",), name="short_url_live_hash_unique"),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:40
+
+from django.db import migrations, models
+
+
+def hex_to_integer(apps, schema_editor):
+    """
+    16진수 문자열 hash value를 정수로 변환
+    """
+    ShortURL = apps.get_model("short_url", "ShortURL")
+
+    objs = []
+    for pk, hash_value in ShortURL.objects.values_list("id", "hash_value").iterator(chunk_size=2000):
+        try:
+            hash_key = int(hash_value, 16)
+        except (TypeError, ValueError):
+            hash_key = None
+        objs.append(ShortURL(id=pk, hash_key=hash_key))
+
+        if len(objs) >= 2000:
+            ShortURL.objects.bulk_update(objs, ["hash_key"])
+            objs = []
+    ShortURL.objects.bulk_update(objs, ["hash_key"])
+
+
+def integer_to_hex(apps, schema_editor):
+    """
+    정수 hash value를 10자리 16진수 문자열로 되돌림
+    """
+    ShortURL = apps.get_model("short_url", "ShortURL")
+
+    objs = []
+    for pk, hash_key in ShortURL.objects.values_list("id", "hash_key").iterator(chunk_size=2000):
+        objs.append(ShortURL(id=pk, hash_value="" if hash_key is None else format(hash_key, "010x")))
+
+        if len(objs) >= 2000:
+            ShortURL.objects.bulk_update(objs, ["hash_value"])
+            objs = []
+    ShortURL.objects.bulk_update(objs, ["hash_value"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0002_short_url_indexes"),
+    ]
+
+    operations = [
+        # hash_value를 참조하는 generated column, index 제거
+        migrations.RemoveConstraint(
+            model_name="shorturl",
+            name="short_url_live_hash_unique",
+        ),
+        migrations.RemoveIndex(
+            model_name="shorturl",
+            name="short_url_hash_deleted_idx",
+        ),
+        migrations.RemoveField(
+            model_name="shorturl",
+            name="live_hash_value",
+        ),
+        # 정수 컬럼으로 데이터 이전 (되돌릴 때 기존 컬럼을 먼저 만들 수 있도록 nullable로 변경)
+        migrations.AlterField(
+            model_name="shorturl",
+            name="hash_value",
+            field=models.CharField(max_length=100, null=True, verbose_name="hash value"),
+        ),
+        migrations.AddField(
+            model_name="shorturl",
+            name="hash_key",
+            field=models.BigIntegerField(null=True, verbose_name="hash value"),
+        ),
+        migrations.RunPython(hex_to_integer, integer_to_hex),
+        migrations.RemoveField(
+            model_name="shorturl",
+            name="hash_value",
+        ),
+        migrations.RenameField(
+            model_name="shorturl",
+            old_name="hash_key",
+            new_name="hash_value",
+        ),
+        # 정수 hash value 기준으로 generated column, unique index 재생성
+        migrations.AddField(
+            model_name="shorturl",
+            name="live_hash_value",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(models.When(deleted_at__isnull=True, then=models.F("hash_value")), default=None),
+                output_field=models.BigIntegerField(null=True),
+                verbose_name="유효 hash value",
+            ),
+        ),
+        # 중복은 0002에서 이미 정리했고, 10자리 소문자 16진수 hash value는 정수와 1:1로 변환되므로 다시 정리하지 않음
+        migrations.AddConstraint(
+            model_name="shorturl",
+            constraint=models.UniqueConstraint(fields=("live_hash_value",), name="short_url_live_hash_unique"),
+        ),
+    ]
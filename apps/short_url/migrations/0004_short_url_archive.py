@@ -0,0 +1,58 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0003_short_url_integer_hash_value"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShortURLArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "short_url_id",
+                    models.BigIntegerField(unique=True, verbose_name="short url id"),
+                ),
+                ("url", models.URLField(verbose_name="origin url")),
+                (
+                    "hash_value",
+                    models.BigIntegerField(null=True, verbose_name="hash value"),
+                ),
+                (
+                    "request_count",
+                    models.IntegerField(default=0, verbose_name="요청 횟수"),
+                ),
+                (
+                    "expiration_date",
+                    models.DateTimeField(blank=True, null=True, verbose_name="만료일시"),
+                ),
+                (
+                    "deleted_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="삭제일시"),
+                ),
+                ("user_id", models.BigIntegerField(verbose_name="user id")),
+                ("created_at", models.DateTimeField(verbose_name="생성시간")),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="보관시간"),
+                ),
+            ],
+            options={
+                "db_table": "short_url_archive",
+                "indexes": [models.Index(fields=["hash_value"], name="short_url_archive_hash_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:41
+
+import hashlib
+import logging
+from datetime import datetime
+import apps.short_url.fields
+from django.conf import settings
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+
+def fill_url_digest(apps, schema_editor):
+    """
+    삭제되지 않은 Short URL의 url_digest 채우기
+    같은 URL이 여러 개 있으면 가장 먼저 생성된(id가 작은) 행만 digest를 가지고, 나머지는 soft delete 합니다.
+    (digest 없이 남겨두면 이후 save()에서 digest가 채워져 IntegrityError 발생)
+    모든 행의 digest를 채운 뒤 DB에서 digest로 묶어 중복을 찾으므로, 행 수에 비례하는 메모리를 사용하지 않습니다.
+    """
+    ShortURL = apps.get_model("short_url", "ShortURL")
+
+    objs = []
+    for pk, url in ShortURL.objects.filter(deleted_at=None).values_list("id", "url").iterator(chunk_size=2000):
+        objs.append(ShortURL(id=pk, url_digest=hashlib.sha256(url.encode()).hexdigest()))
+
+        if len(objs) >= 2000:
+            ShortURL.objects.bulk_update(objs, ["url_digest"])
+            objs = []
+    ShortURL.objects.bulk_update(objs, ["url_digest"])
+
+    groups = (
+        ShortURL.objects.filter(deleted_at=None)
+        .values("url_digest")
+        .annotate(count=models.Count("id"), first_id=models.Min("id"))
+        .filter(count__gt=1)
+        .values_list("url_digest", "first_id")
+    )
+
+    now = datetime.now()
+    duplicates = []
+    for digest, first_id in groups.iterator(chunk_size=2000):
+        ids = list(ShortURL.objects.filter(deleted_at=None, url_digest=digest).exclude(id=first_id).values_list("id", flat=True))
+        ShortURL.objects.filter(id__in=ids).update(deleted_at=now, url_digest=None)
+        duplicates.extend(ids)
+    if duplicates:
+        logger.warning("short_url url_digest: soft deleted duplicate live ids %s", sorted(duplicates))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0004_short_url_archive"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shorturl",
+            name="url_digest",
+            field=apps.short_url.fields.URLDigestField(null_if="deleted_at", source="url", verbose_name="url digest"),
+        ),
+        # URL 중복 검사 index는 digest를 채운 뒤 제거
+        migrations.RunPython(fill_url_digest, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="shorturl",
+            name="short_url_url_deleted_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="shorturl",
+            constraint=models.UniqueConstraint(fields=("url_digest",), name="short_url_url_digest_unique"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0005_short_url_url_digest"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shorturl",
+            name="alias",
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name="alias"),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("short_url", "0006_short_url_alias"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShortURLCounterShard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("shard", models.PositiveSmallIntegerField(verbose_name="shard")),
+                ("count", models.BigIntegerField(default=0, verbose_name="클릭 수")),
+                (
+                    "short_url",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="counter_shards",
+                        to="short_url.shorturl",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "short_url_counter_shard",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="shorturlcountershard",
+            constraint=models.UniqueConstraint(fields=("short_url", "shard"), name="short_url_counter_shard_unique"),
+        ),
+    ]
@@ -6,9 +6,12 @@
 
 # System
 from django.db import models
+from django.db.models import Case, F, When
 
 # Project
 from core.models import BaseModel
+from apps.short_url.fields import URLDigestField
+from apps.short_url.manager import ShortURLCounterShardManager, ShortURLManager
 
 
 class ShortURL(BaseModel):
@@ -17,16 +20,90 @@ class ShortURL(BaseModel):
     """
 
     url = models.URLField(verbose_name="origin url")
-    hash_value = models.CharField(max_length=100, verbose_name="hash value")
+    # 삭제되지 않은 URL만 가지는 URL의 SHA-256 (저장 시 자동으로 채우고 삭제 시 NULL)
+    # 유효 URL 중복을 unique index로 막고, 생성-또는-조회(INSERT ... ON CONFLICT)에 사용
+    url_digest = URLDigestField(source="url", null_if="deleted_at", verbose_name="url digest")
+    hash_value = models.BigIntegerField(null=True, verbose_name="hash value")
+    # 사용자 지정 코드 (표시용, 조회와 중복 검사는 Algorithm.resolve_code로 변환한 hash_value로 처리)
+    alias = models.CharField(max_length=64, null=True, blank=True, verbose_name="alias")
     request_count = models.IntegerField(default=0, verbose_name="요청 횟수")
     expiration_date = models.DateTimeField(null=True, blank=True, verbose_name="만료일시")
     deleted_at = models.DateTimeField(null=True, blank=True, verbose_name="삭제일시")
 
+    # 삭제되지 않은 URL만 hash value를 가지는 컬럼 (NULL은 unique 검사에서 제외)
+    # MySQL은 조건부(partial) unique index를 지원하지 않으므로 generated column으로 대체
+    # Redirect, 삭제 조회는 이 컬럼의 unique index로 한 건을 바로 찾습니다.
+    live_hash_value = models.GeneratedField(
+        expression=Case(When(deleted_at__isnull=True, then=F("hash_value")), default=None),
+        output_field=models.BigIntegerField(null=True),
+        db_persist=True,
+        verbose_name="유효 hash value",
+    )
+
     user = models.ForeignKey(
         "users.User",
         on_delete=models.CASCADE,
         related_name="short_urls",
     )
 
+    objects = ShortURLManager()
+
     class Meta:
         db_table = "short_url"
+        indexes = [
+            # 유저별 삭제 조회, 목록 조회
+            models.Index(fields=["user", "deleted_at", "created_at"], name="short_url_user_deleted_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["live_hash_value"], name="short_url_live_hash_unique"),
+            models.UniqueConstraint(fields=["url_digest"], name="short_url_url_digest_unique"),
+        ]
+
+
+class ShortURLCounterShard(models.Model):
+    """
+    Short URL 클릭 수 shard 모델입니다.
+    클릭 수를 Short URL마다 여러 행(shard)에 나누어 더해 한 행의 잠금에 동시 UPDATE가 몰리지 않도록 하고,
+    compact_short_url_counters로 주기적으로 ShortURL.request_count에 합칩니다.
+    """
+
+    # Reaper가 Short URL을 한 번의 DELETE로 삭제하므로 DB FK 제약 없이 사용 (남은 shard는 compaction에서 정리)
+    short_url = models.ForeignKey(
+        "short_url.ShortURL",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="counter_shards",
+    )
+    shard = models.PositiveSmallIntegerField(verbose_name="shard")
+    count = models.BigIntegerField(default=0, verbose_name="클릭 수")
+
+    objects = ShortURLCounterShardManager()
+
+    class Meta:
+        db_table = "short_url_counter_shard"
+        constraints = [
+            models.UniqueConstraint(fields=["short_url", "shard"], name="short_url_counter_shard_unique"),
+        ]
+
+
+class ShortURLArchive(models.Model):
+    """
+    보관 기간이 지나 short_url 테이블에서 정리된 Short URL 보관 모델입니다.
+    유저가 탈퇴해도 보관 기록은 남도록 user는 FK 없이 id만 저장합니다.
+    """
+
+    short_url_id = models.BigIntegerField(unique=True, verbose_name="short url id")
+    url = models.URLField(verbose_name="origin url")
+    hash_value = models.BigIntegerField(null=True, verbose_name="hash value")
+    request_count = models.IntegerField(default=0, verbose_name="요청 횟수")
+    expiration_date = models.DateTimeField(null=True, blank=True, verbose_name="만료일시")
+    deleted_at = models.DateTimeField(null=True, blank=True, verbose_name="삭제일시")
+    user_id = models.BigIntegerField(verbose_name="user id")
+    created_at = models.DateTimeField(verbose_name="생성시간")
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="보관시간")
+
+    class Meta:
+        db_table = "short_url_archive"
+        indexes = [
+            models.Index(fields=["hash_value"], name="short_url_archive_hash_idx"),
+        ]
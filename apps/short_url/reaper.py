@@ -0,0 +1,99 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Reaper
+"""
+
+# System
+import time
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Min, Q
+
+# Project
+from apps.short_url.models import ShortURL, ShortURLArchive, ShortURLCounterShard
+
+
+class ShortURLReaper:
+    """
+    삭제일시 또는 만료일시부터 보관 기간(RETENTION_DAYS)이 지난 Short URL을 보관(ShortURLArchive) 후 삭제
+    PK 범위(BATCH_SIZE) 단위로 짧은 트랜잭션을 반복하므로 긴 잠금을 잡지 않고, 배치 사이에 SLEEP만큼 쉬어 부하를 조절합니다.
+    """
+
+    ARCHIVE_FIELDS = ("id", "url", "hash_value", "request_count", "expiration_date", "deleted_at", "user_id", "created_at")
+
+    @classmethod
+    def _get_config(cls):
+        return settings.SHORT_URL_REAPER
+
+    @classmethod
+    def get_queryset(cls, cutoff):
+        return ShortURL.objects.filter(Q(deleted_at__lte=cutoff) | Q(expiration_date__lte=cutoff))
+
+    @classmethod
+    def reap_batch(cls, start, end, cutoff, archive=True):
+        """
+        id가 [start, end) 범위인 정리 대상을 보관 후 삭제하고 삭제한 행 수 반환
+        """
+        with transaction.atomic():
+            rows = list(cls.get_queryset(cutoff).filter(id__gte=start, id__lt=end).select_for_update().values_list(*cls.ARCHIVE_FIELDS))
+            if not rows:
+                return 0
+
+            # 아직 request_count에 합치지 않은 클릭 수 shard도 함께 보관 후 삭제
+            ids = [row[0] for row in rows]
+            totals = ShortURLCounterShard.objects.get_totals(ids)
+            ShortURLCounterShard.objects.filter(short_url_id__in=ids).delete()
+
+            if archive:
+                ShortURLArchive.objects.bulk_create(
+                    [
+                        ShortURLArchive(
+                            short_url_id=id,
+                            url=url,
+                            hash_value=hash_value,
+                            request_count=request_count + totals.get(id, 0),
+                            expiration_date=expiration_date,
+                            deleted_at=deleted_at,
+                            user_id=user_id,
+                            created_at=created_at,
+                        )
+                        for id, url, hash_value, request_count, expiration_date, deleted_at, user_id, created_at in rows
+                    ],
+                    ignore_conflicts=True,
+                )
+
+            # 이번 배치에서 잠근 id만 삭제 (post_delete signal로 Redirect 캐시도 무효화)
+            ShortURL.objects.filter(id__in=ids).delete()
+
+        return len(rows)
+
+    @classmethod
+    def reap(cls, retention_days=None, batch_size=None, sleep=None, archive=None, stdout=None):
+        """
+        정리 대상의 PK 범위(최소 id ~ 최대 id)를 batch_size 단위로 나누어 정리하고 삭제한 행 수 반환
+        정리할 행이 없는 범위는 쉬지 않고 넘어갑니다.
+        """
+        config = cls._get_config()
+        retention_days = config["RETENTION_DAYS"] if retention_days is None else retention_days
+        batch_size = batch_size or config["BATCH_SIZE"]
+        sleep = config["SLEEP"] if sleep is None else sleep
+        archive = config["ARCHIVE"] if archive is None else archive
+
+        cutoff = datetime.now() - timedelta(days=retention_days)
+        bounds = cls.get_queryset(cutoff).aggregate(first=Min("id"), last=Max("id"))
+        if bounds["first"] is None:
+            return 0
+
+        total = 0
+        for start in range(bounds["first"], bounds["last"] + 1, batch_size):
+            deleted = cls.reap_batch(start, start + batch_size, cutoff, archive=archive)
+            total += deleted
+            if not deleted:
+                continue
+            if stdout:
+                stdout.write(f"id {start}~{start + batch_size - 1}: {deleted} (total {total})")
+            if sleep:
+                time.sleep(sleep)
+        return total
@@ -0,0 +1,205 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Redirect Fast Path
+"""
+
+# System
+import re
+import functools
+from datetime import datetime
+from django.conf import settings
+from django.core import signals
+from django.utils.encoding import iri_to_uri
+
+# Project
+from core import codec
+from core.algorithm import Algorithm
+from core.constants import SYSTEM_CODE
+from core.instrumentation import Instrumentation
+from core.renderers import render_error
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.aliases import ShortURLAlias
+from apps.short_url.counters import ClickCounter
+from apps.short_url.hotkeys import ShortURLHotKeys
+from apps.analytics.events import ClickEvents
+
+# Short URL 최대 길이 (64bit hash value의 Base62 길이, alias 최대 길이 중 큰 값)
+MAX_CODE_LENGTH = max(codec.MAX_WIDTH, settings.SHORT_URL_ALIAS["MAX_LENGTH"])
+
+# Fast path가 처리하는 경로 (GET /<Base62 코드 또는 alias>), 나머지는 Django로 넘김
+REDIRECT_PATH = re.compile(r"^/([0-9A-Za-z_-]{1,%d})$" % MAX_CODE_LENGTH)
+
+
+@functools.lru_cache(maxsize=None)
+def get_django_paths():
+    """
+    코드 형식이지만 Django가 처리하는 경로 (/admin, /api, /metrics 등 URL 경로의 첫 단어)
+    Django가 APPEND_SLASH(/admin -> /admin/) 등으로 처리하도록 dispatcher가 넘깁니다.
+    URLconf를 읽으므로 모듈 import 시점이 아닌 첫 요청에서 계산합니다. (순환 참조 방지)
+    """
+    return frozenset(ShortURLAlias.get_route_words())
+
+
+# 측정 기록용 view 이름 (Django view와 같은 이름)
+REDIRECT_VIEW = "get-redirect"
+
+
+def _check_entry(short_url):
+    """
+    캐시 조회 결과 검사
+    (Short URL 정보, None) 또는 실패 시 (None, SYSTEM_CODE) 반환
+    """
+    if not short_url:
+        return None, SYSTEM_CODE.SHORT_URL_NOT_FOUND
+
+    if short_url["expiration_date"] and short_url["expiration_date"] < datetime.now():
+        return None, SYSTEM_CODE.SHORT_URL_EXPIRED
+
+    return short_url, None
+
+
+def resolve_redirect(code, referrer="", user_agent="", ip=None):
+    """
+    Short URL 코드를 원본 URL로 변환하고 클릭 수, 클릭 이벤트를 기록
+    (원본 URL, None) 또는 실패 시 (None, SYSTEM_CODE) 반환
+    """
+    if len(code) > MAX_CODE_LENGTH:
+        return None, SYSTEM_CODE.INVALID_FORMAT
+
+    decoded = Algorithm.resolve_code(code)
+    if decoded is None:
+        return None, SYSTEM_CODE.SHORT_URL_NOT_FOUND
+
+    # LRU -> 공유 캐시 -> DB 순으로 조회
+    short_url, error = _check_entry(ShortURLCache.resolve(decoded))
+    if error:
+        return None, error
+
+    # 클릭 수, 클릭 이벤트는 버퍼에 누적 후 백그라운드에서 반영 (hot key는 공유 카운터를 나누어 누적)
+    ClickCounter.record(short_url["id"], shards=ShortURLHotKeys.observe(decoded))
+    ClickEvents.record(short_url["id"], referrer=referrer, user_agent=user_agent, ip=ip)
+
+    return short_url["url"], None
+
+
+async def aresolve_redirect(code, referrer="", user_agent="", ip=None):
+    """
+    resolve_redirect의 비동기 버전
+    """
+    if len(code) > MAX_CODE_LENGTH:
+        return None, SYSTEM_CODE.INVALID_FORMAT
+
+    decoded = Algorithm.resolve_code(code)
+    if decoded is None:
+        return None, SYSTEM_CODE.SHORT_URL_NOT_FOUND
+
+    # LRU -> 공유 캐시 -> DB 순으로 조회
+    short_url, error = _check_entry(await ShortURLCache.aresolve(decoded))
+    if error:
+        return None, error
+
+    # 클릭 수, 클릭 이벤트는 버퍼에 누적 후 백그라운드에서 반영 (기다리지 않음, hot key는 공유 카운터를 나누어 누적)
+    await ClickCounter.arecord(short_url["id"], shards=ShortURLHotKeys.observe(decoded))
+    await ClickEvents.arecord(short_url["id"], referrer=referrer, user_agent=user_agent, ip=ip)
+
+    return short_url["url"], None
+
+
+def build_response(url, error):
+    """
+    (status, headers, body) 반환
+    성공 시 302, 실패 시 create_response와 같은 형식의 400 JSON
+    """
+    if error is None:
+        return 302, [("Location", iri_to_uri(url)), ("Content-Length", "0")], b""
+
+    # SYSTEM_CODE 에러 본문은 미리 직렬화된 bytes
+    body = render_error(error, status=400)
+    return 400, [("Content-Type", "application/json"), ("Content-Length", str(len(body)))], body
+
+
+class RedirectWSGIMiddleware:
+    """
+    Redirect 전용 WSGI dispatcher
+    GET /<코드> 요청은 Django 미들웨어, URL resolver, DRF를 거치지 않고 바로 처리하고,
+    나머지 요청은 Django WSGI application으로 넘깁니다.
+    """
+
+    REASONS = {302: "302 Found", 400: "400 Bad Request"}
+
+    def __init__(self, application):
+        self.application = application
+
+    def __call__(self, environ, start_response):
+        match = REDIRECT_PATH.match(environ.get("PATH_INFO", ""))
+        if environ.get("REQUEST_METHOD") != "GET" or not match or match.group(1) in get_django_paths():
+            return self.application(environ, start_response)
+
+        state = Instrumentation.start()
+        status, headers, timing = 500, [], None
+        # DB 연결 관리(close_old_connections 등)는 Django 요청과 동일하게 signal로 처리
+        signals.request_started.send(sender=self.__class__, environ=environ)
+        try:
+            result = resolve_redirect(
+                match.group(1),
+                referrer=environ.get("HTTP_REFERER", ""),
+                user_agent=environ.get("HTTP_USER_AGENT", ""),
+                ip=environ.get("REMOTE_ADDR"),
+            )
+            status, headers, body = build_response(*result)
+        finally:
+            signals.request_finished.send(sender=self.__class__)
+            if state is not None:
+                timing = Instrumentation.finish(state, REDIRECT_VIEW, "GET", status)
+
+        if timing:
+            headers.append(("Server-Timing", timing))
+
+        start_response(self.REASONS[status], headers)
+        return [body]
+
+
+class RedirectASGIMiddleware:
+    """
+    Redirect 전용 ASGI dispatcher
+    GET /<코드> 요청은 이벤트 루프에서 바로 처리하고, 나머지 요청은 Django ASGI application으로 넘깁니다.
+    """
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        match = REDIRECT_PATH.match(scope.get("path", "")) if scope["type"] == "http" else None
+        if not match or scope["method"] != "GET" or match.group(1) in get_django_paths():
+            return await self.application(scope, receive, send)
+
+        state = Instrumentation.start()
+        status, headers, timing = 500, [], None
+        await signals.request_started.asend(sender=self.__class__, scope=scope)
+        try:
+            request_headers = dict(scope.get("headers", []))
+            client = scope.get("client")
+            result = await aresolve_redirect(
+                match.group(1),
+                referrer=request_headers.get(b"referer", b"").decode("latin-1"),
+                user_agent=request_headers.get(b"user-agent", b"").decode("latin-1"),
+                ip=client[0] if client else None,
+            )
+            status, headers, body = build_response(*result)
+        finally:
+            await signals.request_finished.asend(sender=self.__class__)
+            if state is not None:
+                timing = Instrumentation.finish(state, REDIRECT_VIEW, "GET", status)
+
+        if timing:
+            headers.append(("Server-Timing", timing))
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(name.lower().encode(), value.encode()) for name, value in headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -6,6 +6,9 @@
 
 # System
 from datetime import datetime
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from rest_framework import serializers
 
 # Project
@@ -13,21 +16,28 @@ from core.constants import SYSTEM_CODE
 from core.exception import raise_exception
 from core.algorithm import Algorithm
 from apps.short_url.models import ShortURL
+from apps.short_url.bloom import ShortURLBloom
+from apps.short_url.aliases import ShortURLAlias
+from apps.short_url.hotkeys import ShortURLHotKeys
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.export import ShortURLExporter
+
+# 원본 URL 최대 길이 (넘으면 MySQL strict mode에서 DataError)
+URL_MAX_LENGTH = ShortURL._meta.get_field("url").max_length
 
 
 class ShortURLSerializer(serializers.Serializer):
-    url = serializers.URLField(required=True, write_only=True, label="[Input]Original URL")
+    url = serializers.URLField(max_length=URL_MAX_LENGTH, required=True, write_only=True, label="[Input]Original URL")
     expiration_date = serializers.DateTimeField(required=False, write_only=True, label="[Input]만료일시")
+    alias = serializers.CharField(required=False, write_only=True, label="[Input]사용자 지정 코드 (영문, 숫자, -, _)")
+    idempotent = serializers.BooleanField(
+        default=False,
+        write_only=True,
+        label="[Input]true이면 이미 있는 URL은 URL_ALREADY 대신 기존 Short URL을 반환 (만료일시는 변경하지 않음)",
+    )
 
     encoded = serializers.CharField(read_only=True, label="[Output]Short URL")
-
-    def validate_url(self, data):
-        """
-        URL 유효성 검증
-        """
-        if ShortURL.objects.filter(url=data, deleted_at=None).exists():
-            raise_exception(code=SYSTEM_CODE.URL_ALREADY)
-        return data
+    created = serializers.BooleanField(read_only=True, label="[Output]새로 생성 여부")
 
     def validate_expiration_date(self, data):
         """
@@ -37,68 +47,358 @@ class ShortURLSerializer(serializers.Serializer):
             raise_exception(code=SYSTEM_CODE.EXPIRATION_DATE_INVALID)
         return data
 
-    def _generated_short_url(self, url, expiration_date=None):
+    def validate_alias(self, data):
         """
-        Short URL 생성 및 반환 하는 내부 함수
+        alias 형식, 예약어 검증
+        """
+        code = ShortURLAlias.validate(data)
+        if code:
+            raise_exception(code=code)
+        return data
 
-        URL을 해싱하여 Short URL을 생성한다.
-        만료일시가 존재하면 해당 일시까지 유효하다.
-        생성 후 Base62 인코딩하여 반환한다.
+    def _aliased_short_url(self, url, alias, expiration_date=None, idempotent=False):
+        """
+        사용자 지정 코드(alias)로 Short URL 생성 후 (alias, 생성 여부)를 반환 하는 내부 함수
+
+        alias가 이미 사용 중이면 ALIAS_ALREADY, URL이 이미 있으면 URL_ALREADY로 처리한다.
+        idempotent이고 요청한 사용자의 만료되지 않은 같은 URL이 같은 alias로 이미 있으면 기존 alias를 반환한다.
+        """
+        short_url = ShortURL.objects.create_alias_short_url(
+            url=url,
+            alias=alias,
+            expiration_date=expiration_date,
+            user=self.context["request"].user,
+        )
+        if short_url:
+            return alias, True
+
+        # 충돌한 unique index 확인 (같은 URL이 없으면 alias 충돌)
+        existing = ShortURL.objects.filter(url_digest=Algorithm.digest_url(url)).values_list("alias", "user_id", "expiration_date")[:1]
+        if not existing:
+            raise_exception(code=SYSTEM_CODE.ALIAS_ALREADY)
+        existing_alias, user_id, existing_expiration_date = existing[0]
+        if (
+            not idempotent
+            or existing_alias != alias
+            or user_id != self.context["request"].user.id
+            or (existing_expiration_date and existing_expiration_date <= datetime.now())
+        ):
+            raise_exception(code=SYSTEM_CODE.URL_ALREADY)
+        return alias, False
+
+    def _generated_short_url(self, url, expiration_date=None, idempotent=False):
         """
-        hash_value = Algorithm.hash_url(url=url)
+        Short URL 생성 또는 조회 후 (Base62 인코딩 값, 생성 여부)를 반환 하는 내부 함수
 
-        short_url = ShortURL.objects.create(
+        설정된 코드 생성기로 Short URL을 생성한다.
+        같은 URL이 이미 있으면 생성하지 않고, idempotent이면 요청한 사용자의 만료되지 않은 기존 코드를 반환하고 아니면 URL_ALREADY로 처리한다.
+        (다른 사용자의 URL이나 만료된 URL은 idempotent여도 URL_ALREADY, 다른 사용자의 코드는 알려주지 않음)
+        (중복 확인과 생성이 한 번의 INSERT)
+        코드가 이미 사용 중이면(unique 충돌) 다음 코드로 다시 시도한다.
+        만료일시가 존재하면 해당 일시까지 유효하다.
+        """
+        result = ShortURL.objects.create_or_get_short_url(
             url=url,
-            hash_value=hash_value,
             expiration_date=expiration_date,
             user=self.context["request"].user,
         )
-        encoded = Algorithm.base62_encode(short_url.hash_value)
+        if result is None:
+            raise_exception(code=SYSTEM_CODE.SHORT_URL_CREATE_ERROR)
+
+        hash_value, created = result
+        if not created and (not idempotent or hash_value is None):
+            raise_exception(code=SYSTEM_CODE.URL_ALREADY)
+
+        encoded = Algorithm.base62_encode(hash_value)
 
-        return encoded
+        return encoded, created
 
     def create(self, validated_data):
         """
-        Short URL 생성
+        Short URL 생성 (alias가 있으면 사용자 지정 코드로 생성)
         """
-        url = validated_data["url"]
-        expiration_date = validated_data.get("expiration_date")
+        if validated_data.get("alias"):
+            encoded, created = self._aliased_short_url(
+                url=validated_data["url"],
+                alias=validated_data["alias"],
+                expiration_date=validated_data.get("expiration_date"),
+                idempotent=validated_data["idempotent"],
+            )
+            return {"encoded": encoded, "created": created}
 
-        encoded = self._generated_short_url(url, expiration_date)
+        encoded, created = self._generated_short_url(
+            url=validated_data["url"],
+            expiration_date=validated_data.get("expiration_date"),
+            idempotent=validated_data["idempotent"],
+        )
 
-        return {"encoded": encoded}
+        return {"encoded": encoded, "created": created}
 
 
-class ShortURLRedirectSerializer(serializers.Serializer):
-    request_url = serializers.CharField(max_length=7, required=True, label="Short URL")
+class ShortURLListSerializer(serializers.Serializer):
+    STATUS_ALL = "all"
+    STATUS_ACTIVE = "active"
+    STATUS_EXPIRED = "expired"
+    STATUS_DELETED = "deleted"
 
-    def validate_request_url(self, data):
-        decoded = Algorithm.base62_decode(data)
+    status = serializers.ChoiceField(
+        choices=[STATUS_ALL, STATUS_ACTIVE, STATUS_EXPIRED, STATUS_DELETED],
+        default=STATUS_ALL,
+        label="[Input]상태 (all: 삭제되지 않은 전체, active: 유효, expired: 만료, deleted: 삭제)",
+    )
 
-        short_url = ShortURL.objects.filter(hash_value=decoded, deleted_at=None).first()
-        if not short_url:
-            raise_exception(code=SYSTEM_CODE.SHORT_URL_NOT_FOUND)
+    def get_queryset(self):
+        """
+        요청 유저의 Short URL 목록 (상태 필터 적용, 목록에 필요한 필드만 조회, 클릭 수는 shard 합산)
+        삭제 여부 조건은 (user, deleted_at, created_at) 인덱스를 사용합니다.
+        """
+        queryset = (
+            self.context["request"]
+            .user.short_urls.with_request_count()
+            .only("id", "url", "hash_value", "alias", "request_count", "expiration_date", "created_at", "deleted_at")
+        )
+        return self.filter_status(queryset, self.validated_data["status"])
 
-        if short_url.expiration_date and short_url.expiration_date < datetime.now():
-            raise_exception(code=SYSTEM_CODE.SHORT_URL_EXPIRED)
-        return short_url
+    @classmethod
+    def filter_status(cls, queryset, status):
+        """
+        Short URL queryset에 상태 필터 적용
+        """
+        if status == cls.STATUS_DELETED:
+            return queryset.filter(deleted_at__isnull=False)
 
-    def save(self):
-        short_url = self.validated_data["request_url"]
-        short_url.request_count += 1
-        short_url.save()
+        queryset = queryset.filter(deleted_at=None)
+        now = datetime.now()
+        if status == cls.STATUS_ACTIVE:
+            return queryset.filter(Q(expiration_date=None) | Q(expiration_date__gt=now))
+        if status == cls.STATUS_EXPIRED:
+            return queryset.filter(expiration_date__lte=now)
+        return queryset
+
+
+class ShortURLExportSerializer(ShortURLListSerializer):
+    # format은 DRF가 renderer 선택(URL_FORMAT_OVERRIDE)에 사용하므로 type으로 받음
+    type = serializers.ChoiceField(
+        choices=list(ShortURLExporter.FORMATS),
+        default="csv",
+        label="[Input]파일 형식 (csv, ndjson)",
+    )
+
+
+class ShortURLItemSerializer(serializers.Serializer):
+    encoded = serializers.SerializerMethodField(label="[Output]Short URL")
+    url = serializers.URLField(read_only=True, label="[Output]Original URL")
+    request_count = serializers.IntegerField(source="total_request_count", read_only=True, label="[Output]요청 횟수")
+    expiration_date = serializers.DateTimeField(read_only=True, label="[Output]만료일시")
+    created_at = serializers.DateTimeField(read_only=True, label="[Output]생성일시")
+    deleted_at = serializers.DateTimeField(read_only=True, label="[Output]삭제일시")
+
+    def get_encoded(self, obj) -> str:
+        return obj.alias or Algorithm.base62_encode(obj.hash_value)
+
+
+class ShortURLBulkSerializer(serializers.Serializer):
+    items = serializers.ListField(
+        child=serializers.JSONField(),
+        allow_empty=False,
+        required=True,
+        write_only=True,
+        label="[Input]URL 목록 (URL 문자열 또는 {url, expiration_date})",
+    )
+
+    results = serializers.ListField(read_only=True, label="[Output]입력 순서별 생성 결과 {url, encoded, code, msg}")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 항목별 검증에 사용하는 필드 (항목마다 Serializer를 만들지 않음)
+        self.url_field = serializers.URLField(max_length=URL_MAX_LENGTH)
+        self.expiration_date_field = serializers.DateTimeField(required=False, allow_null=True)
+
+    def validate_items(self, data):
+        """
+        요청당 최대 URL 수 검증
+        """
+        if len(data) > settings.SHORT_URL_BULK["MAX_ITEMS"]:
+            raise_exception(code=SYSTEM_CODE.BULK_LIMIT_EXCEEDED)
+        return data
+
+    def _parse_item(self, item):
+        """
+        항목 하나를 (url, expiration_date)로 변환
+        올바르지 않으면 (url, None, 에러 코드) 반환
+        """
+        if isinstance(item, dict):
+            url, expiration_date = item.get("url"), item.get("expiration_date")
+        else:
+            url, expiration_date = item, None
+
+        try:
+            url = self.url_field.run_validation(url)
+            expiration_date = self.expiration_date_field.run_validation(expiration_date)
+        except serializers.ValidationError:
+            return url, None, SYSTEM_CODE.INVALID_FORMAT
+
+        if expiration_date and expiration_date < datetime.now():
+            return url, None, SYSTEM_CODE.EXPIRATION_DATE_INVALID
+        return url, expiration_date, None
+
+    def _get_existing(self, urls):
+        """
+        이미 존재하는 URL의 hash value 조회 (url_digest unique index로 BATCH_SIZE 단위 IN 조회)
+        """
+        batch_size = settings.SHORT_URL_BULK["BATCH_SIZE"]
+        digests = {Algorithm.digest_url(url): url for url in urls}
+        keys = list(digests)
+        existing = {}
+        for start in range(0, len(keys), batch_size):
+            queryset = ShortURL.objects.filter(url_digest__in=keys[start : start + batch_size])
+            existing.update((digests[url_digest], hash_value) for url_digest, hash_value in queryset.values_list("url_digest", "hash_value"))
+        return existing
+
+    @staticmethod
+    def _result(url, code, hash_value=None):
+        # encoded는 create 마지막에 한 번에 Base62 인코딩
+        return {
+            "url": url,
+            "encoded": hash_value,
+            "code": code[0],
+            "msg": code[1],
+        }
+
+    def create(self, validated_data):
+        """
+        Short URL 일괄 생성
+
+        이미 존재하는 URL은 기존 코드를 URL_ALREADY로 반환하고,
+        나머지는 하나의 트랜잭션 안에서 bulk_create로 생성한다.
+        """
+        items = validated_data["items"]
+        results = [None] * len(items)
+
+        parsed = []
+        for index, item in enumerate(items):
+            url, expiration_date, error = self._parse_item(item)
+            if error:
+                results[index] = self._result(url, error)
+            else:
+                parsed.append((index, url, expiration_date))
+
+        existing = self._get_existing(list({url for _, url, _ in parsed}))
+
+        # 요청 안에서 중복된 URL은 한 번만 생성
+        pending = {}
+        for index, url, expiration_date in parsed:
+            if url in existing:
+                results[index] = self._result(url, SYSTEM_CODE.URL_ALREADY, existing[url])
+            else:
+                pending.setdefault(url, (expiration_date, []))[1].append(index)
+
+        with transaction.atomic():
+            created = ShortURL.objects.bulk_create_short_urls(
+                items=[(url, expiration_date) for url, (expiration_date, _) in pending.items()],
+                user=self.context["request"].user,
+                batch_size=settings.SHORT_URL_BULK["BATCH_SIZE"],
+            )
+
+        for (url, (_, indexes)), short_url in zip(pending.items(), created):
+            for index in indexes:
+                if short_url:
+                    results[index] = self._result(url, SYSTEM_CODE.SUCCESS, short_url.hash_value)
+                else:
+                    results[index] = self._result(url, SYSTEM_CODE.SHORT_URL_CREATE_ERROR)
+
+        # bulk_create는 signal이 발생하지 않으므로 직접 캐시 무효화, Bloom filter 추가
+        hash_values = [short_url.hash_value for short_url in created if short_url]
+        ShortURLCache.invalidate_many(hash_values)
+        ShortURLBloom.notify(hash_values)
+
+        encoded = iter(Algorithm.base62_encode_many([result["encoded"] for result in results if result["encoded"] is not None]))
+        for result in results:
+            if result["encoded"] is not None:
+                result["encoded"] = next(encoded)
 
-        return short_url.url
+        return {"results": results}
+
+
+class ShortURLAliasAvailabilitySerializer(serializers.Serializer):
+    aliases = serializers.ListField(
+        child=serializers.CharField(allow_blank=True),
+        allow_empty=False,
+        required=True,
+        write_only=True,
+        label="[Input]확인할 alias 목록",
+    )
+
+    results = serializers.ListField(read_only=True, label="[Output]입력 순서별 결과 {alias, available, code, msg}")
+
+    def validate_aliases(self, data):
+        """
+        요청당 최대 alias 수 검증
+        """
+        if len(data) > settings.SHORT_URL_ALIAS["MAX_CHECK"]:
+            raise_exception(code=SYSTEM_CODE.BULK_LIMIT_EXCEEDED)
+        return data
+
+    def create(self, validated_data):
+        """
+        alias 사용 가능 여부 조회 (예약어 Trie, Bloom filter, Redirect 캐시)
+        """
+        return {"results": ShortURLAlias.check_availability(validated_data["aliases"])}
+
+
+class ShortURLHotKeySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100, write_only=True, label="[Input]반환할 최대 코드 수")
+
+    keys = serializers.ListField(read_only=True, label="[Output]전체 워커 합산 상위 코드 {code, url, count, hot_workers}")
+    workers = serializers.ListField(read_only=True, label="[Output]워커별 기록 {worker, updated_at, total, hot}")
+
+    def create(self, validated_data):
+        """
+        워커별 hot key 기록(ShortURLHotKeys)을 합산하여 요청 수가 많은 순서로 반환
+        """
+        reports = ShortURLHotKeys.get_reports()
+
+        merged = {}
+        for report in reports:
+            for key in report["keys"]:
+                item = merged.setdefault(key["hash_value"], {"count": 0, "hot_workers": 0})
+                item["count"] += key["count"]
+                item["hot_workers"] += int(key["hot"])
+
+        top = sorted(merged.items(), key=lambda item: item[1]["count"], reverse=True)[: validated_data["limit"]]
+        hash_values = [hash_value for hash_value, _ in top]
+        rows = {
+            hash_value: (alias, url)
+            for hash_value, alias, url in ShortURL.objects.filter(live_hash_value__in=hash_values).values_list("live_hash_value", "alias", "url")
+        }
+
+        keys = []
+        for (hash_value, item), code in zip(top, Algorithm.base62_encode_many(hash_values)):
+            alias, url = rows.get(hash_value, (None, None))
+            keys.append({"code": alias or code, "url": url, **item})
+
+        workers = [
+            {
+                "worker": report["worker"],
+                "updated_at": report["updated_at"],
+                "total": report["total"],
+                "hot": sum(key["hot"] for key in report["keys"]),
+            }
+            for report in reports
+        ]
+        return {"keys": keys, "workers": workers}
 
 
 class ShortURLDeleteSerializer(serializers.Serializer):
-    request_url = serializers.CharField(max_length=7, required=True, label="Short URL")
+    request_url = serializers.CharField(max_length=settings.SHORT_URL_ALIAS["MAX_LENGTH"], required=True, label="Short URL")
 
     def validate_request_url(self, data):
-        # Base62 디코딩
-        decoded = Algorithm.base62_decode(data)
+        # Base62 디코딩 (alias는 alias hash value)
+        decoded = Algorithm.resolve_code(data)
+        if decoded is None:
+            raise_exception(code=SYSTEM_CODE.SHORT_URL_NOT_FOUND)
 
-        short_url = ShortURL.objects.filter(hash_value=decoded, deleted_at=None, user=self.context["request"].user).first()
+        short_url = ShortURL.objects.filter(live_hash_value=decoded, user=self.context["request"].user).first()
 
         # 존재 하지 않는 URL 처리
         if not short_url:
@@ -108,7 +408,8 @@ class ShortURLDeleteSerializer(serializers.Serializer):
     def save(self):
         short_url = self.validated_data["request_url"]
 
-        # 현재 시간으로 삭제 처리
+        # 현재 시간으로 삭제 처리 (Redirect 캐시는 post_save signal에서 무효화)
+        # url_digest는 저장 시 NULL이 되어 같은 URL을 다시 생성할 수 있음
         short_url.deleted_at = datetime.now()
         short_url.save()
         return None
@@ -0,0 +1,37 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Signals
+"""
+
+# System
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+# Project
+from apps.short_url.bloom import ShortURLBloom
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+
+
+@receiver(post_save, sender=ShortURL)
+@receiver(post_delete, sender=ShortURL)
+def invalidate_short_url_cache(sender, instance, **kwargs):
+    """
+    Short URL 생성, 수정(soft delete 포함), 삭제 시 Redirect 캐시 무효화
+    커밋 전에 다른 요청이 이전 값을 다시 캐싱할 수 있으므로 커밋 이후에도 한 번 더 무효화합니다.
+    """
+    hash_value = instance.hash_value
+    ShortURLCache.invalidate(hash_value)
+    transaction.on_commit(lambda: ShortURLCache.invalidate(hash_value))
+
+
+@receiver(post_save, sender=ShortURL)
+def notify_short_url_bloom(sender, instance, created, **kwargs):
+    """
+    Short URL 생성 시 커밋 이후 Bloom filter에 추가
+    """
+    if created:
+        hash_value = instance.hash_value
+        transaction.on_commit(lambda: ShortURLBloom.notify([hash_value]))
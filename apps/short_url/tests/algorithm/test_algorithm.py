@@ -0,0 +1,34 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Algorithm Test
+"""
+
+# System
+from django.test import SimpleTestCase
+
+# Project
+from core.algorithm import Algorithm, MAX_HASH_VALUE
+
+
+class AlgorithmTest(SimpleTestCase):
+    """
+    Hash, Base62 인코딩/디코딩 테스트
+    """
+
+    # hash value는 40bit 정수
+    def test_hash_url(self):
+        hash_value = Algorithm.hash_url("https://www.google.com")
+
+        self.assertIsInstance(hash_value, int)
+        self.assertLess(hash_value, 2**40)
+
+    # 인코딩 후 디코딩하면 같은 정수 (앞자리가 0인 hash 포함)
+    def test_base62_round_trip(self):
+        for hash_value in (0, 1, 0x0A1B2C3D4E, MAX_HASH_VALUE):
+            self.assertEqual(Algorithm.base62_decode(Algorithm.base62_encode(hash_value)), hash_value)
+
+    # 올바르지 않은 문자, 64bit 범위 초과는 None
+    def test_base62_decode_invalid(self):
+        self.assertIsNone(Algorithm.base62_decode("a-b"))
+        self.assertIsNone(Algorithm.base62_decode("zzzzzzzzzzz"))
@@ -0,0 +1,178 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Code Generator Test
+"""
+
+# System
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+# Project
+from core.algorithm import (
+    Algorithm,
+    BlockCodeGenerator,
+    HashCodeGenerator,
+    SnowflakeCodeGenerator,
+    MAX_HASH_VALUE,
+)
+from core.constants import SYSTEM_CODE
+from core.jwt import CustomJWTAuthentication
+from core.models import CodeSequence
+from apps.users.models import User
+from apps.short_url.models import ShortURL
+
+
+class CodeGeneratorTest(TestCase):
+    """
+    코드 생성기 테스트
+    """
+
+    # hash 생성기는 attempt마다 다른 코드(probe)
+    def test_hash_generator_probe(self):
+        generator = HashCodeGenerator()
+        url = "https://www.google.com"
+
+        self.assertEqual(generator.generate(url), Algorithm.hash_url(url))
+        self.assertNotEqual(generator.generate(url), generator.generate(url, attempt=1))
+
+    # snowflake 생성기는 중복 없이 증가하는 64bit 코드
+    def test_snowflake_generator(self):
+        generator = SnowflakeCodeGenerator(worker_id=3, epoch=settings.SHORT_URL_CODE["SNOWFLAKE_EPOCH"])
+        codes = [generator.generate("https://www.google.com") for _ in range(10000)]
+
+        self.assertEqual(len(set(codes)), len(codes))
+        self.assertEqual(codes, sorted(codes))
+        self.assertLessEqual(max(codes), MAX_HASH_VALUE)
+        self.assertEqual((codes[0] >> SnowflakeCodeGenerator.SEQUENCE_BITS) & SnowflakeCodeGenerator.MAX_WORKER_ID, 3)
+
+    # snowflake 생성기는 worker id 설정 필수 (없거나 10bit 범위를 넘으면 ImproperlyConfigured)
+    def test_snowflake_generator_worker_id(self):
+        for worker_id in (None, -1, SnowflakeCodeGenerator.MAX_WORKER_ID + 1):
+            with self.assertRaises(ImproperlyConfigured):
+                SnowflakeCodeGenerator(worker_id=worker_id, epoch=settings.SHORT_URL_CODE["SNOWFLAKE_EPOCH"])
+
+        with override_settings(SHORT_URL_CODE={**settings.SHORT_URL_CODE, "GENERATOR": "snowflake", "WORKER_ID": None}):
+            Algorithm.reset_generator()
+            self.addCleanup(Algorithm.reset_generator)
+            with self.assertRaises(ImproperlyConfigured):
+                Algorithm.generate_code("https://www.google.com")
+
+
+class GeneratedShortURLTest(APITestCase):
+    """
+    코드 생성기 설정별 단축 URL 생성 테스트
+    """
+
+    url = reverse("api-short-url:post-short-url")
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+
+    def setUp(self):
+        Algorithm.reset_generator()
+
+    def tearDown(self):
+        Algorithm.reset_generator()
+
+    def post_short_url(self):
+        return self.client.post(
+            path=self.url,
+            HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}",
+            data={"url": self.origin_url},
+            format="json",
+        )
+
+    # hash 충돌 시 다음 코드로 생성
+    def test_post_short_url_hash_collision(self):
+        ShortURL.objects.create(url="https://www.naver.com", hash_value=Algorithm.hash_url(self.origin_url), user=self.user)
+
+        response = self.post_short_url()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            Algorithm.base62_decode(response.data["data"]["encoded"]),
+            HashCodeGenerator().generate(self.origin_url, attempt=1),
+        )
+
+    # snowflake 생성기 사용
+    @override_settings(SHORT_URL_CODE={**settings.SHORT_URL_CODE, "GENERATOR": "snowflake", "WORKER_ID": 1})
+    def test_post_short_url_snowflake(self):
+        response = self.post_short_url()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(ShortURL.objects.filter(live_hash_value=Algorithm.base62_decode(response.data["data"]["encoded"])).exists())
+
+    # 재시도 횟수를 모두 사용하면 생성 실패
+    @override_settings(SHORT_URL_CODE={**settings.SHORT_URL_CODE, "MAX_ATTEMPTS": 1})
+    def test_post_short_url_create_error(self):
+        ShortURL.objects.create(url="https://www.naver.com", hash_value=Algorithm.hash_url(self.origin_url), user=self.user)
+
+        response = self.post_short_url()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["code"], SYSTEM_CODE.SHORT_URL_CREATE_ERROR[0])
+
+
+class BlockCodeGeneratorTest(APITransactionTestCase):
+    """
+    block 생성기 테스트
+    블록 예약은 별도 DB connection에서 바로 커밋하므로 테스트 트랜잭션 대신 테이블 초기화로 격리합니다.
+    """
+
+    url = reverse("api-short-url:post-short-url")
+
+    def setUp(self):
+        Algorithm.reset_generator()
+
+    def tearDown(self):
+        Algorithm.reset_generator()
+
+    # block 생성기는 블록을 다 쓸 때만 DB 조회
+    def test_block_generator(self):
+        first = BlockCodeGenerator(block_size=3, start=100)
+        second = BlockCodeGenerator(block_size=3, start=100)
+
+        codes = [first.generate("a"), second.generate("b")]
+        with self.assertNumQueries(0):
+            codes += [first.generate("a"), first.generate("a")]
+        codes.append(first.generate("a"))
+
+        self.assertEqual(codes, [100, 103, 101, 102, 106])
+
+    # 바깥 트랜잭션 안에서 예약해도 해당 connection에서 시퀀스를 잠그지 않고, rollback 되어도 예약은 유지
+    def test_block_lease_in_rollback(self):
+        first = BlockCodeGenerator(block_size=3, start=100)
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic(), self.assertNumQueries(0):
+                self.assertEqual(first.generate("a"), 100)
+                raise RuntimeError
+
+        self.assertEqual(CodeSequence.objects.get(name=BlockCodeGenerator.SEQUENCE_NAME).next_value, 103)
+        # 다른 워커는 rollback 된 범위를 다시 예약하지 않음
+        second = BlockCodeGenerator(block_size=3, start=100)
+        self.assertEqual(second.generate("b"), 103)
+        self.assertEqual(first.generate("a"), 101)
+
+    # block 생성기 사용
+    @override_settings(SHORT_URL_CODE={**settings.SHORT_URL_CODE, "GENERATOR": "block"})
+    def test_post_short_url_block(self):
+        user = User.objects.create_user(email="test@test.com", password="password1234")
+        response = self.client.post(
+            path=self.url,
+            HTTP_AUTHORIZATION=f"Bearer {CustomJWTAuthentication.create_access_token(user=user)}",
+            data={"url": "https://www.google.com"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Algorithm.base62_decode(response.data["data"]["encoded"]), settings.SHORT_URL_CODE["BLOCK_START"])
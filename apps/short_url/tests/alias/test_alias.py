@@ -0,0 +1,177 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Alias Test
+"""
+
+# System
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core.trie import Trie
+from core.algorithm import ALIAS_HASH_BASE, Algorithm
+from core.constants import SYSTEM_CODE
+from core.jwt import CustomJWTAuthentication
+from apps.users.models import User
+from apps.short_url.aliases import ShortURLAlias
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+
+
+class TrieTest(SimpleTestCase):
+    """
+    예약어 Trie 테스트
+    """
+
+    # exact 단어는 전체 일치만, exact=False 단어는 포함만 되어도 일치 (대소문자 구분 없음)
+    def test_trie_match(self):
+        trie = Trie()
+        trie.add("admin", kind="reserved")
+        trie.add("bad", kind="blocked", exact=False)
+
+        self.assertEqual(len(trie), 2)
+        self.assertIn("ADMIN", trie)
+        self.assertEqual(trie.match("Admin"), ("admin", "reserved"))
+        self.assertIsNone(trie.match("admin-page"))
+        self.assertEqual(trie.match("so-BAD-sale"), ("bad", "blocked"))
+        self.assertIsNone(trie.match("spring-sale"))
+
+
+@override_settings(SHORT_URL_ALIAS={**settings.SHORT_URL_ALIAS, "BLOCKED_WORDS": ["badword"]})
+class ShortURLAliasTest(APITestCase):
+    """
+    사용자 지정 코드(alias) 생성, 사용 가능 여부 조회, Redirect, 삭제 테스트
+    """
+
+    url = reverse("api-short-url:post-short-url")
+    availability_url = reverse("api-short-url:post-alias-availability")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+
+        cls.generated = ShortURL.objects.create_short_url(url="https://www.google.com/generated", user=cls.user)
+        cls.generated_code = Algorithm.base62_encode(cls.generated.hash_value)
+
+    def setUp(self):
+        ShortURLAlias.reset()
+        ShortURLCache.clear()
+        cache.clear()
+
+    def post(self, path, data):
+        return self.client.post(path=path, HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}", data=data, format="json")
+
+    # 앞자리 0은 0을 뺀 alias와 같은 hash value이므로 사용 불가 ("sale"이 있으면 "0sale"은 ALIAS_INVALID)
+    def test_alias_leading_zero(self):
+        self.assertEqual(Algorithm.resolve_code("0sale"), Algorithm.resolve_code("sale"))
+        self.assertEqual(self.post(self.url, {"url": "https://www.google.com/sale", "alias": "sale"}).status_code, 201)
+
+        response = self.post(self.url, {"url": "https://www.google.com/zero", "alias": "0sale"})
+        self.assertEqual(response.data["code"], SYSTEM_CODE.ALIAS_INVALID[0])
+        response = self.post(self.availability_url, {"aliases": ["0sale", "sale0"]})
+        self.assertEqual([row["code"] for row in response.data["data"]["results"]], [SYSTEM_CODE.ALIAS_INVALID[0], SYSTEM_CODE.SUCCESS[0]])
+
+    # MIN_LENGTH보다 짧은 alias는 생성기가 발급하는 작은 hash value("1" == 1)를 차지하므로 사용 불가
+    def test_alias_short(self):
+        short_url = ShortURL.objects.create(url="https://www.google.com/one", hash_value=1, user=self.user)
+
+        response = self.post(self.url, {"url": "https://www.google.com/short", "alias": "1"})
+        self.assertEqual(response.data["code"], SYSTEM_CODE.ALIAS_INVALID[0])
+        self.assertEqual(ShortURL.objects.get(live_hash_value=1), short_url)
+
+    # alias가 Base62로 디코딩되면 디코딩 값, 아니면 alias hash 범위의 값
+    def test_alias_resolve_code(self):
+        self.assertEqual(Algorithm.resolve_code("sale"), Algorithm.base62_decode("sale"))
+        self.assertGreaterEqual(Algorithm.resolve_code("spring-sale"), ALIAS_HASH_BASE)
+        self.assertEqual(Algorithm.resolve_code("spring-sale"), Algorithm.resolve_code("spring-sale"))
+        self.assertIsNone(Algorithm.resolve_code("spring.sale"))
+
+    # alias로 생성하면 alias로 Redirect, 목록, 삭제
+    def test_alias_create_redirect_delete(self):
+        response = self.post(self.url, {"url": "https://www.google.com/spring", "alias": "spring-sale"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["data"]["encoded"], "spring-sale")
+
+        response = self.client.get("/spring-sale")
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "https://www.google.com/spring")
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}")
+        self.assertIn("spring-sale", [row["encoded"] for row in response.data["data"]])
+
+        response = self.client.delete(
+            reverse("api-short-url:delete-short-url", kwargs={"url": "spring-sale"}), HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}"
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get("/spring-sale").status_code, 400)
+
+    # 이미 사용 중인 alias, 생성 코드와 같은 alias, 같은 URL
+    def test_alias_conflict(self):
+        self.assertEqual(self.post(self.url, {"url": "https://www.google.com/a", "alias": "summer"}).status_code, 201)
+
+        response = self.post(self.url, {"url": "https://www.google.com/b", "alias": "summer"})
+        self.assertEqual(response.data["code"], SYSTEM_CODE.ALIAS_ALREADY[0])
+
+        response = self.post(self.url, {"url": "https://www.google.com/b", "alias": self.generated_code})
+        self.assertEqual(response.data["code"], SYSTEM_CODE.ALIAS_ALREADY[0])
+
+        response = self.post(self.url, {"url": "https://www.google.com/a", "alias": "winter"})
+        self.assertEqual(response.data["code"], SYSTEM_CODE.URL_ALREADY[0])
+
+        response = self.post(self.url, {"url": "https://www.google.com/a", "alias": "summer", "idempotent": True})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"]["encoded"], "summer")
+
+        # 다른 사용자의 alias는 idempotent여도 URL_ALREADY
+        other = User.objects.create_user(email="other@test.com", password="password1234")
+        response = self.client.post(
+            path=self.url,
+            HTTP_AUTHORIZATION=f"Bearer {CustomJWTAuthentication.create_access_token(user=other)}",
+            data={"url": "https://www.google.com/a", "alias": "summer", "idempotent": True},
+            format="json",
+        )
+        self.assertEqual(response.data["code"], SYSTEM_CODE.URL_ALREADY[0])
+
+    # 형식, 예약어(URL 경로, RESERVED_WORDS), 비속어
+    def test_alias_invalid(self):
+        for alias, code in (
+            ("abc", SYSTEM_CODE.ALIAS_INVALID),
+            ("1", SYSTEM_CODE.ALIAS_INVALID),
+            ("0sale", SYSTEM_CODE.ALIAS_INVALID),
+            ("spring sale", SYSTEM_CODE.ALIAS_INVALID),
+            ("a" * 33, SYSTEM_CODE.ALIAS_INVALID),
+            ("admin", SYSTEM_CODE.ALIAS_RESERVED),
+            ("Export", SYSTEM_CODE.ALIAS_RESERVED),
+            ("docs", SYSTEM_CODE.ALIAS_RESERVED),
+            ("my-BadWord-sale", SYSTEM_CODE.ALIAS_RESERVED),
+        ):
+            response = self.post(self.url, {"url": "https://www.google.com/c", "alias": alias})
+            self.assertEqual(response.data["code"], code[0], alias)
+
+        self.assertFalse(ShortURL.objects.filter(url="https://www.google.com/c").exists())
+
+    # 사용 가능 여부 일괄 조회 (입력 순서대로)
+    def test_alias_availability(self):
+        self.post(self.url, {"url": "https://www.google.com/a", "alias": "taken-one"})
+
+        response = self.post(self.availability_url, {"aliases": ["free-one", "taken-one", self.generated_code, "api", "admin"]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row["alias"], row["available"], row["code"]) for row in response.data["data"]["results"]],
+            [
+                ("free-one", True, SYSTEM_CODE.SUCCESS[0]),
+                ("taken-one", False, SYSTEM_CODE.ALIAS_ALREADY[0]),
+                (self.generated_code, False, SYSTEM_CODE.ALIAS_ALREADY[0]),
+                ("api", False, SYSTEM_CODE.ALIAS_INVALID[0]),
+                ("admin", False, SYSTEM_CODE.ALIAS_RESERVED[0]),
+            ],
+        )
+
+        with override_settings(SHORT_URL_ALIAS={**settings.SHORT_URL_ALIAS, "MAX_CHECK": 1}):
+            response = self.post(self.availability_url, {"aliases": ["free-one", "free-two"]})
+        self.assertEqual(response.data["code"], SYSTEM_CODE.BULK_LIMIT_EXCEEDED[0])
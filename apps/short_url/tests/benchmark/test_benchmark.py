@@ -0,0 +1,55 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Benchmark Suite Test
+"""
+
+# System
+import json
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+# Project
+from core.benchmark import percentile, summarize
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+
+
+class BenchmarkTest(TestCase):
+    """
+    벤치마크 통계, 벤치마크 명령 테스트
+    """
+
+    def setUp(self):
+        ShortURLCache.clear()
+        cache.clear()
+
+    # nearest-rank 백분위
+    def test_percentile(self):
+        samples = list(range(1, 101))
+
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    # 동시 실행 시 처리량은 전체 소요 시간 기준
+    def test_summarize_elapsed(self):
+        result = summarize([0.1] * 10, elapsed=0.5)
+
+        self.assertEqual(result["count"], 10)
+        self.assertEqual(result["p50_ms"], 100.0)
+        self.assertEqual(result["ops_per_sec"], 20.0)
+
+    # 시나리오별 결과를 JSON으로 출력하고 벤치마크 데이터 삭제
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark", rows=50, repeat=5, auth_repeat=1, hot_keys=5, concurrency=0, json=True, stdout=out)
+
+        report = json.loads(out.getvalue())
+
+        self.assertEqual(set(report["client"]), {"create", "redirect_hot", "redirect_cold", "delete", "sign_in", "token_refresh"})
+        self.assertEqual(report["client"]["redirect_hot"]["count"], 5)
+        self.assertIsNone(report["server"])
+        self.assertFalse(ShortURL.objects.exists())
@@ -0,0 +1,139 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Bloom Filter Test
+"""
+
+# System
+import io
+import os
+import tempfile
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+# Project
+from core.bloom import BloomFilter
+from core.algorithm import Algorithm
+from core.constants import SYSTEM_CODE
+from apps.users.models import User
+from apps.short_url.bloom import ShortURLBloom
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+
+
+class BloomFilterTest(TestCase):
+    """
+    Bloom filter 테스트
+    """
+
+    # 추가한 값은 항상 포함, false positive는 error_rate 근처
+    def test_bloom_filter(self):
+        bloom = BloomFilter.create(capacity=1000, error_rate=0.01)
+        for value in range(1000):
+            bloom.add(value * 7919)
+
+        self.assertTrue(all(value * 7919 in bloom for value in range(1000)))
+        false_positives = sum(1 for value in range(10**6, 10**6 + 10000) if value in bloom)
+        self.assertLess(false_positives, 300)
+
+    # 파일로 저장한 필터를 mmap으로 열고, 연 뒤에도 값을 추가할 수 있음 (파일은 변경하지 않음)
+    def test_bloom_filter_snapshot(self):
+        bloom = BloomFilter.create(capacity=100, error_rate=0.01)
+        bloom.add(1)
+        bloom.watermark = 10
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bloom.bin")
+            bloom.save(path)
+            size = os.path.getsize(path)
+
+            loaded = BloomFilter.load(path)
+            self.assertEqual((loaded.size, loaded.hashes, len(loaded), loaded.watermark), (bloom.size, bloom.hashes, 1, 10))
+            self.assertIn(1, loaded)
+            self.assertNotIn(2, loaded)
+
+            loaded.add(2)
+            self.assertIn(2, loaded)
+            self.assertNotIn(2, BloomFilter.load(path))
+            self.assertEqual(os.path.getsize(path), size)
+
+            with open(path, "wb") as f:
+                f.write(b"invalid")
+            with self.assertRaises(ValueError):
+                BloomFilter.load(path)
+
+
+@override_settings(SHORT_URL_BLOOM={**settings.SHORT_URL_BLOOM, "ENABLED": True, "CHUNK_SIZE": 2})
+class ShortURLBloomTest(TestCase):
+    """
+    Redirect 조회 전 Bloom filter 확인 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        for i in range(5):
+            ShortURL.objects.create_short_url(url=f"https://www.google.com/{i}", user=cls.user)
+
+    def setUp(self):
+        ShortURLBloom.reset()
+        ShortURLCache.clear()
+        cache.clear()
+
+    def tearDown(self):
+        ShortURLBloom.reset()
+
+    def test_bloom_resolve(self):
+        for short_url in ShortURL.objects.all():
+            self.assertEqual(ShortURLCache.resolve(short_url.hash_value)["url"], short_url.url)
+
+        # 존재할 수 없는 코드는 DB, 공유 캐시를 조회하지 않고 캐싱하지도 않음
+        missing = Algorithm.hash_url("https://www.google.com/missing")
+        self.assertFalse(ShortURLBloom.might_exist(missing))
+        with self.assertNumQueries(0):
+            self.assertIsNone(ShortURLCache.resolve(missing))
+        self.assertIsNone(cache.get(ShortURLCache.make_key(missing)))
+
+    def test_bloom_notify(self):
+        ShortURLBloom.might_exist(0)
+        url = "https://www.google.com/new"
+
+        # 다른 워커에서 생성되어 아직 알림이 오지 않은 행은 보이지 않음
+        ShortURL.objects.bulk_create([ShortURL(url=url, hash_value=Algorithm.hash_url(url), user=self.user)])
+        self.assertFalse(ShortURLBloom.might_exist(Algorithm.hash_url(url)))
+
+        # 생성 알림(version 변경) 이후에는 새 행을 읽어 확인
+        cache.set(ShortURLBloom.VERSION_KEY, 1, timeout=None)
+        self.assertTrue(ShortURLBloom.might_exist(Algorithm.hash_url(url)))
+
+        # 현재 워커에서 생성한 행은 바로 추가
+        with self.captureOnCommitCallbacks(execute=True):
+            short_url = ShortURL.objects.create_short_url(url="https://www.google.com/created", user=self.user)
+        self.assertIn(short_url.hash_value, ShortURLBloom._filter)
+        self.assertEqual(cache.get(ShortURLBloom.VERSION_KEY), 2)
+
+    def test_bloom_redirect(self):
+        response = self.client.get("/" + Algorithm.base62_encode(Algorithm.hash_url("https://www.google.com/missing")))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["code"], SYSTEM_CODE.SHORT_URL_NOT_FOUND[0])
+
+        short_url = ShortURL.objects.first()
+        response = self.client.get("/" + Algorithm.base62_encode(short_url.hash_value))
+        self.assertEqual(response.status_code, 302)
+
+    def test_bloom_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bloom.bin")
+            stdout = io.StringIO()
+            call_command("build_short_url_bloom", output=path, stdout=stdout)
+            self.assertIn("5 values", stdout.getvalue())
+
+            with override_settings(SHORT_URL_BLOOM={**settings.SHORT_URL_BLOOM, "SNAPSHOT_PATH": path}):
+                ShortURLBloom.reset()
+                self.assertFalse(ShortURLBloom.might_exist(Algorithm.hash_url("https://www.google.com/missing")))
+                self.assertIsInstance(ShortURLBloom._filter.bits, memoryview)
+                for short_url in ShortURL.objects.all():
+                    self.assertTrue(ShortURLBloom.might_exist(short_url.hash_value))
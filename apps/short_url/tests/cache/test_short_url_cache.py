@@ -0,0 +1,111 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Resolve Cache Test
+"""
+
+# System
+from datetime import datetime, timedelta
+from django.core.cache import cache
+from django.test import TestCase
+
+# Project
+from core.cache import LRUCache
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+
+
+class LRUCacheTest(TestCase):
+    """
+    프로세스 내부 LRU 캐시 테스트
+    """
+
+    # 최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거
+    def test_lru_evict(self):
+        lru = LRUCache(maxsize=2, ttl=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("c"), 3)
+
+    # TTL이 지난 항목은 조회되지 않음
+    def test_lru_ttl(self):
+        lru = LRUCache(maxsize=2, ttl=60)
+        lru.set("a", 1, ttl=-1)
+
+        self.assertIsNone(lru.get("a"))
+        self.assertEqual(len(lru), 0)
+
+
+class ShortURLCacheTest(TestCase):
+    """
+    Short URL Redirect 조회 캐시 테스트
+    """
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.hash_value = Algorithm.hash_url(cls.origin_url)
+
+    def setUp(self):
+        ShortURLCache.clear()
+        cache.clear()
+
+    # 두 번째 조회부터는 DB를 조회하지 않음
+    def test_resolve_cached(self):
+        short_url = ShortURL.objects.create(url=self.origin_url, hash_value=self.hash_value, user=self.user)
+
+        with self.assertNumQueries(1):
+            entry = ShortURLCache.resolve(self.hash_value)
+        with self.assertNumQueries(0):
+            ShortURLCache.resolve(self.hash_value)
+
+        self.assertEqual(entry["id"], short_url.id)
+        self.assertEqual(entry["url"], self.origin_url)
+
+    # 존재하지 않는 URL도 캐싱
+    def test_resolve_negative_cached(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(ShortURLCache.resolve(self.hash_value))
+        with self.assertNumQueries(0):
+            self.assertIsNone(ShortURLCache.resolve(self.hash_value))
+
+    # 생성 시 negative 캐시 무효화
+    def test_resolve_after_create(self):
+        self.assertIsNone(ShortURLCache.resolve(self.hash_value))
+
+        ShortURL.objects.create(url=self.origin_url, hash_value=self.hash_value, user=self.user)
+
+        self.assertIsNotNone(ShortURLCache.resolve(self.hash_value))
+
+    # Soft delete 시 캐시 무효화
+    def test_resolve_after_soft_delete(self):
+        short_url = ShortURL.objects.create(url=self.origin_url, hash_value=self.hash_value, user=self.user)
+        self.assertIsNotNone(ShortURLCache.resolve(self.hash_value))
+
+        short_url.deleted_at = datetime.now()
+        short_url.save()
+
+        self.assertIsNone(ShortURLCache.resolve(self.hash_value))
+
+    # 만료일시도 캐싱되어 만료 여부 판단 가능
+    def test_resolve_expiration_date(self):
+        expiration_date = datetime.now() - timedelta(days=1)
+        ShortURL.objects.create(
+            url=self.origin_url,
+            hash_value=self.hash_value,
+            expiration_date=expiration_date,
+            user=self.user,
+        )
+
+        entry = ShortURLCache.resolve(self.hash_value)
+
+        self.assertEqual(entry["expiration_date"], expiration_date)
@@ -0,0 +1,67 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Base62 Codec Test
+"""
+
+# System
+import random
+from django.test import SimpleTestCase, override_settings
+from django.conf import settings
+
+# Project
+from core import codec
+from core.algorithm import Algorithm, MAX_HASH_VALUE
+from apps.short_url.management.commands.benchmark_codec import reference_decode, reference_encode
+
+
+class CodecTest(SimpleTestCase):
+    """
+    core.codec Base62 인코딩/디코딩, batch API 테스트
+    """
+
+    values = [0, 1, 61, 62, 3843, 3844, 62**4, 0x0A1B2C3D4E, 2**40 - 1, MAX_HASH_VALUE] + [random.Random(0).getrandbits(63) for _ in range(500)]
+
+    # 기존 구현(pybase62)으로 발급한 코드와 같은 문자열, 같은 값
+    def test_codec_compatible(self):
+        for value in self.values:
+            encoded = codec.encode(value)
+            self.assertEqual(encoded, reference_encode(value))
+            self.assertEqual(codec.decode(encoded), value)
+            self.assertEqual(codec.decode(reference_encode(value)), reference_decode(encoded))
+
+    # width보다 짧으면 앞을 0으로 채우고, 채운 코드도 같은 값으로 디코딩
+    def test_codec_width(self):
+        self.assertEqual(codec.encode(0, width=4), "0000")
+        self.assertEqual(codec.encode(62, width=4), "0010")
+        self.assertEqual(codec.encode(MAX_HASH_VALUE, width=4), codec.encode(MAX_HASH_VALUE))
+        self.assertEqual(len(codec.encode(MAX_HASH_VALUE)), codec.MAX_WIDTH)
+
+        for value in self.values:
+            self.assertEqual(codec.decode(codec.encode(value, width=codec.MAX_WIDTH)), value)
+
+    # 음수, 빈 문자열, Base62가 아닌 문자는 ValueError
+    def test_codec_invalid(self):
+        with self.assertRaises(ValueError):
+            codec.encode(-1)
+        for encoded in ("", "abc-", "한글", "a b"):
+            with self.assertRaises(ValueError):
+                codec.decode(encoded)
+
+    # batch API는 하나씩 변환한 결과와 같고, 올바르지 않은 값은 None
+    def test_codec_many(self):
+        codes = codec.encode_many(self.values, width=6)
+        self.assertEqual(codes, [codec.encode(value, width=6) for value in self.values])
+        self.assertEqual(codec.decode_many(codes), self.values)
+
+        self.assertEqual(codec.decode_many(["", "abc-", "10", "zzzzzzzzzzzz"], max_value=MAX_HASH_VALUE), [None, None, 62, None])
+        self.assertEqual(codec.encode_many([]), [])
+
+    # Algorithm은 SHORT_URL_CODE["WIDTH"] 적용, 64bit 범위를 넘는 코드는 None
+    def test_algorithm_codec(self):
+        self.assertEqual(Algorithm.base62_encode(62), "10")
+        with override_settings(SHORT_URL_CODE={**settings.SHORT_URL_CODE, "WIDTH": 7}):
+            self.assertEqual(Algorithm.base62_encode(62), "0000010")
+            self.assertEqual(Algorithm.base62_encode_many([62, 0]), ["0000010", "0000000"])
+        self.assertEqual(Algorithm.base62_decode("0000010"), 62)
+        self.assertEqual(Algorithm.base62_decode_many(["10", "!", "zzzzzzzzzzz"]), [62, None, None])
@@ -0,0 +1,112 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Database Connection Pool Test
+"""
+
+# System
+import os
+import tempfile
+from unittest import mock
+from django.db import connections
+from django.db.backends.sqlite3 import base
+from django.test import SimpleTestCase
+
+# Project
+from core.backends.pool import ConnectionPool, PooledDatabaseWrapperMixin
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+
+    def close(self):
+        self.closed = True
+
+
+def ping(connection):
+    if not connection.healthy:
+        raise ConnectionError("ping failed")
+
+
+class PooledSQLiteWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    """
+    mixin 테스트용 SQLite backend
+    """
+
+    def ping_connection(self, connection):
+        connection.execute("SELECT 1")
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    """
+    Connection pool 테스트
+    """
+
+    # 반환한 connection을 최근 것부터 재사용하고, size를 넘으면 닫음
+    def test_pool_reuse(self):
+        pool = ConnectionPool(size=1)
+        first, second = pool.acquire(FakeConnection), pool.acquire(FakeConnection)
+
+        pool.release(first)
+        pool.release(second)
+        self.assertTrue(second.closed)
+        self.assertEqual(len(pool), 1)
+
+        self.assertIs(pool.acquire(FakeConnection), first)
+        self.assertEqual(pool.stats, {"created": 2, "reused": 1, "discarded": 1})
+
+    # 오래 쉰 connection은 ping으로 확인하고, max_lifetime이 지난 connection은 닫음
+    def test_pool_health_check(self):
+        pool = ConnectionPool(size=2, max_lifetime=60, ping_after=10, ping=ping)
+
+        with mock.patch("core.backends.pool.time.monotonic", return_value=0):
+            broken = pool.acquire(FakeConnection)
+            pool.release(broken)
+        broken.healthy = False
+
+        # ping_after 이전에는 확인하지 않고 재사용
+        with mock.patch("core.backends.pool.time.monotonic", return_value=5):
+            self.assertIs(pool.acquire(FakeConnection), broken)
+            pool.release(broken)
+
+        with mock.patch("core.backends.pool.time.monotonic", return_value=20):
+            connection = pool.acquire(FakeConnection)
+        self.assertIsNot(connection, broken)
+        self.assertTrue(broken.closed)
+
+        with mock.patch("core.backends.pool.time.monotonic", return_value=100):
+            pool.release(connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(len(pool), 0)
+
+    # DatabaseWrapper close() 시 pool에 반환하고 다음 connect()에서 재사용 (트랜잭션 중이면 닫음)
+    def test_pool_database_wrapper(self):
+        with tempfile.TemporaryDirectory() as directory:
+            settings_dict = {
+                **connections["default"].settings_dict,
+                "NAME": os.path.join(directory, "pool.sqlite3"),
+                "POOL": {"SIZE": 2, "MAX_LIFETIME": 60, "PING_AFTER": 0},
+            }
+            wrapper = PooledSQLiteWrapper(settings_dict, alias="pool_test")
+            try:
+                wrapper.connect()
+                raw = wrapper.connection
+                wrapper.close()
+                self.assertEqual(len(wrapper.get_pool()), 1)
+
+                wrapper.connect()
+                self.assertIs(wrapper.connection, raw)
+                with wrapper.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    self.assertEqual(cursor.fetchone(), (1,))
+
+                wrapper.in_atomic_block = True
+                wrapper.close()
+                wrapper.in_atomic_block = False
+                self.assertEqual(len(wrapper.get_pool()), 0)
+            finally:
+                wrapper.close()
+                wrapper.get_pool().clear()
+                PooledSQLiteWrapper._pools.pop("pool_test", None)
@@ -0,0 +1,141 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Click Counter Test
+"""
+
+# System
+import asyncio
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+# Project
+from core import flusher
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.counters import CacheClickBuffer, ClickCounter
+from apps.short_url.models import ShortURL
+
+
+class ClickCounterTest(TestCase):
+    """
+    Redirect 클릭 수 카운터 테스트
+    """
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.short_url = ShortURL.objects.create(
+            url=cls.origin_url,
+            hash_value=Algorithm.hash_url(cls.origin_url),
+            user=user,
+        )
+        cls.encoded = Algorithm.base62_encode(cls.short_url.hash_value)
+
+    def setUp(self):
+        ClickCounter.reset()
+        ShortURLCache.clear()
+        cache.clear()
+
+    def tearDown(self):
+        ClickCounter.reset()
+
+    # 누적 시에는 DB를 조회하지 않고, flush 시 한 번에 반영
+    def test_record_and_flush(self):
+        with self.assertNumQueries(0):
+            for _ in range(3):
+                ClickCounter.record(self.short_url.id)
+
+        with self.assertNumQueries(1):
+            ClickCounter.flush()
+
+        self.short_url.refresh_from_db()
+        self.assertEqual(self.short_url.request_count, 3)
+
+    # flush 시 updated_at은 변경되지 않음
+    def test_flush_keep_updated_at(self):
+        updated_at = self.short_url.updated_at
+
+        ClickCounter.record(self.short_url.id)
+        ClickCounter.flush()
+
+        self.short_url.refresh_from_db()
+        self.assertEqual(self.short_url.updated_at, updated_at)
+
+    # 버퍼가 가득 차면 즉시 flush
+    @override_settings(CLICK_COUNTER={**settings.CLICK_COUNTER, "MAX_BUFFER": 1})
+    def test_record_max_buffer(self):
+        ClickCounter.record(self.short_url.id)
+
+        self.short_url.refresh_from_db()
+        self.assertEqual(self.short_url.request_count, 1)
+
+    # 공유 캐시 카운터 사용
+    @override_settings(CLICK_COUNTER={**settings.CLICK_COUNTER, "BACKEND": "cache"})
+    def test_record_cache_backend(self):
+        ClickCounter.record(self.short_url.id)
+        ClickCounter.record(self.short_url.id, count=2)
+        ClickCounter.flush()
+
+        self.short_url.refresh_from_db()
+        self.assertEqual(self.short_url.request_count, 3)
+
+    # 두 워커가 같은 키를 동시에 drain 해도 차감 결과만큼만 가져가 중복 반영하지 않음
+    def test_cache_buffer_concurrent_drain(self):
+        first, second = CacheClickBuffer(alias="default", ttl=60), CacheClickBuffer(alias="default", ttl=60)
+        # 같은 저장소를 쓰는 다른 워커의 cache 연결
+        first._cache = caches.create_connection("default")
+        first.add(self.short_url.id, 3)
+        second.add(self.short_url.id, 2)
+        key = first.make_key(self.short_url.id)
+
+        # first가 값을 읽은 직후 second가 먼저 drain
+        stale = cache.get_many([key])
+        drained = {}
+
+        def get_many(keys):
+            drained.update(second.drain())
+            return stale
+
+        with mock.patch.object(first._cache, "get_many", side_effect=get_many):
+            self.assertEqual(dict(first.drain()), {})
+
+        self.assertEqual(drained, {self.short_url.id: 5})
+        self.assertEqual(cache.get(key), 0)
+
+        # 그 사이 증가한 값은 다음 drain에서 가져감
+        second.add(self.short_url.id, 1)
+        self.assertEqual(dict(second.drain()), {self.short_url.id: 1})
+
+    # Redirect 요청은 클릭 수를 버퍼에만 누적
+    def test_redirect_record(self):
+        url = reverse("get-redirect", kwargs={"url": self.encoded})
+        response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 302)
+
+        self.short_url.refresh_from_db()
+        self.assertEqual(self.short_url.request_count, 0)
+
+        ClickCounter.flush()
+
+        self.short_url.refresh_from_db()
+        self.assertEqual(self.short_url.request_count, 1)
+
+    # async view용 기록은 공유 캐시 카운터도 기다리지 않고 처리
+    @override_settings(CLICK_COUNTER={**settings.CLICK_COUNTER, "BACKEND": "cache"})
+    async def test_arecord_cache_backend(self):
+        await ClickCounter.arecord(self.short_url.id)
+        await ClickCounter.arecord(self.short_url.id, count=2)
+        await asyncio.gather(*flusher._tasks)
+
+        await sync_to_async(ClickCounter.flush)()
+
+        request_count = await ShortURL.objects.filter(id=self.short_url.id).values_list("request_count", flat=True).aget()
+        self.assertEqual(request_count, 3)
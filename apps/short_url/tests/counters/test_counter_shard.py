@@ -0,0 +1,137 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Counter Shard Test
+"""
+
+# System
+import io
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+# Project
+from core.jwt import CustomJWTAuthentication
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.counters import ClickCounter
+from apps.short_url.reaper import ShortURLReaper
+from apps.short_url.models import ShortURL, ShortURLArchive, ShortURLCounterShard
+
+
+class ShortURLCounterShardTest(TestCase):
+    """
+    클릭 수 shard 테이블 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+        cls.short_urls = []
+        for i in range(3):
+            url = f"https://www.google.com/{i}"
+            cls.short_urls.append(ShortURL.objects.create(url=url, hash_value=Algorithm.hash_url(url), request_count=10, user=cls.user))
+
+    def setUp(self):
+        ClickCounter.reset()
+        ShortURLCache.clear()
+        cache.clear()
+
+    def tearDown(self):
+        ClickCounter.reset()
+
+    # 증가량은 shard 중 하나에 더해지고, 같은 shard는 충돌 시 합산
+    def test_increment_many(self):
+        first, second, _ = self.short_urls
+
+        # SAVEPOINT, INSERT 한 번, RELEASE
+        with self.assertNumQueries(3):
+            ShortURLCounterShard.objects.increment_many({first.id: 2, second.id: 3}, shards=1)
+        ShortURLCounterShard.objects.increment_many({first.id: 5}, shards=1)
+
+        self.assertEqual(ShortURLCounterShard.objects.count(), 2)
+        self.assertEqual(ShortURLCounterShard.objects.get_totals([first.id, second.id]), {first.id: 7, second.id: 3})
+
+        for _ in range(20):
+            ShortURLCounterShard.objects.increment_many({first.id: 1}, shards=4)
+        self.assertLessEqual(ShortURLCounterShard.objects.filter(short_url=first).count(), 4)
+        self.assertTrue(set(ShortURLCounterShard.objects.filter(short_url=first).values_list("shard", flat=True)) <= {0, 1, 2, 3})
+        self.assertEqual(ShortURLCounterShard.objects.get_totals([first.id]), {first.id: 27})
+
+        # short_url 행은 변경되지 않음
+        first.refresh_from_db()
+        self.assertEqual(first.request_count, 10)
+
+    # SHARDS 설정 시 flush는 shard 테이블에 기록
+    @override_settings(CLICK_COUNTER={**settings.CLICK_COUNTER, "SHARDS": 4})
+    def test_flush_shards(self):
+        first, second, _ = self.short_urls
+        for _ in range(3):
+            ClickCounter.record(first.id)
+        ClickCounter.record(second.id, count=2)
+
+        with self.assertNumQueries(3):
+            ClickCounter.flush()
+
+        self.assertEqual(ShortURLCounterShard.objects.get_totals([first.id, second.id]), {first.id: 3, second.id: 2})
+        first.refresh_from_db()
+        self.assertEqual(first.request_count, 10)
+
+    # 조회 시 request_count와 shard 합계를 더함
+    def test_with_request_count(self):
+        first, second, third = self.short_urls
+        ShortURLCounterShard.objects.bulk_create(
+            [
+                ShortURLCounterShard(short_url=first, shard=0, count=2),
+                ShortURLCounterShard(short_url=first, shard=3, count=5),
+                ShortURLCounterShard(short_url=second, shard=1, count=1),
+            ]
+        )
+
+        totals = dict(ShortURL.objects.with_request_count().values_list("id", "total_request_count"))
+        self.assertEqual(totals, {first.id: 17, second.id: 11, third.id: 10})
+
+        response = self.client.get(path=reverse("api-short-url:post-short-url"), HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({item["url"]: item["request_count"] for item in response.data["data"]}, {s.url: totals[s.id] for s in self.short_urls})
+
+    # compaction은 shard를 request_count에 합치고 삭제
+    def test_compact(self):
+        first, second, _ = self.short_urls
+        ShortURLCounterShard.objects.bulk_create(
+            [
+                ShortURLCounterShard(short_url=first, shard=0, count=2),
+                ShortURLCounterShard(short_url=first, shard=1, count=5),
+                ShortURLCounterShard(short_url=second, shard=0, count=7),
+                ShortURLCounterShard(short_url=second, shard=2, count=0),
+            ]
+        )
+
+        self.assertEqual(ShortURLCounterShard.objects.compact(batch_size=3), 4)
+
+        self.assertFalse(ShortURLCounterShard.objects.exists())
+        self.assertEqual(dict(ShortURL.objects.values_list("id", "request_count")), {first.id: 17, second.id: 17, self.short_urls[2].id: 10})
+
+        # 관리 명령
+        ShortURLCounterShard.objects.create(short_url=first, shard=0, count=1)
+        out = io.StringIO()
+        call_command("compact_short_url_counters", stdout=out)
+        self.assertIn("compacted 1 counter shards", out.getvalue())
+        first.refresh_from_db()
+        self.assertEqual(first.request_count, 18)
+
+    # 정리된 Short URL은 합치지 않은 shard까지 보관 후 shard 삭제
+    def test_reap_shards(self):
+        first = self.short_urls[0]
+        ShortURL.objects.filter(id=first.id).update(deleted_at=datetime.now() - timedelta(days=40))
+        ShortURLCounterShard.objects.create(short_url=first, shard=0, count=4)
+
+        self.assertEqual(ShortURLReaper.reap(retention_days=30, sleep=0), 1)
+
+        self.assertEqual(ShortURLArchive.objects.get(short_url_id=first.id).request_count, 14)
+        self.assertFalse(ShortURLCounterShard.objects.filter(short_url_id=first.id).exists())
@@ -0,0 +1,164 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Short URL Hot Key Test
+"""
+
+# System
+import random
+from collections import Counter
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core.algorithm import Algorithm
+from core.heavy_hitters import SpaceSaving
+from core.jwt import CustomJWTAuthentication
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.counters import CacheClickBuffer
+from apps.short_url.hotkeys import ShortURLHotKeys
+from apps.short_url.models import ShortURL
+from apps.short_url.redirect import resolve_redirect
+
+
+class SpaceSavingTest(SimpleTestCase):
+    """
+    Space-Saving heavy hitter tracker 테스트
+    """
+
+    # 카운터 수보다 값 종류가 많아도 자주 등장한 값은 실제 횟수 범위 [count - error, count] 안에서 추적
+    def test_space_saving_top(self):
+        rng = random.Random(0)
+        tracker = SpaceSaving(capacity=50)
+        actual = Counter()
+        for _ in range(50000):
+            key = rng.randrange(5) if rng.random() < 0.3 else rng.randrange(100000)
+            actual[key] += 1
+            tracker.add(key)
+
+        self.assertEqual(len(tracker), 50)
+        top = tracker.top(5)
+        self.assertEqual({key for key, _, _ in top}, set(range(5)))
+        for key, count, error in top:
+            self.assertLessEqual(count - error, actual[key])
+            self.assertGreaterEqual(count, actual[key])
+
+    # decay 후에도 순서 유지, 0이 된 카운터는 제거
+    def test_space_saving_decay(self):
+        tracker = SpaceSaving(capacity=10)
+        for key, count in (("a", 8), ("b", 4), ("c", 1)):
+            for _ in range(count):
+                tracker.add(key)
+
+        tracker.decay(0.5)
+        self.assertEqual(tracker.top(3), [("a", 4, 0), ("b", 2, 0)])
+        self.assertEqual(tracker.add("c"), 1)
+
+
+@override_settings(SHORT_URL_HOT_KEYS={**settings.SHORT_URL_HOT_KEYS, "ENABLED": True, "MIN_COUNT": 5, "TOP_K": 1})
+class ShortURLHotKeysTest(APITestCase):
+    """
+    hot key 선정, 고정 tier, 클릭 수 분산, 관리 API 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.admin = User.objects.create_superuser(email="admin@test.com", password="password1234")
+
+        cls.hot = ShortURL.objects.create_short_url(url="https://www.google.com/hot", user=cls.user)
+        cls.cold = ShortURL.objects.create_short_url(url="https://www.google.com/cold", user=cls.user)
+        cls.hot_code = Algorithm.base62_encode(cls.hot.hash_value)
+        cls.cold_code = Algorithm.base62_encode(cls.cold.hash_value)
+
+    def setUp(self):
+        ShortURLHotKeys.reset()
+        ShortURLCache.clear()
+        cache.clear()
+
+    def tearDown(self):
+        ShortURLHotKeys.reset()
+
+    def redirect(self, code, count):
+        for _ in range(count):
+            self.assertEqual(resolve_redirect(code)[1], None)
+
+    # 상위 TOP_K 중 MIN_COUNT 이상인 코드만 고정 tier에 두고, 고정된 코드는 DB 조회 없이 반환
+    def test_hot_keys_promote(self):
+        self.redirect(self.hot_code, 10)
+        self.redirect(self.cold_code, 3)
+        ShortURLHotKeys.refresh()
+
+        self.assertEqual(ShortURLCache.get_pinned(), {self.hot.hash_value})
+        self.assertEqual(ShortURLHotKeys.observe(self.hot.hash_value), settings.SHORT_URL_HOT_KEYS["COUNTER_SHARDS"])
+        self.assertEqual(ShortURLHotKeys.observe(self.cold.hash_value), 1)
+
+        # LRU, 공유 캐시가 비어 있어도 고정 tier에서 반환
+        ShortURLCache._local = None
+        cache.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_redirect(self.hot_code)[0], "https://www.google.com/hot")
+
+    # hot key가 여러 개여도 갱신은 DB 조회 한 번, 삭제된 코드는 고정하지 않음
+    @override_settings(SHORT_URL_HOT_KEYS={**settings.SHORT_URL_HOT_KEYS, "ENABLED": True, "MIN_COUNT": 5, "TOP_K": 3})
+    def test_hot_keys_refresh_batch(self):
+        deleted = ShortURL.objects.create_short_url(url="https://www.google.com/deleted", user=self.user)
+        self.redirect(self.hot_code, 10)
+        self.redirect(self.cold_code, 10)
+        self.redirect(Algorithm.base62_encode(deleted.hash_value), 10)
+        ShortURL.objects.filter(id=deleted.id).update(deleted_at=datetime.now())
+
+        with self.assertNumQueries(1):
+            ShortURLHotKeys.refresh()
+
+        self.assertEqual(ShortURLCache.get_pinned(), {self.hot.hash_value, self.cold.hash_value})
+        self.assertEqual(cache.get(ShortURLCache.make_key(self.cold.hash_value))["url"], "https://www.google.com/cold")
+
+    # 갱신 주기마다 DB에서 다시 읽고, 요청이 줄어들면(DECAY) 고정 해제
+    def test_hot_keys_refresh_and_demote(self):
+        self.redirect(self.hot_code, 10)
+        ShortURLHotKeys.refresh()
+
+        # signal 없이 변경된 값도 다음 갱신에서 반영
+        ShortURL.objects.filter(id=self.hot.id).update(url="https://www.google.com/moved")
+        ShortURLHotKeys.refresh()
+        self.assertEqual(resolve_redirect(self.hot_code)[0], "https://www.google.com/moved")
+
+        for _ in range(3):
+            ShortURLHotKeys.refresh()
+        self.assertFalse(ShortURLHotKeys.is_hot(self.hot.hash_value))
+        self.assertEqual(ShortURLCache.get_pinned(), set())
+
+    # hot key 클릭 수는 공유 카운터 여러 개에 나누어 누적하고 drain 시 합산
+    def test_hot_keys_sharded_counter(self):
+        buffer = CacheClickBuffer(alias="default")
+        for _ in range(40):
+            buffer.add(self.hot.id, 1, shards=8)
+        buffer.add(self.cold.id, 2)
+
+        self.assertGreater(len(buffer._dirty), 2)
+        self.assertEqual(dict(buffer.drain()), {self.hot.id: 40, self.cold.id: 2})
+
+    # 관리자만 워커별 기록을 합산하여 조회
+    def test_hot_keys_api(self):
+        self.redirect(self.hot_code, 10)
+        ShortURLHotKeys.refresh()
+        url = reverse("api-short-url:get-hot-keys")
+
+        token = CustomJWTAuthentication.create_access_token(user=self.user)
+        response = self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertNotEqual(response.status_code, 200)
+
+        token = CustomJWTAuthentication.create_access_token(user=self.admin)
+        response = self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(response.status_code, 200)
+
+        data = response.data["data"]
+        self.assertEqual(data["keys"], [{"code": self.hot_code, "url": "https://www.google.com/hot", "count": 10, "hot_workers": 1}])
+        self.assertEqual(data["workers"][0]["worker"], ShortURLHotKeys.get_worker_name())
+        self.assertEqual(data["workers"][0]["hot"], 1)
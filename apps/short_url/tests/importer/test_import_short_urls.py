@@ -0,0 +1,157 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Import Test
+"""
+
+# System
+import io
+import os
+import json
+import tempfile
+from django.core.management import call_command
+from django.test import TestCase
+
+# Project
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.importer import ShortURLImporter
+from apps.short_url.export import ShortURLExporter
+from apps.short_url.models import ShortURL
+
+
+class ImportShortURLsTest(TestCase):
+    """
+    Short URL 가져오기 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.other_user = User.objects.create_user(email="other@test.com", password="password1234")
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def call(self, *args, **options):
+        stdout = io.StringIO()
+        call_command("import_short_urls", *args, email=self.user.email, stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_import_csv(self):
+        path = self.write(
+            "links.csv",
+            "code,url,request_count,expiration_date\n"
+            "abc,https://www.google.com/0,3,2099-01-01T00:00:00\n"
+            ",https://www.google.com/1,,\n"
+            ",not-a-url,,\n"
+            "!!,https://www.google.com/2,,\n",
+        )
+
+        output = self.call(path, chunk_size=2, batch_size=1)
+
+        self.assertIn("imported=2 invalid=2 conflict=0", output)
+        short_url = ShortURL.objects.get(live_hash_value=Algorithm.base62_decode("abc"))
+        self.assertEqual(short_url.url, "https://www.google.com/0")
+        self.assertEqual(short_url.request_count, 3)
+        self.assertEqual(short_url.expiration_date.year, 2099)
+        self.assertEqual(short_url.user, self.user)
+        self.assertTrue(ShortURL.objects.filter(live_hash_value=Algorithm.hash_url("https://www.google.com/1")).exists())
+
+    # 모델 필드 길이를 넘는 URL은 잘라 저장하지 않고 invalid
+    def test_import_too_long_url(self):
+        long_url = "https://www.google.com/" + "a" * (ShortURL._meta.get_field("url").max_length - 22)
+        path = self.write("links.csv", f"code,url\n,{long_url}\n,https://www.google.com/1\n")
+
+        output = self.call(path)
+
+        self.assertIn("read=2 imported=1 invalid=1 conflict=0", output)
+        self.assertEqual(list(ShortURL.objects.values_list("url", flat=True)), ["https://www.google.com/1"])
+
+        # parse_row를 거치지 않고 넣은 행도 검사
+        importer = ShortURLImporter(user=self.user)
+        importer.import_chunk([(long_url, None, None, None, 0)])
+        self.assertEqual(importer.stats["invalid"], 1)
+        self.assertEqual(ShortURL.objects.count(), 1)
+
+    def test_import_ndjson_conflict(self):
+        """
+        지정한 code가 다른 URL에 사용 중이면 건너뛰고, 생성한 코드가 충돌하면 다음 코드로 생성
+        """
+        ShortURL.objects.create(url="https://www.naver.com", hash_value=Algorithm.base62_decode("taken"), user=self.other_user)
+        ShortURL.objects.create(url="https://www.daum.net", hash_value=Algorithm.hash_url("https://www.google.com/0"), user=self.other_user)
+
+        # 같은 code를 가진 두 번째 행도 conflict
+        rows = [
+            {"code": "taken", "url": "https://www.google.com/taken"},
+            {"url": "https://www.google.com/0"},
+            {"code": "taken", "url": "https://www.naver.com"},
+        ]
+        path = self.write("links.ndjson", "\n".join(json.dumps(row) for row in rows) + "\n\n{invalid\n")
+
+        output = self.call(path)
+
+        self.assertIn("read=4 imported=1 invalid=1 conflict=2", output)
+        self.assertFalse(ShortURL.objects.filter(url="https://www.google.com/taken").exists())
+        short_url = ShortURL.objects.get(url="https://www.google.com/0")
+        self.assertEqual(short_url.hash_value, Algorithm.generate_code(url=short_url.url, attempt=1))
+
+    def test_import_duplicate_url(self):
+        """
+        이미 다른 코드로 유효한 URL은 코드를 다시 생성하지 않고 conflict로 처리
+        """
+        ShortURL.objects.create(url="https://www.naver.com", hash_value=Algorithm.base62_decode("naver"), user=self.other_user)
+        path = self.write("links.ndjson", json.dumps({"url": "https://www.naver.com"}) + "\n")
+
+        output = self.call(path)
+
+        self.assertIn("read=1 imported=0 invalid=0 conflict=1", output)
+        self.assertEqual(ShortURL.objects.filter(url="https://www.naver.com").count(), 1)
+
+    def test_import_resume(self):
+        """
+        checkpoint에 기록된 위치부터 이어서 가져옴
+        """
+        path = self.write("links.csv", "url\n" + "".join(f"https://www.google.com/{i}\n" for i in range(5)))
+        checkpoint = os.path.join(self.directory.name, "checkpoint")
+        self.write("checkpoint", "3")
+
+        output = self.call(path, chunk_size=1, checkpoint=checkpoint)
+
+        self.assertIn("resume from offset 3", output)
+        self.assertEqual(sorted(ShortURL.objects.values_list("url", flat=True)), ["https://www.google.com/3", "https://www.google.com/4"])
+        with open(checkpoint) as f:
+            self.assertEqual(f.read(), "5")
+
+        # 같은 행을 다시 가져와도 중복 생성하지 않음
+        self.call(path, offset=0)
+        self.assertEqual(ShortURL.objects.count(), 5)
+
+    def test_import_exported(self):
+        """
+        내보내기 결과를 그대로 가져올 수 있음
+        """
+        for i in range(3):
+            ShortURL.objects.create_short_url(url=f"https://www.google.com/{i}", user=self.other_user)
+        exported = "".join(ShortURLExporter(ShortURL.objects.all()).stream("csv"))
+        ShortURL.objects.all().delete()
+
+        importer = ShortURLImporter(user=self.user, chunk_size=2)
+        stats = importer.run(io.StringIO(exported), "csv")
+
+        self.assertEqual(stats["imported"], 3)
+        # created_at을 제외한 컬럼 비교
+        imported = "".join(ShortURLExporter(ShortURL.objects.all()).stream("csv"))
+        self.assertEqual(
+            sorted(line.rsplit(",", 1)[0] for line in imported.splitlines()[1:]),
+            sorted(line.rsplit(",", 1)[0] for line in exported.splitlines()[1:]),
+        )
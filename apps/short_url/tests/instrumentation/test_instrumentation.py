@@ -0,0 +1,182 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Request Instrumentation Test
+"""
+
+# System
+import re
+from wsgiref.util import setup_testing_defaults
+from django.conf import settings
+from django.core import signals
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+# Project
+from core.jwt import CustomJWTAuthentication
+from core.algorithm import Algorithm
+from core.metrics import Counter, Histogram, registry
+from core.instrumentation import CACHE_LOOKUPS, DB_QUERIES, REQUEST_DURATION, Instrumentation
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+from apps.short_url.redirect import RedirectWSGIMiddleware
+
+SERVER_TIMING = re.compile(r'^total;dur=[\d.]+, db;dur=[\d.]+;desc="(\d+) queries", cache;desc="hit=(\d+) miss=(\d+)", serializer;dur=([\d.]+)$')
+
+
+class MetricsTest(SimpleTestCase):
+    """
+    Prometheus text format metric 테스트
+    """
+
+    # bucket은 누적 개수, +Inf는 전체 개수
+    def test_histogram_render(self):
+        histogram = Histogram("test_seconds", "test", buckets=(0.1, 1), labelnames=("view",))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, ("a",))
+
+        self.assertEqual(
+            histogram.render(),
+            [
+                "# HELP test_seconds test",
+                "# TYPE test_seconds histogram",
+                'test_seconds_bucket{view="a",le="0.1"} 2',
+                'test_seconds_bucket{view="a",le="1"} 3',
+                'test_seconds_bucket{view="a",le="+Inf"} 4',
+                'test_seconds_sum{view="a"} 3.65',
+                'test_seconds_count{view="a"} 4',
+            ],
+        )
+
+    # label 값 escape
+    def test_counter_render(self):
+        counter = Counter("test_total", "test", labelnames=("path",))
+        counter.inc(labels=('a"b\\',))
+        counter.inc(2, labels=('a"b\\',))
+
+        self.assertEqual(counter.render()[-1], 'test_total{path="a\\"b\\\\"} 3')
+
+
+class InstrumentationTest(TestCase):
+    """
+    요청별 성능 측정 테스트
+    """
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+        short_url = ShortURL.objects.create(url=cls.origin_url, hash_value=Algorithm.hash_url(cls.origin_url), user=cls.user)
+        cls.encoded = Algorithm.base62_encode(short_url.hash_value)
+
+    def setUp(self):
+        ShortURLCache.clear()
+        cache.clear()
+        registry.clear()
+
+    def get_server_timing(self, response):
+        match = SERVER_TIMING.match(response["Server-Timing"])
+        self.assertIsNotNone(match, response["Server-Timing"])
+        return [float(value) for value in match.groups()]
+
+    # API 요청은 DB 쿼리, 캐시, 응답 직렬화 시간을 Server-Timing으로 응답하고 histogram에 기록
+    def test_api_server_timing(self):
+        path = reverse("api-short-url:post-short-url")
+        response = self.client.get(path=path, HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}")
+        self.assertEqual(response.status_code, 200)
+
+        queries, hits, misses, serializer = self.get_server_timing(response)
+        self.assertGreater(queries, 0)
+        # 유저 캐시는 처음 조회 시 miss
+        self.assertEqual((hits, misses), (0, 1))
+        self.assertGreater(serializer, 0)
+
+        view = "api-short-url:post-short-url"
+        self.assertEqual(REQUEST_DURATION.get((view, "GET", "200"))[1], 1)
+        self.assertEqual(DB_QUERIES.get((view,)), (queries, 1))
+        self.assertEqual(CACHE_LOOKUPS.get((view, "user", "miss")), 1)
+
+        response = self.client.get(path=path, HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}")
+        self.assertEqual(self.get_server_timing(response)[1:3], [1, 0])
+        self.assertEqual(CACHE_LOOKUPS.get((view, "user", "hit")), 1)
+
+    # Redirect view는 DB 조회 없이 캐시에서 응답하면 hit
+    def test_redirect_server_timing(self):
+        path = reverse("get-redirect", kwargs={"url": self.encoded})
+
+        response = self.client.get(path=path)
+        self.assertEqual(response.status_code, 302)
+        queries, hits, misses, _ = self.get_server_timing(response)
+        self.assertEqual((hits, misses), (0, 1))
+        self.assertGreater(queries, 0)
+
+        response = self.client.get(path=path)
+        self.assertEqual(self.get_server_timing(response)[:3], [0, 1, 0])
+
+    # Redirect dispatcher(Django 미들웨어를 거치지 않는 경로)도 측정
+    def test_dispatcher_server_timing(self):
+        signals.request_started.disconnect(close_old_connections)
+        self.addCleanup(signals.request_started.connect, close_old_connections)
+
+        environ = {"PATH_INFO": f"/{self.encoded}", "REQUEST_METHOD": "GET"}
+        setup_testing_defaults(environ)
+        response = {}
+
+        def start_response(status, headers):
+            response.update(headers)
+
+        RedirectWSGIMiddleware(None)(environ, start_response)
+
+        self.assertEqual(response["Location"], self.origin_url)
+        self.assertEqual(self.get_server_timing(response)[1:3], [0, 1])
+        self.assertEqual(REQUEST_DURATION.get(("get-redirect", "GET", "302"))[1], 1)
+
+    # 샘플링되지 않은 요청은 측정하지 않음
+    @override_settings(INSTRUMENTATION={**settings.INSTRUMENTATION, "SAMPLE_RATE": 0})
+    def test_not_sampled(self):
+        response = self.client.get(path=reverse("get-redirect", kwargs={"url": self.encoded}))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertNotIn("Server-Timing", response)
+        self.assertIsNone(Instrumentation.current())
+        self.assertEqual(REQUEST_DURATION.get(("get-redirect", "GET", "302")), (0, 0))
+
+    # Server-Timing 헤더 없이 histogram만 기록
+    @override_settings(INSTRUMENTATION={**settings.INSTRUMENTATION, "SERVER_TIMING": False})
+    def test_server_timing_disabled(self):
+        response = self.client.get(path=reverse("get-redirect", kwargs={"url": self.encoded}))
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(REQUEST_DURATION.get(("get-redirect", "GET", "302"))[1], 1)
+
+    # /metrics는 METRICS_TOKEN이 일치하는 localhost 요청에만 Prometheus text format으로 응답
+    @override_settings(INSTRUMENTATION={**settings.INSTRUMENTATION, "METRICS_TOKEN": "metrics-token"})
+    def test_metrics(self):
+        self.client.get(path=reverse("get-redirect", kwargs={"url": self.encoded}))
+
+        response = self.client.get(path=reverse("get-metrics"), HTTP_AUTHORIZATION="Bearer metrics-token")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = response.content.decode()
+        self.assertIn("# TYPE http_request_duration_seconds histogram", body)
+        self.assertIn('http_request_duration_seconds_count{view="get-redirect",method="GET",status="302"} 1', body)
+        self.assertIn('http_request_cache_lookups_total{view="get-redirect",cache="short_url",result="miss"} 1', body)
+
+        response = self.client.get(path=reverse("get-metrics"), HTTP_AUTHORIZATION="Bearer metrics-token", REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, 404)
+
+        # 같은 호스트의 reverse proxy를 거친 요청(REMOTE_ADDR 127.0.0.1)도 token이 없거나 다르면 404
+        # ASCII가 아닌 헤더도 500이 아닌 404
+        for headers in ({}, {"HTTP_AUTHORIZATION": "Bearer wrong"}, {"HTTP_AUTHORIZATION": "Bearer tökén"}):
+            self.assertEqual(self.client.get(path=reverse("get-metrics"), **headers).status_code, 404)
+
+    # METRICS_TOKEN이 없으면(기본) /metrics 사용 안 함
+    @override_settings(INSTRUMENTATION={**settings.INSTRUMENTATION, "METRICS_TOKEN": ""})
+    def test_metrics_disabled(self):
+        response = self.client.get(path=reverse("get-metrics"), HTTP_AUTHORIZATION="Bearer ")
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,73 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Migration Test
+"""
+
+# System
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+# Project
+from core.algorithm import Algorithm
+
+
+class ShortURLMigrationTest(TransactionTestCase):
+    """
+    기존 데이터가 있는 상태에서 unique index를 추가하는 migration 테스트
+    """
+
+    databases = {"default"}
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate([("short_url", target)])
+        return executor.loader.project_state([("short_url", target)]).apps
+
+    def setUp(self):
+        self.addCleanup(self.migrate, self.latest)
+        apps = self.migrate("0001_initial")
+        User = apps.get_model("users", "User")
+        self.user = User.objects.create(email="test@test.com", password="password1234")
+
+    @property
+    def latest(self):
+        executor = MigrationExecutor(connection)
+        return executor.loader.graph.leaf_nodes("short_url")[0][1]
+
+    # 같은 hash value를 가진 유효 행은 가장 오래된 행만 남기고 soft delete
+    def test_live_hash_duplicates(self):
+        apps = self.migrate("0001_initial")
+        ShortURL = apps.get_model("short_url", "ShortURL")
+        first = ShortURL.objects.create(url="https://www.google.com/1", hash_value="0a1b2c3d4e", user_id=self.user.id)
+        second = ShortURL.objects.create(url="https://www.google.com/2", hash_value="0a1b2c3d4e", user_id=self.user.id)
+        other = ShortURL.objects.create(url="https://www.google.com/3", hash_value="0a1b2c3d4f", user_id=self.user.id)
+
+        with self.assertLogs("", level="WARNING") as logs:
+            apps = self.migrate("0003_short_url_integer_hash_value")
+        self.assertIn(str(second.id), "\n".join(logs.output))
+
+        ShortURL = apps.get_model("short_url", "ShortURL")
+        live = dict(ShortURL.objects.filter(deleted_at=None).values_list("id", "hash_value"))
+        self.assertEqual(live, {first.id: 0x0A1B2C3D4E, other.id: 0x0A1B2C3D4F})
+        self.assertIsNotNone(ShortURL.objects.get(id=second.id).deleted_at)
+
+    # 같은 URL의 유효 행은 가장 오래된 행만 digest를 채우고 나머지는 soft delete
+    def test_live_url_duplicates(self):
+        apps = self.migrate("0004_short_url_archive")
+        ShortURL = apps.get_model("short_url", "ShortURL")
+        urls = ["https://www.google.com/a", "https://www.google.com/b", "https://www.google.com/a", "https://www.google.com/A"]
+        rows = [ShortURL.objects.create(url=url, hash_value=i, user_id=self.user.id) for i, url in enumerate(urls)]
+
+        with self.assertLogs("", level="WARNING") as logs:
+            apps = self.migrate("0005_short_url_url_digest")
+        self.assertIn(str([rows[2].id]), "\n".join(logs.output))
+
+        ShortURL = apps.get_model("short_url", "ShortURL")
+        live = dict(ShortURL.objects.filter(deleted_at=None).values_list("id", "url_digest"))
+        self.assertEqual(live, {row.id: Algorithm.digest_url(row.url) for row in (rows[0], rows[1], rows[3])})
+        duplicate = ShortURL.objects.get(id=rows[2].id)
+        self.assertIsNotNone(duplicate.deleted_at)
+        self.assertIsNone(duplicate.url_digest)
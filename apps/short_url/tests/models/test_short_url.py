@@ -0,0 +1,93 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Model Test
+"""
+
+# System
+from datetime import datetime, timedelta
+from unittest import mock
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+# Project
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.models import ShortURL
+from apps.short_url.manager import ShortURLManager
+
+
+class ShortURLModelTest(TestCase):
+    """
+    Short URL 모델 제약 조건 테스트
+    """
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.hash_value = Algorithm.hash_url(cls.origin_url)
+
+    # 유효한 hash value는 중복 불가
+    def test_live_hash_value_unique(self):
+        ShortURL.objects.create(url=self.origin_url, hash_value=self.hash_value, user=self.user)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ShortURL.objects.create(url=self.origin_url, hash_value=self.hash_value, user=self.user)
+
+    # 삭제된 URL의 hash value는 다시 사용 가능
+    def test_deleted_hash_value_reuse(self):
+        ShortURL.objects.create(
+            url=self.origin_url,
+            hash_value=self.hash_value,
+            deleted_at=datetime.now(),
+            user=self.user,
+        )
+        ShortURL.objects.create(url=self.origin_url, hash_value=self.hash_value, user=self.user)
+
+        self.assertEqual(ShortURL.objects.filter(hash_value=self.hash_value).count(), 2)
+
+    # 생성-또는-조회: 새로 생성, 같은 사용자의 유효한 URL은 기존 코드 반환 (SQLite ON CONFLICT ... RETURNING)
+    def test_create_or_get_short_url(self):
+        hash_value, created = ShortURL.objects.create_or_get_short_url(url=self.origin_url, user=self.user)
+        self.assertTrue(created)
+        self.assertEqual(ShortURL.objects.get(url=self.origin_url).hash_value, hash_value)
+
+        self.assertEqual(ShortURL.objects.create_or_get_short_url(url=self.origin_url, user=self.user), (hash_value, False))
+        self.assertEqual(ShortURL.objects.filter(url=self.origin_url).count(), 1)
+
+    # 다른 사용자의 URL, 만료된 URL은 코드를 반환하지 않음
+    def test_create_or_get_short_url_not_usable(self):
+        other = User.objects.create_user(email="other@test.com", password="password1234")
+        ShortURL.objects.create_or_get_short_url(url=self.origin_url, user=other)
+        self.assertEqual(ShortURL.objects.create_or_get_short_url(url=self.origin_url, user=self.user), (None, False))
+
+        expired_url = "https://www.google.com/expired"
+        ShortURL.objects.create(url=expired_url, hash_value=1, expiration_date=datetime.now() - timedelta(days=1), user=self.user)
+        self.assertEqual(ShortURL.objects.create_or_get_short_url(url=expired_url, user=self.user), (None, False))
+
+        self.assertEqual(ShortURL.objects.count(), 2)
+
+    # MySQL 방식(충돌 무시 INSERT 후 url_digest 조회)도 같은 결과
+    def test_create_or_get_short_url_insert_ignore(self):
+        other = User.objects.create_user(email="other@test.com", password="password1234")
+        ShortURL.objects.create(url="https://www.google.com/other", hash_value=self.hash_value, user=other)
+
+        with mock.patch.object(ShortURLManager, "_insert_or_get", ShortURLManager._insert_ignore_or_get):
+            # 코드 충돌이면 다음 코드로 재시도
+            with mock.patch.object(Algorithm, "generate_code", side_effect=[self.hash_value, self.hash_value + 1]):
+                self.assertEqual(ShortURL.objects.create_or_get_short_url(url=self.origin_url, user=self.user), (self.hash_value + 1, True))
+            self.assertEqual(ShortURL.objects.create_or_get_short_url(url=self.origin_url, user=self.user), (self.hash_value + 1, False))
+
+            # 다른 사용자의 URL은 코드를 반환하지 않음
+            self.assertEqual(ShortURL.objects.create_or_get_short_url(url="https://www.google.com/other", user=self.user), (None, False))
+
+        self.assertEqual(ShortURL.objects.count(), 2)
+
+    # 생성한 코드가 다른 URL과 충돌하면 다음 코드로 재시도
+    def test_create_or_get_short_url_code_conflict(self):
+        ShortURL.objects.create(url="https://www.google.com/other", hash_value=self.hash_value, user=self.user)
+
+        with mock.patch.object(Algorithm, "generate_code", side_effect=[self.hash_value, self.hash_value + 1]):
+            self.assertEqual(ShortURL.objects.create_or_get_short_url(url=self.origin_url, user=self.user), (self.hash_value + 1, True))
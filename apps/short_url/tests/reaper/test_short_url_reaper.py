@@ -0,0 +1,91 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Reaper Test
+"""
+
+# System
+import io
+from datetime import datetime, timedelta
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+# Project
+from core.algorithm import Algorithm
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL, ShortURLArchive
+from apps.short_url.reaper import ShortURLReaper
+
+
+class ShortURLReaperTest(TestCase):
+    """
+    보관 기간이 지난 Short URL 정리 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        old = datetime.now() - timedelta(days=40)
+        recent = datetime.now() - timedelta(days=1)
+
+        rows = {
+            "active": {},
+            "deleted_old": {"deleted_at": old},
+            "deleted_recent": {"deleted_at": recent},
+            "expired_old": {"expiration_date": old},
+            "expired_recent": {"expiration_date": recent},
+        }
+        cls.short_urls = {}
+        for name, fields in rows.items():
+            url = f"https://www.google.com/{name}"
+            cls.short_urls[name] = ShortURL.objects.create(url=url, hash_value=Algorithm.hash_url(url), user=cls.user, **fields)
+
+    def setUp(self):
+        ShortURLCache.clear()
+        cache.clear()
+
+    def test_reap(self):
+        # 만료된 행은 Redirect 캐시에 남아 있을 수 있음
+        expired = self.short_urls["expired_old"]
+        ShortURLCache.resolve(expired.hash_value)
+        self.assertIsNotNone(cache.get(ShortURLCache.make_key(expired.hash_value)))
+
+        deleted = ShortURLReaper.reap(retention_days=30, batch_size=2, sleep=0)
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(
+            sorted(ShortURL.objects.values_list("url", flat=True)),
+            ["https://www.google.com/active", "https://www.google.com/deleted_recent", "https://www.google.com/expired_recent"],
+        )
+        self.assertIsNone(cache.get(ShortURLCache.make_key(expired.hash_value)))
+
+        archive = ShortURLArchive.objects.get(short_url_id=expired.id)
+        self.assertEqual(archive.url, expired.url)
+        self.assertEqual(archive.hash_value, expired.hash_value)
+        self.assertEqual(archive.user_id, self.user.id)
+        self.assertEqual(archive.created_at, expired.created_at)
+        self.assertTrue(ShortURLArchive.objects.filter(short_url_id=self.short_urls["deleted_old"].id).exists())
+
+        # 다시 실행해도 정리할 행 없음
+        self.assertEqual(ShortURLReaper.reap(retention_days=30, sleep=0), 0)
+
+    # 정리 대상의 최소 ~ 최대 id 범위만 배치로 나누고, 정리할 행이 없는 배치는 쉬지 않음
+    def test_reap_bounds(self):
+        ids = sorted(self.short_urls[name].id for name in ("deleted_old", "expired_old"))
+
+        with mock.patch.object(ShortURLReaper, "reap_batch", wraps=ShortURLReaper.reap_batch) as reap_batch, mock.patch("time.sleep") as sleep:
+            self.assertEqual(ShortURLReaper.reap(retention_days=30, batch_size=1, sleep=1), 2)
+
+        self.assertEqual([call.args[:2] for call in reap_batch.call_args_list], [(id, id + 1) for id in range(ids[0], ids[1] + 1)])
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_reap_command(self):
+        stdout = io.StringIO()
+        call_command("reap_short_urls", retention_days=0, sleep=0, no_archive=True, stdout=stdout)
+
+        self.assertIn("reaped 4 short urls", stdout.getvalue())
+        self.assertEqual(list(ShortURL.objects.values_list("url", flat=True)), ["https://www.google.com/active"])
+        self.assertFalse(ShortURLArchive.objects.exists())
@@ -0,0 +1,105 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Redirect Dispatcher Test
+"""
+
+# System
+import json
+from wsgiref.util import setup_testing_defaults
+from django.core import signals
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.test import TestCase
+
+# Project
+from core.algorithm import Algorithm
+from core.constants import SYSTEM_CODE
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+from apps.short_url.redirect import RedirectASGIMiddleware, RedirectWSGIMiddleware
+
+
+class RedirectDispatcherTest(TestCase):
+    """
+    Redirect 전용 WSGI, ASGI dispatcher 테스트
+    """
+
+    origin_url = "https://www.google.com"
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(email="test@test.com", password="password1234")
+        short_url = ShortURL.objects.create(url=cls.origin_url, hash_value=Algorithm.hash_url(cls.origin_url), user=user)
+        cls.encoded = Algorithm.base62_encode(short_url.hash_value)
+
+    def setUp(self):
+        ShortURLCache.clear()
+        cache.clear()
+        # 테스트 트랜잭션 안에서 연결이 닫히지 않도록 Django test client와 동일하게 해제
+        signals.request_started.disconnect(close_old_connections)
+        self.addCleanup(signals.request_started.connect, close_old_connections)
+        self.passed = []
+
+    def wsgi_application(self, environ, start_response):
+        self.passed.append(environ["PATH_INFO"])
+        start_response("200 OK", [])
+        return [b"django"]
+
+    async def asgi_application(self, scope, receive, send):
+        self.passed.append(scope["path"])
+
+    def call_wsgi(self, path, method="GET"):
+        environ = {"PATH_INFO": path, "REQUEST_METHOD": method}
+        setup_testing_defaults(environ)
+
+        response = {}
+
+        def start_response(status, headers):
+            response["status"] = status
+            response["headers"] = dict(headers)
+
+        response["body"] = b"".join(RedirectWSGIMiddleware(self.wsgi_application)(environ, start_response))
+        return response
+
+    # GET /<코드>는 Django로 넘기지 않고 Redirect
+    def test_wsgi_redirect(self):
+        response = self.call_wsgi(f"/{self.encoded}")
+
+        self.assertEqual(response["status"], "302 Found")
+        self.assertEqual(response["headers"]["Location"], self.origin_url)
+        self.assertEqual(self.passed, [])
+
+    # 존재하지 않는 URL은 create_response와 같은 형식으로 응답
+    def test_wsgi_not_found(self):
+        response = self.call_wsgi(f"/{self.encoded[:-1]}")
+
+        self.assertEqual(response["status"], "400 Bad Request")
+        self.assertEqual(json.loads(response["body"])["code"], SYSTEM_CODE.SHORT_URL_NOT_FOUND[0])
+
+    # GET /<코드> 이외의 요청은 Django로 넘김
+    def test_wsgi_pass_through(self):
+        self.call_wsgi(f"/{self.encoded}", method="POST")
+        self.call_wsgi("/api/shorturl")
+        self.call_wsgi("/favicon.ico")
+        self.call_wsgi("/metrics")
+        # URL 경로 단어는 Django가 APPEND_SLASH 등으로 처리
+        self.call_wsgi("/admin")
+        self.call_wsgi("/api")
+
+        self.assertEqual(self.passed, [f"/{self.encoded}", "/api/shorturl", "/favicon.ico", "/metrics", "/admin", "/api"])
+
+    # ASGI도 이벤트 루프에서 바로 Redirect
+    async def test_asgi_redirect(self):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": f"/{self.encoded}"}
+        await RedirectASGIMiddleware(self.asgi_application)(scope, None, send)
+
+        self.assertEqual(messages[0]["status"], 302)
+        self.assertIn((b"location", self.origin_url.encode()), messages[0]["headers"])
+        self.assertEqual(self.passed, [])
@@ -0,0 +1,47 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : API Renderer Test
+"""
+
+# System
+import json
+from datetime import datetime
+from unittest import mock
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+# Project
+from core import renderers
+from core.constants import SYSTEM_CODE
+from core.renderers import CustomRenderer, render_error
+from core.response import create_payload
+
+
+class CustomRendererTest(SimpleTestCase):
+    """
+    API 응답 renderer 테스트
+    """
+
+    payloads = [
+        create_payload(data={"encoded": "abc", "url": "https://www.google.com/한글 ", "created_at": datetime(2024, 5, 1, 12, 0, 0, 123456)}),
+        create_payload(data=[{"count": 2**70}], status=201),
+        {"links": {"next": None}, "cursor": "abc", "count": 1, "data": [], "status_code": 200, "msg": "SUCCESS", "code": 0},
+        create_payload(code=SYSTEM_CODE.URL_ALREADY, status=400),
+    ]
+
+    # DRF JSONRenderer와 같은 bytes (orjson, 표준 json 모두)
+    def test_renderer_same_as_drf(self):
+        for payload in self.payloads:
+            expected = JSONRenderer().render(payload)
+            self.assertEqual(CustomRenderer().render(payload), expected)
+            with mock.patch.object(renderers, "orjson", None):
+                self.assertEqual(CustomRenderer().render(payload), expected)
+
+    # 에러 응답은 미리 직렬화한 본문을 그대로 반환
+    def test_renderer_prerendered_error(self):
+        body = render_error(SYSTEM_CODE.SHORT_URL_NOT_FOUND)
+
+        self.assertIs(render_error(SYSTEM_CODE.SHORT_URL_NOT_FOUND), body)
+        self.assertIs(CustomRenderer().render(create_payload(code=SYSTEM_CODE.SHORT_URL_NOT_FOUND, status=400)), body)
+        self.assertEqual(json.loads(body), create_payload(code=SYSTEM_CODE.SHORT_URL_NOT_FOUND, status=400))
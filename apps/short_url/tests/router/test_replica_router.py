@@ -0,0 +1,124 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Read Replica Router Test
+"""
+
+# System
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core.algorithm import Algorithm
+from core.db_router import ReplicaRouter
+from core.middleware import ReplicaRouterMiddleware
+from core.jwt import CustomJWTAuthentication
+from apps.users.models import User
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.models import ShortURL
+
+
+@override_settings(DATABASE_REPLICA={**settings.DATABASE_REPLICA, "ALIASES": ["replica"]})
+class ReplicaRouterTest(APITestCase):
+    """
+    Read replica 라우팅 테스트
+    primary(default)와 replica를 서로 다른 DB로 두어(config.django.test) 어느 DB에서 조회했는지 확인합니다.
+    """
+
+    databases = {"default", "replica"}
+
+    primary_url = "https://www.google.com/primary"
+    replica_url = "https://www.google.com/replica"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.user.save(using="replica")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+
+        # 아직 replica에 복제되지 않은 행, replica에만 있는 행
+        cls.primary = ShortURL.objects.create_short_url(url=cls.primary_url, user=cls.user)
+        cls.replica = ShortURL.objects.using("replica").create(url=cls.replica_url, hash_value=Algorithm.hash_url(cls.replica_url), user=cls.user)
+
+    def setUp(self):
+        ReplicaRouter.reset()
+        ShortURLCache.clear()
+        cache.clear()
+
+    def get_list(self):
+        response = self.client.get(path=reverse("api-short-url:post-short-url"), HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}")
+        self.assertEqual(response.status_code, 200)
+        return [row["url"] for row in response.data["data"]]
+
+    # read_replica 구간의 조회만 replica, 쓰기 이후에는 primary
+    def test_router(self):
+        self.assertEqual(ShortURL.objects.all().db, "default")
+
+        with ReplicaRouter.read_replica() as alias:
+            self.assertEqual(alias, "replica")
+            self.assertEqual(list(ShortURL.objects.values_list("url", flat=True)), [self.replica_url])
+
+            ShortURL.objects.create_short_url(url="https://www.google.com/new", user=self.user)
+            self.assertEqual(ShortURL.objects.all().db, "default")
+
+        self.assertIsNone(ReplicaRouter.get_replica())
+
+    # 목록은 replica에서 조회하고, 생성 직후에는 해당 유저만 primary에서 조회
+    def test_router_sticky_after_write(self):
+        self.assertEqual(self.get_list(), [self.replica_url])
+
+        response = self.client.post(
+            path=reverse("api-short-url:post-short-url"),
+            HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}",
+            data={"url": "https://www.google.com/new"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(ReplicaRouter.is_sticky(self.user))
+
+        self.assertEqual(sorted(self.get_list()), ["https://www.google.com/new", self.primary_url])
+
+    # Redirect는 replica에서 조회하고, replica에 없으면 primary에서 다시 확인
+    def test_router_redirect_fallback(self):
+        response = self.client.get("/" + Algorithm.base62_encode(self.replica.hash_value))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], self.replica_url)
+
+        response = self.client.get("/" + Algorithm.base62_encode(self.primary.hash_value))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], self.primary_url)
+
+        cache.clear()
+        ShortURLCache.clear()
+        with override_settings(DATABASE_REPLICA={**settings.DATABASE_REPLICA, "FALLBACK_ON_MISS": False}):
+            response = self.client.get("/" + Algorithm.base62_encode(self.primary.hash_value))
+        self.assertEqual(response.status_code, 400)
+
+    # async 요청은 미들웨어 체인을 sync로 바꾸지 않고, 쓰기가 있었던 요청만 유저를 sticky로 기록
+    async def test_middleware_async(self):
+        requests = []
+
+        async def get_response(request):
+            requests.append(request)
+            if request.path == "/write":
+                ReplicaRouter().db_for_write(ShortURL)
+            return HttpResponse()
+
+        middleware = ReplicaRouterMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+
+        request = RequestFactory().get("/redirect")
+        request.user = self.user
+        await middleware(request)
+        self.assertFalse(await cache.aget(ReplicaRouter.make_sticky_key(self.user.pk)))
+
+        request = RequestFactory().post("/write")
+        request.user = self.user
+        await middleware(request)
+        self.assertTrue(await cache.aget(ReplicaRouter.make_sticky_key(self.user.pk)))
+        self.assertEqual(len(requests), 2)
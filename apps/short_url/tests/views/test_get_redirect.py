@@ -6,6 +6,7 @@
 
 # System
 from django.urls import reverse
+from django.core.cache import cache
 from rest_framework.test import APITestCase
 
 # Project
@@ -14,6 +15,8 @@ from core.algorithm import Algorithm
 from apps.users.models import User
 
 from apps.short_url.models import ShortURL
+from apps.short_url.cache import ShortURLCache
+from apps.short_url.redirect import MAX_CODE_LENGTH
 
 
 class GetRedirectTest(APITestCase):
@@ -41,6 +44,11 @@ class GetRedirectTest(APITestCase):
         )
         cls.encoded = Algorithm.base62_encode(cls.short_url.hash_value)
 
+    def setUp(self):
+        # 테스트 롤백은 signal을 발생시키지 않으므로 Redirect 캐시 초기화
+        ShortURLCache.clear()
+        cache.clear()
+
     # 단축 URL 리다이렉트 성공
     def test_get_redirect_success(self):
         url = reverse(self.reverse_url, kwargs={"url": self.encoded})
@@ -48,6 +56,22 @@ class GetRedirectTest(APITestCase):
 
         self.assertEqual(response.status_code, 302)
 
+    # 단축 URL 리다이렉트 성공 (ASGI)
+    async def test_get_redirect_async(self):
+        url = reverse(self.reverse_url, kwargs={"url": self.encoded})
+        response = await self.async_client.get(path=url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, self.origin_url)
+
+    # 단축 URL 리다이렉트 실패 (최대 길이 초과, alias 최대 길이 포함)
+    def test_get_redirect_too_long(self):
+        url = reverse(self.reverse_url, kwargs={"url": "a" * (MAX_CODE_LENGTH + 1)})
+        response = self.client.get(path=url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["code"], SYSTEM_CODE.INVALID_FORMAT[0])
+
     # 단축 URL 리다이렉트 실패 (존재하지 않는 URL)
     def test_get_redirect_not_found(self):
         encoded = self.encoded[:-1]
@@ -55,7 +79,15 @@ class GetRedirectTest(APITestCase):
         response = self.client.get(path=url)
 
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data["code"], SYSTEM_CODE.SHORT_URL_NOT_FOUND[0])
+        self.assertEqual(response.json()["code"], SYSTEM_CODE.SHORT_URL_NOT_FOUND[0])
+
+    # 단축 URL 리다이렉트 실패 (Base62 문자가 아닌 URL)
+    def test_get_redirect_invalid(self):
+        url = reverse(self.reverse_url, kwargs={"url": "a-b"})
+        response = self.client.get(path=url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["code"], SYSTEM_CODE.SHORT_URL_NOT_FOUND[0])
 
     # 단축 URL 리다이렉트 실패 (만료된 URL)
     def test_get_redirect_expired(self):
@@ -66,4 +98,4 @@ class GetRedirectTest(APITestCase):
         response = self.client.get(path=url)
 
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data["code"], SYSTEM_CODE.SHORT_URL_EXPIRED[0])
+        self.assertEqual(response.json()["code"], SYSTEM_CODE.SHORT_URL_EXPIRED[0])
@@ -0,0 +1,117 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Get ShortURL Export Test
+"""
+
+# System
+import csv
+import io
+import json
+import tempfile
+from datetime import datetime, timedelta
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core.algorithm import Algorithm
+from core.jwt import CustomJWTAuthentication
+from apps.users.models import User
+from apps.short_url.export import ShortURLExporter
+from apps.short_url.models import ShortURL
+
+
+class GetShortURLExportTest(APITestCase):
+    """
+    단축 URL 내보내기 테스트
+    """
+
+    reverse_url = "api-short-url:get-short-url-export"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        other_user = User.objects.create_user(email="other@test.com", password="password1234")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+
+        short_urls = []
+        for i in range(7):
+            url = f"https://www.google.com/{i}"
+            short_urls.append(
+                ShortURL(
+                    url=url,
+                    hash_value=Algorithm.hash_url(url),
+                    request_count=i,
+                    expiration_date=datetime.now() - timedelta(days=1) if i == 2 else None,
+                    deleted_at=datetime.now() if i == 3 else None,
+                    user=cls.user,
+                )
+            )
+        short_urls.append(ShortURL(url="https://www.google.com/other", hash_value=Algorithm.hash_url("other"), user=other_user))
+        ShortURL.objects.bulk_create(short_urls)
+
+    def get(self, **params):
+        return self.client.get(path=reverse(self.reverse_url), data=params, HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}")
+
+    def expected(self, **filters):
+        return [
+            Algorithm.base62_encode(hash_value)
+            for hash_value in ShortURL.objects.filter(user=self.user, **filters).order_by("id").values_list("hash_value", flat=True)
+        ]
+
+    def test_get_short_url_export_csv(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn("attachment;", response["Content-Disposition"])
+
+        rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(rows[0], list(ShortURLExporter.FIELDS))
+        self.assertEqual([row[0] for row in rows[1:]], self.expected(deleted_at=None))
+
+        expired = ShortURL.objects.get(url="https://www.google.com/2")
+        row = next(row for row in rows[1:] if row[0] == Algorithm.base62_encode(expired.hash_value))
+        self.assertEqual(row[1:], [expired.url, "2", expired.expiration_date.isoformat(), expired.created_at.isoformat()])
+
+    def test_get_short_url_export_ndjson(self):
+        response = self.get(type="ndjson", status="deleted")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row["code"] for row in rows], self.expected(deleted_at__isnull=False))
+        self.assertEqual(rows[0]["url"], "https://www.google.com/3")
+        self.assertEqual(rows[0]["request_count"], 3)
+        self.assertIsNone(rows[0]["expiration_date"])
+
+    def test_get_short_url_export_chunks(self):
+        """
+        chunk 경계와 관계없이 모든 행을 한 번씩 내보냄
+        """
+        queryset = ShortURL.objects.filter(user=self.user)
+        for chunk_size in (1, 2, 3, 7, 100):
+            chunks = list(ShortURLExporter(queryset, chunk_size=chunk_size).iter_chunks())
+            self.assertEqual([row[0] for chunk in chunks for row in chunk], self.expected())
+            self.assertTrue(all(len(chunk) <= chunk_size for chunk in chunks))
+
+    def test_get_short_url_export_invalid(self):
+        for params in ({"type": "xml"}, {"status": "unknown"}):
+            response = self.get(**params)
+            self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(path=reverse(self.reverse_url))
+        self.assertEqual(response.status_code, 403)
+
+    def test_export_short_urls_command(self):
+        with tempfile.NamedTemporaryFile(suffix=".csv") as f:
+            call_command("export_short_urls", email=self.user.email, status="active", chunk_size=2, output=f.name)
+            rows = list(csv.reader(open(f.name, encoding="utf-8")))
+        self.assertEqual([row[0] for row in rows[1:]], self.expected(deleted_at=None, expiration_date=None))
+
+        stdout = io.StringIO()
+        call_command("export_short_urls", email=self.user.email, type="ndjson", stdout=stdout)
+        self.assertEqual([json.loads(line)["code"] for line in stdout.getvalue().splitlines()], self.expected(deleted_at=None))
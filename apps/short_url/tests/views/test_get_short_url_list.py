@@ -0,0 +1,114 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Get ShortURL List Test
+"""
+
+# System
+from datetime import datetime, timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core.constants import SYSTEM_CODE
+from core.algorithm import Algorithm
+from core.jwt import CustomJWTAuthentication
+from apps.users.models import User
+
+from apps.short_url.models import ShortURL
+
+
+class GetShortURLListTest(APITestCase):
+    """
+    단축 URL 목록 조회 테스트
+    """
+
+    reverse_url = "api-short-url:post-short-url"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        other_user = User.objects.create_user(email="other@test.com", password="password1234")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+
+        # 같은 생성일시가 여러 건 있어도 id로 순서가 정해지도록 3건씩 같은 생성일시 사용
+        created_at = datetime(2024, 5, 1)
+        short_urls = []
+        for i in range(25):
+            url = f"https://www.google.com/{i}"
+            short_urls.append(
+                ShortURL(
+                    url=url,
+                    hash_value=Algorithm.hash_url(url),
+                    expiration_date=datetime.now() - timedelta(days=1) if i % 5 == 0 else None,
+                    deleted_at=datetime.now() if i % 6 == 0 else None,
+                    user=cls.user,
+                )
+            )
+        short_urls.append(ShortURL(url="https://www.google.com/other", hash_value=Algorithm.hash_url("other"), user=other_user))
+        ShortURL.objects.bulk_create(short_urls)
+        for i, short_url in enumerate(ShortURL.objects.filter(user=cls.user).order_by("id")):
+            ShortURL.objects.filter(id=short_url.id).update(created_at=created_at + timedelta(hours=i // 3))
+
+    def get(self, **params):
+        return self.client.get(path=reverse(self.reverse_url), data=params, HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}")
+
+    def get_all(self, **params):
+        """
+        cursor를 따라 모든 페이지 조회
+        """
+        results = []
+        while True:
+            response = self.get(**params)
+            self.assertEqual(response.status_code, 200)
+            results += response.data["data"]
+            if not response.data["cursor"]:
+                return results
+            params["cursor"] = response.data["cursor"]
+
+    def expected(self, queryset):
+        return [Algorithm.base62_encode(hash_value) for hash_value in queryset.order_by("-created_at", "-id").values_list("hash_value", flat=True)]
+
+    # cursor를 따라 생성일시 역순으로 빠짐 없이 조회
+    def test_get_short_url_list_cursor(self):
+        results = self.get_all(page_size=4)
+
+        self.assertEqual([row["encoded"] for row in results], self.expected(ShortURL.objects.filter(user=self.user, deleted_at=None)))
+
+    # 상태 필터
+    def test_get_short_url_list_status(self):
+        queryset = ShortURL.objects.filter(user=self.user)
+        now = datetime.now()
+
+        self.assertEqual(
+            [row["encoded"] for row in self.get_all(status="active")],
+            self.expected(queryset.filter(deleted_at=None, expiration_date=None)),
+        )
+        self.assertEqual(
+            [row["encoded"] for row in self.get_all(status="expired")],
+            self.expected(queryset.filter(deleted_at=None, expiration_date__lte=now)),
+        )
+        self.assertEqual(
+            [row["encoded"] for row in self.get_all(status="deleted")],
+            self.expected(queryset.filter(deleted_at__isnull=False)),
+        )
+
+    # 전체 개수는 요청한 경우에만 조회
+    def test_get_short_url_list_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get()
+        self.assertIsNone(response.data["count"])
+        self.assertFalse([query for query in queries if "COUNT(" in query["sql"]])
+
+        response = self.get(count="true")
+        self.assertEqual(response.data["count"], ShortURL.objects.filter(user=self.user, deleted_at=None).count())
+
+    # 올바르지 않은 cursor, 상태
+    def test_get_short_url_list_invalid(self):
+        for params in ({"cursor": "invalid"}, {"status": "unknown"}, {"page_size": "a"}):
+            response = self.get(**params)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data["code"], SYSTEM_CODE.INVALID_FORMAT[0])
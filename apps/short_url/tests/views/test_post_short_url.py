@@ -5,6 +5,7 @@
 """
 
 # System
+from datetime import datetime
 from django.urls import reverse
 from rest_framework.test import APITestCase
 
@@ -110,3 +111,56 @@ class PostShortURLTest(APITestCase):
 
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.data["code"], SYSTEM_CODE.EXPIRATION_DATE_INVALID[0])
+
+    # 같은 URL 재요청 (idempotent이면 기존 코드를 200으로 반환)
+    def test_post_short_url_idempotent(self):
+        responses = [
+            self.client.post(
+                path=self.url,
+                HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}",
+                data={"url": self.origin_url, "idempotent": True},
+                format="json",
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual([response.status_code for response in responses], [201, 200])
+        self.assertEqual([response.data["data"]["created"] for response in responses], [True, False])
+        self.assertEqual(responses[0].data["data"]["encoded"], responses[1].data["data"]["encoded"])
+        self.assertEqual(ShortURL.objects.filter(url=self.origin_url).count(), 1)
+
+    # 다른 사용자의 URL은 idempotent여도 코드를 알려주지 않고 URL_ALREADY
+    def test_post_short_url_idempotent_other_user(self):
+        other = User.objects.create_user(email="other@test.com", password=self.password)
+        ShortURL.objects.create_short_url(url=self.origin_url, user=other)
+
+        response = self.client.post(
+            path=self.url,
+            HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}",
+            data={"url": self.origin_url, "idempotent": True},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["code"], SYSTEM_CODE.URL_ALREADY[0])
+
+    # 삭제된 URL은 digest가 비워져 다시 생성할 수 있음
+    def test_post_short_url_after_delete(self):
+        short_url = ShortURL.objects.create_short_url(url=self.origin_url, user=self.user)
+        self.assertIsNotNone(short_url.url_digest)
+
+        short_url.deleted_at = datetime.now()
+        short_url.save()
+        short_url.refresh_from_db()
+        self.assertIsNone(short_url.url_digest)
+
+        response = self.client.post(
+            path=self.url,
+            HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}",
+            data={"url": self.origin_url},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(response.data["data"]["created"])
+        self.assertEqual(ShortURL.objects.filter(url=self.origin_url).count(), 2)
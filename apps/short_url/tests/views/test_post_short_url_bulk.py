@@ -0,0 +1,127 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : ShortURL Post ShortURL Bulk Test
+"""
+
+# System
+import json
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core.constants import SYSTEM_CODE
+from core.algorithm import Algorithm
+from core.jwt import CustomJWTAuthentication
+from apps.users.models import User
+from apps.short_url.models import ShortURL
+
+
+class PostShortURLBulkTest(APITestCase):
+    """
+    단축 URL 일괄 생성 테스트
+    """
+
+    url = reverse("api-short-url:post-short-url-bulk")
+
+    @classmethod
+    def setUpTestData(cls):
+        # 유저 생성
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.user_access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+
+    def post_bulk(self, data, content_type="application/json"):
+        return self.client.generic(
+            method="POST",
+            path=self.url,
+            data=data,
+            content_type=content_type,
+            HTTP_AUTHORIZATION=f"Bearer {self.user_access_token}",
+        )
+
+    # 단축 URL 일괄 생성 성공 (입력 순서대로 결과 반환)
+    def test_post_short_url_bulk_success(self):
+        urls = [f"https://www.google.com/{i}" for i in range(5)]
+        response = self.post_bulk(json.dumps(urls))
+
+        self.assertEqual(response.status_code, 201)
+        results = response.data["data"]["results"]
+        self.assertEqual([result["url"] for result in results], urls)
+        self.assertTrue(all(result["code"] == SYSTEM_CODE.SUCCESS[0] for result in results))
+        self.assertEqual(ShortURL.objects.filter(user=self.user).count(), 5)
+
+        hash_value = Algorithm.base62_decode(results[0]["encoded"])
+        self.assertEqual(ShortURL.objects.get(live_hash_value=hash_value).url, urls[0])
+
+    # NDJSON 입력
+    def test_post_short_url_bulk_ndjson(self):
+        lines = [json.dumps({"url": "https://www.google.com"}), json.dumps("https://www.naver.com")]
+        response = self.post_bulk("\n".join(lines), content_type="application/x-ndjson")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["data"]["results"]), 2)
+
+    # 기존 URL은 기존 코드, 요청 내 중복은 같은 코드, 잘못된 항목은 항목별 에러
+    def test_post_short_url_bulk_dedupe(self):
+        short_url = ShortURL.objects.create_short_url(url="https://www.google.com", user=self.user)
+        data = [
+            "https://www.google.com",
+            "https://www.naver.com",
+            "https://www.naver.com",
+            "invalid",
+            {"url": "https://www.daum.net", "expiration_date": "2021-01-01"},
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.post_bulk(json.dumps(data))
+
+        # 기존 URL 조회 1회, INSERT 1회
+        statements = [query["sql"].split(" ", 1)[0] for query in context.captured_queries if "short_url" in query["sql"]]
+        self.assertEqual(statements, ["SELECT", "INSERT"])
+
+        results = response.data["data"]["results"]
+        self.assertEqual(results[0]["code"], SYSTEM_CODE.URL_ALREADY[0])
+        self.assertEqual(results[0]["encoded"], Algorithm.base62_encode(short_url.hash_value))
+        self.assertEqual(results[1]["encoded"], results[2]["encoded"])
+        self.assertEqual(results[3]["code"], SYSTEM_CODE.INVALID_FORMAT[0])
+        self.assertEqual(results[4]["code"], SYSTEM_CODE.EXPIRATION_DATE_INVALID[0])
+        self.assertEqual(ShortURL.objects.count(), 2)
+
+    # 기존 코드와 충돌한 배치는 한 건씩 재시도
+    def test_post_short_url_bulk_collision(self):
+        ShortURL.objects.create(url="https://www.daum.net", hash_value=Algorithm.hash_url("https://www.google.com"), user=self.user)
+
+        response = self.post_bulk(json.dumps(["https://www.google.com", "https://www.naver.com"]))
+
+        results = response.data["data"]["results"]
+        self.assertTrue(all(result["code"] == SYSTEM_CODE.SUCCESS[0] for result in results))
+        self.assertEqual(ShortURL.objects.count(), 3)
+
+    # 단축 URL 일괄 생성 실패 (최대 개수 초과)
+    @override_settings(SHORT_URL_BULK={**settings.SHORT_URL_BULK, "MAX_ITEMS": 1})
+    def test_post_short_url_bulk_limit(self):
+        response = self.post_bulk(json.dumps(["https://www.google.com", "https://www.naver.com"]))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["code"], SYSTEM_CODE.BULK_LIMIT_EXCEEDED[0])
+
+    # 모델 필드 길이를 넘는 URL은 해당 항목만 실패
+    def test_post_short_url_bulk_too_long(self):
+        long_url = "https://www.google.com/" + "a" * (ShortURL._meta.get_field("url").max_length - 22)
+        response = self.post_bulk(json.dumps([long_url, "https://www.google.com"]))
+
+        self.assertEqual(response.status_code, 201)
+        results = response.data["data"]["results"]
+        self.assertEqual([result["code"] for result in results], [SYSTEM_CODE.INVALID_FORMAT[0], SYSTEM_CODE.SUCCESS[0]])
+        self.assertEqual(list(ShortURL.objects.filter(user=self.user).values_list("url", flat=True)), ["https://www.google.com"])
+
+    # 단축 URL 일괄 생성 실패 (배열이 아닌 경우)
+    def test_post_short_url_bulk_invalid(self):
+        response = self.post_bulk(json.dumps({"url": "https://www.google.com"}))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["code"], SYSTEM_CODE.INVALID_FORMAT[0])
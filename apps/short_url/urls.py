@@ -8,10 +8,22 @@
 from django.urls import path, include
 
 # Project
-from apps.short_url.views import ShortURLViewSet
+from apps.short_url.views import ShortURLViewSet, ShortURLHotKeyViewSet
 
 short_url_urls = [
-    path("", ShortURLViewSet.as_view({"post": "post_short_url"}), name="post-short-url"),
+    path(
+        "",
+        ShortURLViewSet.as_view({"get": "get_short_url_list", "post": "post_short_url"}),
+        name="post-short-url",
+    ),
+    path("/bulk", ShortURLViewSet.as_view({"post": "post_short_url_bulk"}), name="post-short-url-bulk"),
+    path("/export", ShortURLViewSet.as_view({"get": "get_short_url_export"}), name="get-short-url-export"),
+    path("/hot-keys", ShortURLHotKeyViewSet.as_view({"get": "get_hot_keys"}), name="get-hot-keys"),
+    path(
+        "/alias/availability",
+        ShortURLViewSet.as_view({"post": "post_alias_availability"}),
+        name="post-alias-availability",
+    ),
     path(
         "/<str:url>",
         ShortURLViewSet.as_view({"delete": "delete_short_url"}),
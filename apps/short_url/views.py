@@ -5,21 +5,36 @@
 """
 
 # System
+from functools import partial
+from datetime import datetime
+from django.http import StreamingHttpResponse
 from django.shortcuts import redirect
+from django.views.decorators.http import require_GET
 from rest_framework import status
+from rest_framework.parsers import JSONParser
 from rest_framework.viewsets import ViewSet
-from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 
 
 # Project
 from core.constants import SYSTEM_CODE
+from core.db_router import ReplicaRouter
 from core.exception import raise_exception
-from core.response import create_response
+from core.pagination import KeysetPagination
+from core.parsers import NDJSONParser
+from core.response import create_response, create_json_response
 from core.swagger import common_response_schema
+from apps.short_url.export import ShortURLExporter
+from apps.short_url.redirect import aresolve_redirect
 from apps.short_url.serializers import (
     ShortURLSerializer,
-    ShortURLRedirectSerializer,
+    ShortURLListSerializer,
+    ShortURLItemSerializer,
+    ShortURLExportSerializer,
+    ShortURLBulkSerializer,
+    ShortURLAliasAvailabilitySerializer,
+    ShortURLHotKeySerializer,
     ShortURLDeleteSerializer,
 )
 
@@ -33,17 +48,11 @@ class ShortURLViewSet(ViewSet):
     """
 
     permission_classes = [IsAuthenticated]
-
-    def get_permissions(self):
-        """
-        API별 Permission 설정
-        """
-        if self.action == "get_redirect":
-            return [AllowAny()]
-        return super().get_permissions()
+    parser_classes = [JSONParser, NDJSONParser]
 
     @extend_schema(
         summary="Short URL 생성",
+        description="idempotent가 true이면 이미 있는 URL은 URL_ALREADY 대신 기존 Short URL을 200으로 반환합니다. alias를 지정하면 해당 코드로 생성합니다.",
         request=ShortURLSerializer,
     )
     @common_response_schema(
@@ -64,32 +73,123 @@ class ShortURLViewSet(ViewSet):
 
         serializer.save()
 
-        return create_response(data=serializer.data, status=status.HTTP_201_CREATED)
+        # idempotent 요청으로 기존 Short URL을 반환한 경우 200
+        response_status = status.HTTP_201_CREATED if serializer.data["created"] else status.HTTP_200_OK
+        return create_response(data=serializer.data, status=response_status)
 
     @extend_schema(
-        summary="Short URL 조회(Redirect)",
+        summary="Short URL 목록 조회",
+        description="생성일시 역순으로 cursor 기반(keyset) 페이지를 반환합니다. 다음 페이지는 응답의 cursor 값으로 조회합니다.",
         parameters=[
-            OpenApiParameter(name="url", description="Short URL", type=str, location="path"),
+            OpenApiParameter(name="status", description="all(기본), active, expired, deleted", type=str, location="query"),
+            OpenApiParameter(name="cursor", description="다음 페이지 cursor", type=str, location="query"),
+            OpenApiParameter(name="page_size", description="페이지 크기 (기본 10, 최대 100)", type=int, location="query"),
+            OpenApiParameter(name="count", description="true이면 전체 개수 포함", type=bool, location="query"),
+        ],
+    )
+    @common_response_schema(
+        status_code=200,
+        description="Short URL 목록 조회 성공",
+        serializer=partial(ShortURLItemSerializer, many=True),
+    )
+    def get_short_url_list(self, request):
+        """
+        Short URL 목록 조회 API
+        """
+
+        serializer = ShortURLListSerializer(data=request.query_params, context={"request": request})
+
+        # Validation Check
+        if not serializer.is_valid():
+            raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+
+        # 목록은 replica에서 조회 (생성, 삭제 직후에는 primary)
+        with ReplicaRouter.read_replica(user=request.user):
+            paginator = KeysetPagination()
+            page = paginator.paginate_queryset(serializer.get_queryset(), request)
+
+        return paginator.get_paginated_response(data=ShortURLItemSerializer(page, many=True).data)
+
+    @extend_schema(
+        summary="Short URL 내보내기",
+        description="요청 유저의 Short URL 목록(code, url, request_count, expiration_date, created_at)을 CSV 또는 NDJSON 파일로 스트리밍합니다.",
+        parameters=[
+            OpenApiParameter(name="type", description="csv(기본), ndjson", type=str, location="query"),
+            OpenApiParameter(name="status", description="all(기본), active, expired, deleted", type=str, location="query"),
         ],
-        responses={
-            302: OpenApiResponse(
-                description="원본 URL로 Redirect 성공",
-            ),
-        },
+        responses={(200, "text/csv"): str, (200, "application/x-ndjson"): str},
+    )
+    def get_short_url_export(self, request):
+        """
+        Short URL 내보내기 API
+        """
+
+        serializer = ShortURLExportSerializer(data=request.query_params, context={"request": request})
+
+        # Validation Check
+        if not serializer.is_valid():
+            raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+
+        file_type = serializer.validated_data["type"]
+
+        # 응답을 스트리밍하는 동안 조회하므로 replica alias를 queryset에 지정 (생성, 삭제 직후에는 primary)
+        queryset = serializer.get_queryset()
+        replica = ReplicaRouter.get_replica(user=request.user)
+        exporter = ShortURLExporter(queryset.using(replica) if replica else queryset)
+
+        response = StreamingHttpResponse(exporter.stream(file_type), content_type=ShortURLExporter.FORMATS[file_type])
+        response["Content-Disposition"] = f'attachment; filename="short-urls-{datetime.now():%Y%m%d%H%M%S}.{file_type}"'
+        return response
+
+    @extend_schema(
+        summary="Short URL 일괄 생성",
+        description="JSON 배열 또는 NDJSON(application/x-ndjson)으로 URL 목록을 받아 입력 순서대로 결과를 반환합니다.",
+        request=ShortURLBulkSerializer,
+    )
+    @common_response_schema(
+        status_code=201,
+        description="Short URL 일괄 생성 성공",
+        serializer=ShortURLBulkSerializer,
+    )
+    def post_short_url_bulk(self, request):
+        """
+        Short URL 일괄 생성 API
+        """
+
+        serializer = ShortURLBulkSerializer(data={"items": request.data}, context={"request": request})
+
+        # Validation Check
+        if not serializer.is_valid():
+            raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+
+        serializer.save()
+
+        return create_response(data=serializer.data, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        summary="Short URL alias 사용 가능 여부 조회",
+        description="사용자 지정 코드(alias) 목록의 사용 가능 여부를 입력 순서대로 반환합니다. (형식, 예약어, 사용 중 여부)",
+        request=ShortURLAliasAvailabilitySerializer,
+    )
+    @common_response_schema(
+        status_code=200,
+        description="Short URL alias 사용 가능 여부 조회 성공",
+        serializer=ShortURLAliasAvailabilitySerializer,
     )
-    def get_redirect(self, request, url):
+    def post_alias_availability(self, request):
         """
-        Short URL을 Redirect 하는 API
-        localhost:8000/{short_url}로 접속하면 Redirect
+        Short URL alias 사용 가능 여부 조회 API
         """
 
-        serializer = ShortURLRedirectSerializer(data={"request_url": url})
+        serializer = ShortURLAliasAvailabilitySerializer(data=request.data, context={"request": request})
+
         # Validation Check
         if not serializer.is_valid():
             raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
-        original_url = serializer.save()
 
-        return redirect(original_url)
+        serializer.save()
+
+        return create_response(data=serializer.data, status=status.HTTP_200_OK)
 
     @extend_schema(
         summary="Short URL 삭제",
@@ -115,3 +215,62 @@ class ShortURLViewSet(ViewSet):
         serializer.save()
 
         return create_response(status=status.HTTP_204_NO_CONTENT)
+
+
+@extend_schema(
+    tags=["[Short URL]"],
+)
+class ShortURLHotKeyViewSet(ViewSet):
+    """
+    Short URL hot key 관리 ViewSet (관리자 전용)
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Short URL hot key 조회",
+        description="워커별로 Redirect 요청이 몰리는 코드(고정 tier, 클릭 수 분산 대상)를 합산하여 요청 수가 많은 순서로 반환합니다.",
+        parameters=[
+            OpenApiParameter(name="limit", description="반환할 최대 코드 수 (기본 100)", type=int, location="query"),
+        ],
+    )
+    @common_response_schema(
+        status_code=200,
+        description="Short URL hot key 조회 성공",
+        serializer=ShortURLHotKeySerializer,
+    )
+    def get_hot_keys(self, request):
+        """
+        Short URL hot key 조회 API
+        """
+
+        serializer = ShortURLHotKeySerializer(data=request.query_params, context={"request": request})
+
+        # Validation Check
+        if not serializer.is_valid():
+            raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+
+        serializer.save()
+
+        return create_response(data=serializer.data, status=status.HTTP_200_OK)
+
+
+@require_GET
+async def redirect_short_url(request, url):
+    """
+    Short URL을 Redirect 하는 API (async view)
+    localhost:8000/{short_url}로 접속하면 Redirect
+    운영에서는 wsgi.py, asgi.py의 Redirect dispatcher가 먼저 처리하고,
+    dispatcher가 처리하지 않는 형식의 경로만 이 view로 들어옵니다.
+    """
+
+    original_url, error = await aresolve_redirect(
+        url,
+        referrer=request.META.get("HTTP_REFERER", ""),
+        user_agent=request.META.get("HTTP_USER_AGENT", ""),
+        ip=request.META.get("REMOTE_ADDR"),
+    )
+    if error:
+        return create_json_response(code=error, status=status.HTTP_400_BAD_REQUEST)
+
+    return redirect(original_url)
@@ -0,0 +1,75 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : User Authentication Cache
+"""
+
+# System
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+
+# Project
+from core.instrumentation import Instrumentation
+from apps.users.models import User
+
+
+class UserCache:
+    """
+    JWT 인증용 유저 캐시
+    인증에 필요한 최소 필드만 user id 기준으로 짧게 캐싱합니다.
+    존재하지 않는 유저도 NOT_FOUND로 캐싱합니다.
+    """
+
+    KEY_PREFIX = "auth_user"
+    NOT_FOUND = "__not_found__"
+    FIELDS = ("id", "email", "is_active", "is_staff")
+
+    @classmethod
+    def _get_config(cls):
+        return settings.USER_CACHE
+
+    @classmethod
+    def _get_shared(cls):
+        return caches[cls._get_config()["ALIAS"]]
+
+    @classmethod
+    def make_key(cls, user_id):
+        return f"{cls.KEY_PREFIX}:{user_id}"
+
+    @classmethod
+    def get(cls, user_id):
+        """
+        user id에 해당하는 유저 필드 반환
+        {"id", "email", "is_active", "is_staff"} 또는 존재하지 않으면 None
+        """
+        key = cls.make_key(user_id)
+        shared = cls._get_shared()
+
+        entry = shared.get(key)
+        hit = entry is not None
+        if entry is None:
+            entry = User.objects.filter(id=user_id).values(*cls.FIELDS).first() or cls.NOT_FOUND
+            shared.set(key, entry, timeout=cls._get_config()["TTL"])
+        Instrumentation.cache("user", hit=hit)
+
+        if entry == cls.NOT_FOUND:
+            return None
+        return entry
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """
+        캐시 무효화 (유저 수정, 비활성화, 삭제 시)
+        """
+        cls._get_shared().delete(cls.make_key(user_id))
+
+    @staticmethod
+    def build_user(fields):
+        """
+        일부 필드만 채운 User 인스턴스 생성
+        나머지 필드는 deferred 상태로, view에서 접근할 때 DB에서 조회합니다.
+        """
+        # from_db는 값을 모델 필드 순서로 받음
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in fields]
+        return User.from_db(DEFAULT_DB_ALIAS, field_names, [fields[name] for name in field_names])
@@ -0,0 +1,26 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : User Signals
+"""
+
+# System
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+# Project
+from apps.users.cache import UserCache
+from apps.users.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    유저 수정(비활성화 포함), 삭제 시 인증 캐시 무효화
+    커밋 전에 다른 요청이 이전 값을 다시 캐싱할 수 있으므로 커밋 이후에도 한 번 더 무효화합니다.
+    """
+    user_id = instance.id
+    UserCache.invalidate(user_id)
+    transaction.on_commit(lambda: UserCache.invalidate(user_id))
@@ -0,0 +1,109 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : JWT User Cache Test
+"""
+
+# System
+import os
+import importlib
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Project
+from core import constants
+from core.jwt import CustomJWTAuthentication
+from core.constants import SYSTEM_CODE
+from core.exception import CustomAPIException
+from apps.users.models import User
+
+
+class UserCacheTest(APITestCase):
+    """
+    JWT 인증 유저 캐시 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="test@test.com", password="password1234")
+        cls.access_token = CustomJWTAuthentication.create_access_token(user=cls.user)
+
+    def setUp(self):
+        cache.clear()
+
+    def assertTokenError(self, code):
+        with self.assertRaises(CustomAPIException) as context:
+            CustomJWTAuthentication.validate_token(self.access_token)
+        self.assertEqual(context.exception.code, code)
+
+    # 두 번째 인증부터는 유저를 조회하지 않음
+    def test_validate_token_cached(self):
+        with self.assertNumQueries(1):
+            user = CustomJWTAuthentication.validate_token(self.access_token)
+        with self.assertNumQueries(0):
+            CustomJWTAuthentication.validate_token(self.access_token)
+
+        self.assertEqual(user.id, self.user.id)
+        self.assertEqual(user.email, self.user.email)
+
+    # 캐싱하지 않은 필드는 접근할 때 조회
+    def test_validate_token_deferred_field(self):
+        user = CustomJWTAuthentication.validate_token(self.access_token)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(user.check_password("password1234"))
+
+    # 비활성화 시 캐시 무효화
+    def test_validate_token_after_deactivate(self):
+        CustomJWTAuthentication.validate_token(self.access_token)
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertTokenError(SYSTEM_CODE.USER_NOT_ACTIVE)
+
+    # 삭제 시 캐시 무효화
+    def test_validate_token_after_delete(self):
+        CustomJWTAuthentication.validate_token(self.access_token)
+
+        self.user.delete()
+
+        self.assertTokenError(SYSTEM_CODE.USER_NOT_FOUND)
+
+    # stateless 모드는 토큰 정보를 신뢰하고 유저를 조회하지 않음
+    @override_settings(JWT_AUTH={"STATELESS": True})
+    def test_authenticate_stateless(self):
+        url = reverse("api-short-url:delete-short-url", kwargs={"url": "notfound"})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(path=url, HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        self.assertEqual(response.data["code"], SYSTEM_CODE.SHORT_URL_NOT_FOUND[0])
+        self.assertFalse([query["sql"] for query in queries if 'FROM "users"' in query["sql"]])
+
+    # JWT_STATELESS는 "True"일 때만 사용 ("False", "0" 등은 유저를 조회하여 비활성화 유저 거부)
+    def test_stateless_env_false(self):
+        self.addCleanup(importlib.reload, constants)
+        for value in ("False", "0", ""):
+            with mock.patch.dict(os.environ, {"JWT_STATELESS": value}):
+                importlib.reload(constants)
+            self.assertIs(constants.SERVICE.JWT_STATELESS, False)
+
+        with mock.patch.dict(os.environ, {"JWT_STATELESS": "True"}):
+            importlib.reload(constants)
+        self.assertIs(constants.SERVICE.JWT_STATELESS, True)
+
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        with mock.patch.dict(os.environ, {"JWT_STATELESS": "False"}):
+            importlib.reload(constants)
+        with override_settings(JWT_AUTH={"STATELESS": constants.SERVICE.JWT_STATELESS}):
+            url = reverse("api-short-url:delete-short-url", kwargs={"url": "notfound"})
+            response = self.client.delete(path=url, HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data["code"], SYSTEM_CODE.USER_NOT_ACTIVE[0])
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# GET /<Short URL> 요청은 Django 미들웨어, DRF를 거치지 않고 처리 (Django 초기화 이후 import)
+from apps.short_url.redirect import RedirectASGIMiddleware  # noqa: E402
+
+application = RedirectASGIMiddleware(application)
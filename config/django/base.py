@@ -6,10 +6,11 @@
 
 # System
 import os
+import sys
 from pathlib import Path
 
 # Project
-from core.constants import SERVICE
+from core.constants import SERVICE, DATABASE, CACHE, CODE, ALIAS, COUNTER, ANALYTICS, REAPER, MONITORING
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -18,6 +19,9 @@ SECRET_KEY = SERVICE.SECRET_KEY
 
 DEBUG = SERVICE.DEBUG
 
+# manage.py test 실행 여부 (백그라운드 스레드를 띄우지 않기 위해 사용)
+TESTING = "test" in sys.argv[1:2]
+
 ALLOWED_HOSTS = ["*"]
 
 
@@ -29,6 +33,7 @@ LOCAL_APPS = [
     "apps",
     "apps.users",
     "apps.short_url",
+    "apps.analytics",
     "core",
 ]
 
@@ -51,6 +56,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -60,6 +66,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "core.middleware.ReplicaRouterMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -136,6 +143,21 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 MEDIA_URL = "/media/"
 
 
+# ==================================================================== #
+#                       Database router config                         #
+# ==================================================================== #
+# DATABASES는 환경별 설정(local.py 등)에서 정의
+DATABASE_ROUTERS = ["core.db_router.ReplicaRouter"]
+
+# Read replica (Redirect 조회, 목록, 통계 조회만 replica 사용, 쓰기와 쓰기 직후 조회는 primary)
+DATABASE_REPLICA = {
+    "ALIASES": [],  # 조회에 사용할 DATABASES alias 목록 (환경별 설정에서 추가, 비어 있으면 모두 primary)
+    "CACHE_ALIAS": "default",  # 쓰기 직후 유저 기록(sticky)을 공유하는 CACHES alias
+    "STICKY_SECONDS": DATABASE.DB_REPLICA_STICKY_SECONDS,  # 쓰기 후 N초 동안 해당 유저는 primary에서 조회 (예상 최대 복제 지연 이상)
+    "FALLBACK_ON_MISS": True,  # Redirect 조회가 replica에 없으면 primary에서 다시 조회 (복제 전 코드를 NOT_FOUND로 캐싱하지 않음)
+}
+
+
 # ==================================================================== #
 #                       DRF config                                     #
 # ==================================================================== #
@@ -146,12 +168,145 @@ REST_FRAMEWORK = {
     "DEFAULT_PARSER_CLASSES": [  # 요청 본문을 파싱하는 데  사용할 파서를 지정
         "rest_framework.parsers.JSONParser",  # JSON 파서
     ],
-    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
-    # "DEFAULT_RENDERER_CLASSES": ("core.renderers.CustomRenderer",),
+    "DEFAULT_RENDERER_CLASSES": ("core.renderers.CustomRenderer",),  # orjson 사용 (없으면 표준 json), 에러 응답은 미리 직렬화
     "DEFAULT_RESPONSE_CLASS": "core.response.CustomResponse",
     "DEFAULT_PAGINATION_CLASS": "core.pagination.CustomPagination",
 }
 
+# ==================================================================== #
+#                       Cache config                                   #
+# ==================================================================== #
+CACHES = {
+    "default": {
+        "BACKEND": CACHE.CACHE_BACKEND,  # 운영 환경은 django.core.cache.backends.redis.RedisCache
+        "LOCATION": CACHE.CACHE_LOCATION,
+    },
+}
+
+# Short URL Redirect 조회 캐시 (1차: 프로세스 내부 LRU, 2차: CACHES[ALIAS])
+SHORT_URL_CACHE = {
+    "ALIAS": "default",
+    "LRU_SIZE": CACHE.SHORT_URL_LRU_SIZE,  # LRU 최대 항목 수
+    "LRU_TTL": CACHE.SHORT_URL_LRU_TTL,  # LRU TTL(초), 다른 워커의 삭제가 반영되기까지의 최대 지연
+    "TTL": CACHE.SHORT_URL_CACHE_TTL,  # 공유 캐시 TTL(초)
+    "NEGATIVE_TTL": CACHE.SHORT_URL_NEGATIVE_TTL,  # 존재하지 않는 URL 캐시 TTL(초)
+}
+
+# Short URL Redirect 조회 전 존재 여부 확인용 Bloom filter (워커별 메모리, snapshot은 build_short_url_bloom으로 생성)
+SHORT_URL_BLOOM = {
+    "ENABLED": CACHE.SHORT_URL_BLOOM_ENABLED,
+    "ALIAS": "default",  # 생성 알림(version)을 공유하는 CACHES alias
+    "CAPACITY": CACHE.SHORT_URL_BLOOM_CAPACITY,  # 예상 최대 코드 수 (DB의 최대 id가 더 크면 최대 id 사용)
+    "ERROR_RATE": 0.001,  # false positive 확률 (CAPACITY 기준)
+    "SNAPSHOT_PATH": CACHE.SHORT_URL_BLOOM_SNAPSHOT_PATH,  # 있으면 DB 전체를 읽지 않고 snapshot을 mmap으로 열어 사용
+    "CHUNK_SIZE": 10000,  # DB에서 한 번에 읽는 행 수
+    "REFRESH_INTERVAL": 0 if TESTING else 30,  # 늦게 커밋된 행을 다시 읽는 주기(초), 0이면 스레드 없이 조회 시 준비
+    "REFRESH_LAG": 60,  # 생성 후 N초 이내 행은 다음 주기에 다시 읽음
+}
+
+# Redirect가 몰리는 코드(hot key) 추적 (워커별 Space-Saving tracker, 상위 코드는 ShortURLCache 고정 tier에 보관)
+SHORT_URL_HOT_KEYS = {
+    "ENABLED": CACHE.SHORT_URL_HOT_KEYS_ENABLED,
+    "ALIAS": "default",  # 워커별 상위 코드를 기록하는 CACHES alias
+    "CAPACITY": 1000,  # tracker 카운터 수 (전체 요청의 1/CAPACITY보다 많은 코드는 반드시 추적)
+    "TOP_K": CACHE.SHORT_URL_HOT_KEYS_TOP_K,  # 워커별 최대 hot key 수
+    "MIN_COUNT": CACHE.SHORT_URL_HOT_KEYS_MIN_COUNT,  # hot key가 되는 최소 요청 수 (DECAY 적용 누적)
+    "SAMPLE_RATE": 1.0,  # tracker에 기록하는 요청 비율 (0~1)
+    "REFRESH_INTERVAL": 0 if TESTING else 5,  # hot key 선정, 고정 tier 갱신 주기(초), 0이면 스레드 없음 (삭제 반영 지연)
+    "DECAY": 0.5,  # 갱신할 때마다 카운터에 곱하는 값
+    "COUNTER_SHARDS": 8,  # hot key 클릭 수 공유 카운터 분산 수 (CLICK_COUNTER BACKEND=cache)
+    "REPORT_TTL": 60,  # 워커별 상위 코드 기록 유지 시간(초)
+}
+
+# JWT 인증 유저 캐시 (CACHES[ALIAS])
+USER_CACHE = {
+    "ALIAS": "default",
+    "TTL": CACHE.USER_CACHE_TTL,  # 캐시 TTL(초)
+}
+
+# JWT 인증
+JWT_AUTH = {
+    "STATELESS": SERVICE.JWT_STATELESS,  # True이면 Access Token 만료 전까지 유저 조회 없이 토큰 정보를 신뢰 (비활성화, 삭제가 만료 시까지 반영되지 않음)
+}
+
+# Short URL 코드 생성기
+SHORT_URL_CODE = {
+    "GENERATOR": CODE.SHORT_URL_CODE_GENERATOR,  # hash: SHA-256 40bit + 충돌 probe, snowflake: 시간 + worker id + sequence, block: DB 블록 할당 카운터
+    "MAX_ATTEMPTS": 5,  # unique 충돌 시 재시도 횟수
+    "WORKER_ID": CODE.SHORT_URL_WORKER_ID,  # snowflake worker id (0~1023, 프로세스마다 다른 값), snowflake 생성기 사용 시 필수
+    "SNOWFLAKE_EPOCH": 1704034800000,  # snowflake 기준 시각 (2024-01-01 00:00:00 KST, ms)
+    "BLOCK_SIZE": CODE.SHORT_URL_BLOCK_SIZE,  # block 생성기가 한 번에 예약하는 코드 수
+    "BLOCK_START": 62**4,  # block 생성기 시작 값 (5자리 코드부터 사용)
+    "WIDTH": 0,  # Base62 코드 최소 길이 (짧으면 앞을 0으로 채움, 0이면 채우지 않음), 디코딩은 길이와 관계없이 같은 값
+}
+
+# Short URL 사용자 지정 코드(alias)
+# config/urls.py, apps/short_url/urls.py의 경로(admin, api, bulk 등)는 자동으로 예약어에 포함
+SHORT_URL_ALIAS = {
+    "MIN_LENGTH": 4,  # 최소 길이
+    "MAX_LENGTH": 32,  # 최대 길이 (ShortURL.alias 컬럼 길이 이하)
+    "RESERVED_WORDS": ["schema", "docs", "static", "media"],  # 전체가 일치하면 사용할 수 없는 단어 (DEBUG에서만 등록되는 Swagger 경로 포함)
+    "BLOCKED_WORDS": ALIAS.SHORT_URL_ALIAS_BLOCKED_WORDS,  # 어디에 포함되어도 사용할 수 없는 단어 (비속어 등)
+    "MAX_CHECK": 100,  # 사용 가능 여부 조회 요청당 최대 alias 수
+}
+
+# Short URL 일괄 생성
+SHORT_URL_BULK = {
+    "MAX_ITEMS": 10000,  # 요청당 최대 URL 수
+    "BATCH_SIZE": 1000,  # bulk_create, IN 조회 단위
+}
+
+# Redirect 클릭 수 카운터 (버퍼에 누적 후 주기적으로 DB 반영)
+CLICK_COUNTER = {
+    "BACKEND": COUNTER.CLICK_COUNTER_BACKEND,  # local: 워커 메모리, cache: CACHES[ALIAS] 공유 카운터
+    "ALIAS": "default",
+    "KEY_TTL": 86400,  # cache 공유 카운터 키 유지 시간(초), 생성 또는 마지막 flush 이후 지나면 삭제 (FLUSH_INTERVAL보다 충분히 길게)
+    "FLUSH_INTERVAL": 0 if TESTING else COUNTER.CLICK_COUNTER_FLUSH_INTERVAL,  # flush 주기(초), 0이면 스레드 없이 직접 flush
+    "FLUSH_AT_EXIT": not TESTING,  # 프로세스 종료 시 남은 클릭 수 flush (테스트는 테스트 DB 삭제 후 실행되므로 사용 안 함)
+    "MAX_BUFFER": COUNTER.CLICK_COUNTER_MAX_BUFFER,  # 버퍼에 쌓인 Short URL 수가 넘으면 즉시 flush
+    "SHARDS": COUNTER.CLICK_COUNTER_SHARDS,  # 0보다 크면 short_url 행 대신 Short URL마다 SHARDS개의 ShortURLCounterShard에 나누어 반영
+    "COMPACT_BATCH_SIZE": 1000,  # compact_short_url_counters가 한 트랜잭션에서 합치는 shard 수
+}
+
+# Redirect 클릭 이벤트 수집 (ring buffer에 누적 후 주기적으로 sink에 기록, rollup_clicks로 집계)
+CLICK_ANALYTICS = {
+    "ENABLED": ANALYTICS.CLICK_ANALYTICS_ENABLED,
+    "SINK": ANALYTICS.CLICK_ANALYTICS_SINK,  # db: ClickEvent 테이블, ndjson: NDJSON_DIR에 시간 단위로 교체되는 파일
+    "BUFFER_SIZE": ANALYTICS.CLICK_ANALYTICS_BUFFER_SIZE,  # ring buffer 크기, 넘치면 가장 오래된 이벤트부터 버림
+    "BATCH_SIZE": 1000,  # 한 번에 기록하는 이벤트 수, 버퍼가 이만큼 쌓이면 즉시 flush 요청
+    "FLUSH_INTERVAL": 0 if TESTING else ANALYTICS.CLICK_ANALYTICS_FLUSH_INTERVAL,  # flush 주기(초), 0이면 스레드 없이 직접 flush
+    "FLUSH_AT_EXIT": not TESTING,  # 프로세스 종료 시 남은 이벤트 flush (테스트는 테스트 DB 삭제 후 실행되므로 사용 안 함)
+    "NDJSON_DIR": ANALYTICS.CLICK_ANALYTICS_NDJSON_DIR or os.path.join(BASE_DIR, "logs", "clicks"),
+    "NDJSON_ROTATE": "%Y%m%d%H",  # 파일 이름의 시간 형식 (시간 단위 교체)
+    "COUNTRY_RESOLVER": ANALYTICS.CLICK_ANALYTICS_COUNTRY_RESOLVER,  # rollup 시 IP -> 국가 코드 변환 함수 경로 (예: GeoIP), 없으면 국가 미집계
+    "ROLLUP_BATCH_SIZE": 10000,  # rollup 한 번에 집계하는 이벤트 수
+    "ROLLUP_LAG": 60,  # 최근 N초 이내 클릭은 다음 rollup에서 집계 (아직 커밋되지 않은 이벤트 보호)
+}
+
+# 만료, 삭제 후 보관 기간이 지난 Short URL 정리 (reap_short_urls)
+SHORT_URL_REAPER = {
+    "RETENTION_DAYS": REAPER.SHORT_URL_RETENTION_DAYS,  # 삭제일시 또는 만료일시부터 보관할 일 수
+    "BATCH_SIZE": REAPER.SHORT_URL_REAPER_BATCH_SIZE,  # 한 트랜잭션에서 검사할 PK 범위 크기
+    "SLEEP": REAPER.SHORT_URL_REAPER_SLEEP,  # 배치 사이 대기 시간(초), 운영 시간대 부하 조절
+    "ARCHIVE": REAPER.SHORT_URL_REAPER_ARCHIVE,  # 삭제 전 ShortURLArchive에 보관
+}
+
+# ==================================================================== #
+#                       Instrumentation config                         #
+# ==================================================================== #
+# 요청별 성능 측정 (core.middleware.InstrumentationMiddleware, Redirect dispatcher)
+INSTRUMENTATION = {
+    "ENABLED": MONITORING.INSTRUMENTATION_ENABLED,
+    "SAMPLE_RATE": 1.0 if TESTING else MONITORING.INSTRUMENTATION_SAMPLE_RATE,  # 측정할 요청 비율 (0~1)
+    "SERVER_TIMING": MONITORING.INSTRUMENTATION_SERVER_TIMING,  # 측정한 요청에 Server-Timing 헤더 추가
+    "SLOW_REQUEST_MS": MONITORING.INSTRUMENTATION_SLOW_REQUEST_MS,  # 측정한 요청이 이 시간(ms) 이상이면 core.instrumentation 로그, 0이면 사용 안 함
+    "METRICS_PATH": "metrics",  # 워커별 histogram 출력 경로 (Prometheus text format)
+    "METRICS_TOKEN": MONITORING.METRICS_TOKEN,  # /metrics 요청의 Authorization: Bearer 값, 비어 있으면 /metrics 사용 안 함(항상 404)
+    # /metrics 응답할 REMOTE_ADDR (비어 있으면 검사 안 함), 나머지는 404
+    # 같은 호스트의 reverse proxy(nginx 등) 뒤에서는 모든 요청의 REMOTE_ADDR이 127.0.0.1이므로 IP로는 외부 요청을 막을 수 없음 (METRICS_TOKEN으로 보호)
+    "METRICS_ALLOWED_IPS": MONITORING.METRICS_ALLOWED_IPS,
+}
+
 # ==================================================================== #
 #                       Logging config                                 #
 # ==================================================================== #
@@ -179,11 +334,22 @@ LOGGING = {
             "filters": ["require_debug_true"],
             "formatter": "django.server",
         },
+        "instrumentation": {
+            "level": "WARNING",
+            "class": "logging.StreamHandler",
+            "formatter": "django.server",
+        },
     },
     "loggers": {
+        # 쿼리마다 로그를 남기는 DEBUG는 필요할 때만 DB_LOG_LEVEL로 사용 (요청별 쿼리 수, 시간은 INSTRUMENTATION)
         "django.db.backends": {
             "handlers": ["console"],
-            "level": "DEBUG",
+            "level": MONITORING.DB_LOG_LEVEL,
+            "propagate": False,
+        },
+        "core.instrumentation": {
+            "handlers": ["instrumentation"],
+            "level": "WARNING",
             "propagate": False,
         },
     },
@@ -28,3 +28,8 @@ DATABASES = {
         },
     }
 }
+
+# Read replica (DB_REPLICA_HOSTS, 계정과 DB 이름은 primary와 동일, 테스트에서는 primary를 그대로 사용)
+for index, host in enumerate(DATABASE.DB_REPLICA_HOSTS):
+    DATABASES[f"replica_{index}"] = {**DATABASES["default"], "HOST": host, "TEST": {"MIRROR": "default"}}
+    DATABASE_REPLICA["ALIASES"].append(f"replica_{index}")
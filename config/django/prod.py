@@ -0,0 +1,27 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Project Production Settings
+"""
+
+# Project
+from config.django.local import *
+from core.constants import DATABASE
+
+# Database
+# local 설정(primary, replica)에 connection 재사용 설정 추가
+# - WSGI(스레드 고정): DB_CONN_MAX_AGE초 동안 스레드별 persistent connection 사용, 요청 시작 시 health check
+# - ASGI(요청마다 스레드 변경): DB_CONN_MAX_AGE=0, DB_POOL_SIZE>0으로 요청이 끝나면 pool에 반환하고 다음 요청에서 재사용
+for database in DATABASES.values():
+    database.update(
+        {
+            "ENGINE": "core.backends.mysql",
+            "CONN_MAX_AGE": DATABASE.DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "POOL": {
+                "SIZE": DATABASE.DB_POOL_SIZE,  # 워커 프로세스당 보관할 connection 수 (0이면 pool 사용 안 함)
+                "MAX_LIFETIME": DATABASE.DB_POOL_MAX_LIFETIME,  # MySQL wait_timeout보다 짧게
+                "PING_AFTER": 30,  # 30초 이상 쉬었던 connection은 꺼낼 때 ping으로 확인
+            },
+        }
+    )
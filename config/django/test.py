@@ -0,0 +1,23 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Project Test Settings (SQLite, MySQL 없이 로컬에서 테스트)
+"""
+
+# Project
+from config.django.base import *
+from config.settings.swagger.settings import *
+
+# Database
+# primary, replica를 서로 다른 SQLite DB로 구성 (복제가 없으므로 replica 라우팅을 테스트에서 확인 가능)
+# replica 라우팅은 DATABASE_REPLICA["ALIASES"]를 override_settings로 지정한 테스트에서만 사용
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+    },
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db_replica.sqlite3",
+    },
+}
@@ -11,17 +11,16 @@ from django.conf import settings
 from django.conf.urls.static import static
 
 # Project
-from apps.short_url.views import ShortURLViewSet
+from core.instrumentation import metrics_view
+from apps.short_url.views import redirect_short_url
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api", include(("apps.users.urls", "api-users"))),
     path("api", include(("apps.short_url.urls", "api-short-url"))),
-    path(
-        "<str:url>",
-        ShortURLViewSet.as_view({"get": "get_redirect"}),
-        name="get-redirect",
-    ),
+    path("api", include(("apps.analytics.urls", "api-analytics"))),
+    path(settings.INSTRUMENTATION["METRICS_PATH"], metrics_view, name="get-metrics"),
+    path("<str:url>", redirect_short_url, name="get-redirect"),
 ]
 
 # Swagger
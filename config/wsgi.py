@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# GET /<Short URL> 요청은 Django 미들웨어, DRF를 거치지 않고 처리 (Django 초기화 이후 import)
+from apps.short_url.redirect import RedirectWSGIMiddleware  # noqa: E402
+
+application = RedirectWSGIMiddleware(application)
@@ -5,46 +5,248 @@
 """
 
 # System
+import os
+import re
+import time
 import hashlib
-import base62
+import threading
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, router
+
+# Project
+from core import codec
+
+# hash value는 BigIntegerField(부호 있는 64bit)에 저장
+MAX_HASH_VALUE = 2**63 - 1
+
+# alias에 사용할 수 있는 문자 (Base62 + "-", "_")
+ALIAS_PATTERN = re.compile(r"^[0-9A-Za-z_-]+$")
+# Base62로 디코딩할 수 없는 alias의 hash value 범위 [2^62, 2^63) (hash 40bit, block, snowflake 코드와 겹치지 않는 범위)
+ALIAS_HASH_BASE = 2**62
+
+
+class CodeGenerator:
+    """
+    Short URL 코드(hash value) 생성기 기본 클래스
+    attempt는 같은 URL로 다시 생성할 때(unique 충돌) 1씩 증가합니다.
+    """
+
+    def generate(self, url, attempt=0):
+        raise NotImplementedError
+
+
+class HashCodeGenerator(CodeGenerator):
+    """
+    SHA-256 앞 40bit를 사용하는 생성기
+    충돌 시 attempt를 붙여 다시 해싱(probe)합니다.
+    """
+
+    def generate(self, url, attempt=0):
+        data = url if attempt == 0 else f"{url}#{attempt}"
+        return int.from_bytes(hashlib.sha256(data.encode()).digest()[:5], "big")
+
+
+class SnowflakeCodeGenerator(CodeGenerator):
+    """
+    Snowflake 방식 생성기 (DB 조회 없음)
+    | timestamp(ms, 41bit) | worker id(10bit) | sequence(12bit) |
+    worker id는 프로세스마다 달라야 하므로 설정(SHORT_URL_WORKER_ID)이 필수입니다.
+    (프로세스 id 등으로 추측하면 10bit 안에서 겹쳐 같은 코드가 생성될 수 있음)
+    """
+
+    TIMESTAMP_BITS = 41
+    WORKER_BITS = 10
+    SEQUENCE_BITS = 12
+
+    MAX_WORKER_ID = (1 << WORKER_BITS) - 1
+    MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+    def __init__(self, worker_id, epoch):
+        if worker_id is None or not 0 <= worker_id <= self.MAX_WORKER_ID:
+            raise ImproperlyConfigured(f"snowflake 코드 생성기는 SHORT_URL_WORKER_ID(0~{self.MAX_WORKER_ID}) 설정이 필요합니다.")
+        self.worker_id = worker_id
+        self.epoch = epoch
+        self._last_timestamp = -1
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def _now(self):
+        return int(time.time() * 1000) - self.epoch
+
+    def generate(self, url, attempt=0):
+        with self._lock:
+            timestamp = self._now()
+
+            # 시계가 뒤로 간 경우 마지막 timestamp까지 대기
+            while timestamp < self._last_timestamp:
+                time.sleep((self._last_timestamp - timestamp) / 1000)
+                timestamp = self._now()
+
+            if timestamp == self._last_timestamp:
+                self._sequence = (self._sequence + 1) & self.MAX_SEQUENCE
+                # 같은 ms 안에서 sequence를 모두 사용한 경우 다음 ms까지 대기
+                if self._sequence == 0:
+                    while timestamp <= self._last_timestamp:
+                        timestamp = self._now()
+            else:
+                self._sequence = 0
+
+            self._last_timestamp = timestamp
+            return (timestamp << (self.WORKER_BITS + self.SEQUENCE_BITS)) | (self.worker_id << self.SEQUENCE_BITS) | self._sequence
+
+
+class BlockCodeGenerator(CodeGenerator):
+    """
+    블록 할당 카운터 생성기
+    DB 시퀀스에서 block_size 만큼의 범위를 한 번에 예약하고, 범위를 다 쓸 때까지 메모리에서 발급합니다.
+    """
+
+    SEQUENCE_NAME = "short_url"
+
+    def __init__(self, block_size, start):
+        self.block_size = block_size
+        self.start = start
+        self._next = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def _lease(self):
+        """
+        DB 시퀀스에서 [start, start + block_size) 범위 예약
+        요청의 트랜잭션(bulk 생성, import 등) 안에서 호출되어도 시퀀스 행 잠금을 그 트랜잭션이 끝날 때까지 잡지 않고,
+        바깥 트랜잭션이 rollback 되어도 예약이 취소되지 않도록(다른 워커가 같은 범위를 예약하지 않도록)
+        별도 DB connection에서 예약 후 바로 커밋합니다.
+        """
+        # 순환 참조 방지
+        from core.models import CodeSequence
+
+        connection = connections.create_connection(router.db_for_write(CodeSequence))
+        try:
+            table = connection.ops.quote_name(CodeSequence._meta.db_table)
+            if connection.vendor == "mysql":
+                insert = f"INSERT IGNORE INTO {table} (name, next_value) VALUES (%s, %s)"
+            else:
+                insert = f"INSERT INTO {table} (name, next_value) VALUES (%s, %s) ON CONFLICT (name) DO NOTHING"
+
+            connection.set_autocommit(False)
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(insert, [self.SEQUENCE_NAME, self.start])
+                    # UPDATE로 행을 잠근 뒤 증가한 값을 읽음 (SELECT ... FOR UPDATE 없이 모든 DB에서 동일)
+                    cursor.execute(f"UPDATE {table} SET next_value = next_value + %s WHERE name = %s", [self.block_size, self.SEQUENCE_NAME])
+                    cursor.execute(f"SELECT next_value FROM {table} WHERE name = %s", [self.SEQUENCE_NAME])
+                    end = cursor.fetchone()[0]
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+        finally:
+            connection.close()
+
+        self._next, self._end = end - self.block_size, end
+
+    def generate(self, url, attempt=0):
+        with self._lock:
+            if self._next >= self._end:
+                self._lease()
+            value = self._next
+            self._next += 1
+            return value
 
 
 class Algorithm:
+    GENERATORS = {
+        "hash": lambda config: HashCodeGenerator(),
+        "snowflake": lambda config: SnowflakeCodeGenerator(
+            worker_id=config["WORKER_ID"],
+            epoch=config["SNOWFLAKE_EPOCH"],
+        ),
+        "block": lambda config: BlockCodeGenerator(block_size=config["BLOCK_SIZE"], start=config["BLOCK_START"]),
+    }
+
+    _generator = None
+    _generator_pid = None
+
     def __init__(self):
         pass
 
+    @classmethod
+    def get_generator(cls):
+        """
+        설정(SHORT_URL_CODE["GENERATOR"])에 맞는 코드 생성기 반환
+        fork 이후에는 예약한 블록, sequence를 공유하지 않도록 새로 생성합니다.
+        """
+        if cls._generator is None or cls._generator_pid != os.getpid():
+            config = settings.SHORT_URL_CODE
+            cls._generator = cls.GENERATORS[config["GENERATOR"]](config)
+            cls._generator_pid = os.getpid()
+        return cls._generator
+
+    @classmethod
+    def reset_generator(cls):
+        """
+        코드 생성기 초기화 (설정 변경, 테스트 용도)
+        """
+        cls._generator = None
+
+    @classmethod
+    def generate_code(cls, url, attempt=0):
+        """설정된 생성기로 Short URL 코드(정수 hash value)를 생성합니다."""
+        return cls.get_generator().generate(url=url, attempt=attempt)
+
     @staticmethod
     def hash_url(url):
-        """URL을 받아 SHA-256 해시를 생성하여 반환합니다."""
-        # URL을 SHA-256 해시로 변환
-        hash_object = hashlib.sha256(url.encode())
-
-        # 16진수 해시로 변환
-        hash_hex = hash_object.hexdigest()
+        """URL을 받아 SHA-256 해시의 앞 40bit를 정수로 반환합니다."""
+        return HashCodeGenerator().generate(url=url)
 
-        # 해시값의 앞 10자리만 사용
-        hash_value = hash_hex[:10]
-        return hash_value
+    @staticmethod
+    def digest_url(url):
+        """URL의 SHA-256 해시를 64자리 16진수 문자열로 반환합니다. (중복 URL 검사용 고정 길이 값)"""
+        return hashlib.sha256(url.encode()).hexdigest()
 
     @staticmethod
     def base62_encode(hash_value):
-        """16진수 해시를 Base62 인코딩하여 반환합니다."""
+        """정수 hash value를 Base62 인코딩하여 반환합니다. (SHORT_URL_CODE["WIDTH"]보다 짧으면 앞을 0으로 채움)"""
+        return codec.encode(hash_value, width=settings.SHORT_URL_CODE["WIDTH"])
 
-        # 16진수 문자열을 정수로 변환
-        decimal_representation = int(hash_value, 16)
+    @staticmethod
+    def base62_decode(encoded):
+        """Base62 인코딩된 문자열을 정수 hash value로 반환합니다. 올바르지 않은 값이면 None을 반환합니다."""
+        try:
+            hash_value = codec.decode(encoded)
+        except ValueError:
+            return None
 
-        # Base62 인코딩
-        encoded = base62.encode(decimal_representation)
+        # 64bit 범위를 넘는 값은 존재할 수 없는 hash value
+        if hash_value > MAX_HASH_VALUE:
+            return None
 
-        return encoded
+        return hash_value
 
     @staticmethod
-    def base62_decode(encoded):
-        """Base62 인코딩된 문자열을 디코딩하여 원래의 16진수 해시로 반환합니다."""
-        # Base62 디코딩
-        decoded_int = base62.decode(encoded)
-
-        # 정수를 16진수 문자열로 변환
-        hash_value = hex(decoded_int)[2:]  # '0x' 접두어 제거
+    def hash_alias(alias):
+        """Base62로 디코딩할 수 없는 alias(-, _ 포함 또는 64bit 초과)의 hash value를 반환합니다. (SHA-256 기반, [2^62, 2^63) 범위)"""
+        return ALIAS_HASH_BASE + int(hashlib.sha256(f"alias:{alias}".encode()).hexdigest()[:16], 16) % ALIAS_HASH_BASE
 
+    @classmethod
+    def resolve_code(cls, code):
+        """
+        Short URL 코드(생성 코드 또는 alias)를 hash value로 반환합니다. 올바르지 않은 형식이면 None을 반환합니다.
+        Base62로 디코딩되면 디코딩 값을, 아니면 hash_alias 값을 사용하므로 alias와 생성 코드가 같은 hash value 공간을 사용합니다.
+        (같은 값으로 디코딩되는 alias("0sale" == "sale")와 짧은 alias("1" == 1)는 ShortURLAlias.validate에서 거부)
+        """
+        hash_value = cls.base62_decode(code)
+        if hash_value is None and ALIAS_PATTERN.match(code):
+            hash_value = cls.hash_alias(code)
         return hash_value
+
+    @staticmethod
+    def base62_encode_many(hash_values):
+        """정수 hash value 목록을 한 번에 Base62 인코딩하여 반환합니다."""
+        return codec.encode_many(hash_values, width=settings.SHORT_URL_CODE["WIDTH"])
+
+    @staticmethod
+    def base62_decode_many(encoded_values):
+        """Base62 문자열 목록을 한 번에 hash value 목록으로 반환합니다. 올바르지 않은 값은 None입니다."""
+        return codec.decode_many(encoded_values, max_value=MAX_HASH_VALUE)
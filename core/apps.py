@@ -10,3 +10,15 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        from django.core.signals import request_started, setting_changed
+        from django.db.backends.signals import connection_created
+        from core.db_router import ReplicaRouter
+        from core.instrumentation import Instrumentation
+
+        # 요청마다 쓰기 기록(primary 고정) 초기화
+        request_started.connect(ReplicaRouter.reset, dispatch_uid="core.db_router.reset")
+        # DB connection마다 요청 측정용 execute wrapper 등록
+        connection_created.connect(Instrumentation.install, dispatch_uid="core.instrumentation.install")
+        setting_changed.connect(Instrumentation.reset, dispatch_uid="core.instrumentation.reset")
@@ -0,0 +1,21 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : MySQL Backend with Connection Pool
+"""
+
+# System
+from django.db.backends.mysql import base
+
+# Project
+from core.backends.pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    """
+    ENGINE: core.backends.mysql
+    django.db.backends.mysql에 프로세스 내부 connection pool(settings_dict["POOL"])을 추가한 backend
+    """
+
+    def ping_connection(self, connection):
+        connection.ping()
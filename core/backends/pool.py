@@ -0,0 +1,160 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Database Connection Pool
+"""
+
+# System
+import os
+import time
+import threading
+from functools import partial
+from collections import deque
+
+
+class ConnectionPool:
+    """
+    프로세스 내부 DB connection pool (DB-API connection)
+    반환된 connection을 최대 size개까지 보관하고, 가장 최근에 반환된 것부터 다시 사용합니다. (LIFO, 오래 쉰 connection은 자연히 정리)
+    - max_lifetime: 생성 후 이 시간(초)이 지난 connection은 다시 사용하지 않고 닫음 (DB wait_timeout, 장애 조치 대비)
+    - ping_after: 이 시간(초) 이상 쉬었던 connection은 꺼낼 때 ping으로 확인 (0이면 항상, None이면 확인하지 않음)
+    fork 이후 자식 프로세스는 부모의 connection을 사용하지 않고 새로 연결합니다.
+    """
+
+    def __init__(self, size, max_lifetime=None, ping_after=None, ping=None):
+        self.size = size
+        self.max_lifetime = max_lifetime
+        self.ping_after = ping_after
+        self.ping = ping
+        self.pid = os.getpid()
+        self.stats = {"created": 0, "reused": 0, "discarded": 0}
+        # (connection, 생성 시각, 반환 시각)
+        self._idle = deque()
+        # 사용 중인 connection의 생성 시각 (id(connection) 기준)
+        self._created = {}
+        self._lock = threading.Lock()
+
+    def _is_usable(self, connection, created, released, now):
+        if self.max_lifetime is not None and now - created >= self.max_lifetime:
+            return False
+        if self.ping is not None and self.ping_after is not None and now - released >= self.ping_after:
+            try:
+                self.ping(connection)
+            except Exception:
+                return False
+        return True
+
+    def _discard(self, connection):
+        self.stats["discarded"] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def acquire(self, connect):
+        """
+        보관 중인 connection을 꺼내고, 없으면 connect()로 새로 연결
+        """
+        while True:
+            with self._lock:
+                item = self._idle.pop() if self._idle else None
+            if item is None:
+                break
+
+            connection, created, released = item
+            if self._is_usable(connection, created, released, time.monotonic()):
+                with self._lock:
+                    self._created[id(connection)] = created
+                    self.stats["reused"] += 1
+                return connection
+            self._discard(connection)
+
+        connection = connect()
+        with self._lock:
+            self._created[id(connection)] = time.monotonic()
+            self.stats["created"] += 1
+        return connection
+
+    def release(self, connection):
+        """
+        connection 반환 (pool이 가득 찼거나 max_lifetime이 지났으면 닫음)
+        """
+        now = time.monotonic()
+        with self._lock:
+            created = self._created.pop(id(connection), now)
+            if len(self._idle) < self.size and (self.max_lifetime is None or now - created < self.max_lifetime):
+                self._idle.append((connection, created, now))
+                return
+        self._discard(connection)
+
+    def clear(self):
+        """
+        보관 중인 connection 모두 닫기
+        """
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for connection, _, _ in idle:
+            self._discard(connection)
+
+    def __len__(self):
+        return len(self._idle)
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Django DatabaseWrapper에 ConnectionPool을 붙이는 mixin (Django 5.0은 MySQL 기본 pooling이 없음)
+    settings_dict["POOL"]의 SIZE가 0보다 크면 close()할 때 connection을 닫지 않고 pool에 반환하고,
+    다음 connect()에서 TCP 연결, 인증을 생략합니다.
+    (CONN_MAX_AGE=0이면 요청마다 pool에서 꺼내고 반환, ASGI처럼 요청마다 스레드가 바뀌어 persistent connection을 쓰기 어려운 경우에 사용)
+
+    POOL = {"SIZE": 보관할 최대 connection 수, "MAX_LIFETIME": connection 최대 사용 시간(초), "PING_AFTER": ping 확인 기준 유휴 시간(초)}
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def ping_connection(self, connection):
+        """
+        DB-API connection 상태 확인 (실패하면 예외), backend별로 구현
+        """
+        raise NotImplementedError
+
+    def get_pool(self):
+        """
+        alias의 pool 반환 (POOL이 없으면 None), fork된 프로세스에서는 새로 생성
+        """
+        options = self.settings_dict.get("POOL") or {}
+        if not options.get("SIZE"):
+            return None
+
+        with self._pools_lock:
+            pool = self._pools.get(self.alias)
+            if pool is None or pool.pid != os.getpid():
+                pool = self._pools[self.alias] = ConnectionPool(
+                    size=options["SIZE"],
+                    max_lifetime=options.get("MAX_LIFETIME"),
+                    ping_after=options.get("PING_AFTER"),
+                    ping=self.ping_connection,
+                )
+            return pool
+
+    def get_new_connection(self, conn_params):
+        pool = self.get_pool()
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        return pool.acquire(partial(super().get_new_connection, conn_params))
+
+    def _close(self):
+        pool = self.get_pool()
+        # 트랜잭션 중이거나 오류가 있었던 connection은 상태를 알 수 없으므로 반환하지 않고 닫음
+        if (
+            pool is None
+            or self.connection is None
+            or self.in_atomic_block
+            or self.errors_occurred
+            or self.autocommit != self.settings_dict["AUTOCOMMIT"]
+        ):
+            return super()._close()
+
+        with self.wrap_database_errors:
+            pool.release(self.connection)
@@ -0,0 +1,102 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Benchmark Utils
+"""
+
+# System
+import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+
+def percentile(samples, percent):
+    """
+    정렬된 측정값에서 백분위 값 반환 (nearest-rank)
+    """
+    if not samples:
+        return 0.0
+    rank = max(math.ceil(percent * len(samples) / 100) - 1, 0)
+    return samples[min(rank, len(samples) - 1)]
+
+
+def summarize(samples, elapsed=None):
+    """
+    측정값(초) 목록을 ms 단위 통계로 변환
+    elapsed(동시 실행 시 전체 소요 시간)가 있으면 처리량은 elapsed 기준으로 계산합니다.
+    """
+    samples = sorted(samples)
+    total = sum(samples)
+    return {
+        "count": len(samples),
+        "mean_ms": round(total / len(samples) * 1000, 4) if samples else 0.0,
+        "min_ms": round(samples[0] * 1000, 4) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 4),
+        "p95_ms": round(percentile(samples, 95) * 1000, 4),
+        "p99_ms": round(percentile(samples, 99) * 1000, 4),
+        "max_ms": round(samples[-1] * 1000, 4) if samples else 0.0,
+        "ops_per_sec": round(len(samples) / (elapsed or total), 2) if (elapsed or total) else 0.0,
+    }
+
+
+def measure(func, repeat):
+    """
+    func를 repeat번 실행하여 각 실행 시간(초) 목록 반환
+    """
+    samples = []
+    for i in range(repeat):
+        started = time.perf_counter()
+        func(i)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def measure_concurrent(func, repeat, concurrency):
+    """
+    func를 concurrency개 스레드에서 총 repeat번 실행
+    (각 실행 시간(초) 목록, 전체 소요 시간(초)) 반환
+    """
+
+    def timed(i):
+        started = time.perf_counter()
+        func(i)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = list(executor.map(timed, range(repeat)))
+    return samples, time.perf_counter() - started
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class BenchmarkServer:
+    """
+    부하 측정용 WSGI 서버 (요청마다 스레드, 임의 포트)
+    with 블록 안에서만 실행됩니다.
+    """
+
+    def __init__(self, application, host="127.0.0.1"):
+        self.server = make_server(host, 0, application, server_class=ThreadingWSGIServer, handler_class=QuietWSGIRequestHandler)
+        self.host, self.port = self.server.server_address[:2]
+        self._thread = threading.Thread(target=self.server.serve_forever, name="benchmark-server", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
@@ -0,0 +1,108 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Bloom Filter
+"""
+
+# System
+import os
+import math
+import mmap
+import struct
+import threading
+
+MASK_64 = (1 << 64) - 1
+
+
+def mix64(value):
+    """
+    64bit 정수 해시 (splitmix64 finalizer)
+    """
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+class BloomFilter:
+    """
+    정수 값용 Bloom filter
+    포함되지 않았다고 판단한 값은 확실히 추가된 적이 없는 값이고, 포함되었다고 판단한 값은 error_rate 확률로 틀릴 수 있습니다.
+    값을 제거할 수 없으므로 삭제된 값은 다시 생성(build)하기 전까지 false positive로 남습니다.
+
+    save()로 파일에 저장한 snapshot은 load()에서 mmap(copy-on-write)으로 열어
+    여러 워커가 같은 페이지를 공유하고, 이후 add()한 페이지만 워커별로 복사됩니다.
+    """
+
+    MAGIC = b"BLM1"
+    # magic, bit 수, 해시 함수 수, 추가한 값 수, watermark
+    HEADER = struct.Struct("<4sQIQq")
+
+    def __init__(self, size, hashes, bits=None, count=0, watermark=0):
+        self.size = size
+        self.hashes = hashes
+        self.bits = bits if bits is not None else bytearray((size + 7) // 8)
+        self.count = count
+        # snapshot에 포함된 마지막 위치 (의미는 사용하는 쪽에서 정의)
+        self.watermark = watermark
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, capacity, error_rate):
+        """
+        capacity개를 넣었을 때 false positive 확률이 error_rate가 되는 크기로 생성
+        """
+        capacity = max(capacity, 1)
+        size = max(64, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        hashes = max(1, round(size / capacity * math.log(2)))
+        return cls(size=size, hashes=hashes)
+
+    def _indexes(self, value):
+        # double hashing: h1 + i * h2
+        h1 = mix64(value)
+        h2 = mix64(h1) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, value):
+        bits = self.bits
+        with self._lock:
+            for index in self._indexes(value):
+                bits[index >> 3] |= 1 << (index & 7)
+            self.count += 1
+
+    def __contains__(self, value):
+        bits = self.bits
+        for index in self._indexes(value):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def save(self, path):
+        """
+        파일로 저장 (임시 파일에 쓴 뒤 교체하므로 읽는 워커는 이전 또는 새 snapshot만 봄)
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.size, self.hashes, self.count, self.watermark))
+            f.write(self.bits)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        save()로 저장한 파일을 mmap으로 열어 반환 (형식이 다르면 ValueError)
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        if len(buffer) < cls.HEADER.size:
+            raise ValueError(f"invalid bloom filter file: {path}")
+        magic, size, hashes, count, watermark = cls.HEADER.unpack_from(buffer)
+        if magic != cls.MAGIC or len(buffer) != cls.HEADER.size + (size + 7) // 8:
+            raise ValueError(f"invalid bloom filter file: {path}")
+
+        return cls(size=size, hashes=hashes, bits=memoryview(buffer)[cls.HEADER.size :], count=count, watermark=watermark)
+
+    def __len__(self):
+        return self.count
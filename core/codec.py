@@ -0,0 +1,102 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Base62 Codec
+"""
+
+# 0-9, A-Z, a-z 순서 (기존 pybase62 기본 문자셋과 동일하여 이미 발급한 코드와 호환)
+CHARSET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(CHARSET)
+
+# 64bit 정수의 최대 Base62 길이
+MAX_WIDTH = 11
+
+# 두 자리씩 변환하는 lookup table (62 * 62 = 3844개)
+PAIR_BASE = BASE * BASE
+ENCODE_PAIRS = [a + b for a in CHARSET for b in CHARSET]
+DECODE_PAIRS = {pair: index for index, pair in enumerate(ENCODE_PAIRS)}
+DECODE_CHARS = {char: index for index, char in enumerate(CHARSET)}
+
+
+def encode(value, width=0):
+    """
+    0 이상의 정수를 Base62 문자열로 변환
+    width보다 짧으면 앞을 "0"으로 채웁니다. (width=0이면 최소 길이, 0은 "0")
+    """
+    if value < 0:
+        raise ValueError("base62 value must be non-negative")
+
+    encoded = ""
+    while value >= PAIR_BASE:
+        value, remainder = divmod(value, PAIR_BASE)
+        encoded = ENCODE_PAIRS[remainder] + encoded
+    # 남은 값(0 ~ 3843)은 한 자리면 앞의 "0" 없이
+    encoded = (ENCODE_PAIRS[value] if value >= BASE else CHARSET[value]) + encoded
+
+    if len(encoded) < width:
+        encoded = encoded.rjust(width, "0")
+    return encoded
+
+
+def decode(encoded):
+    """
+    Base62 문자열을 정수로 변환 (앞의 "0"은 값에 영향이 없으므로 zero padding 여부와 관계없이 같은 값)
+    올바르지 않은 문자가 있거나 비어 있으면 ValueError
+    """
+    length = len(encoded)
+    if not length:
+        raise ValueError("empty base62 string")
+
+    try:
+        # 홀수 길이면 첫 자리를 먼저 변환하고 나머지는 두 자리씩
+        if length % 2:
+            value = DECODE_CHARS[encoded[0]]
+            start = 1
+        else:
+            value = 0
+            start = 0
+        for index in range(start, length, 2):
+            value = value * PAIR_BASE + DECODE_PAIRS[encoded[index : index + 2]]
+    except KeyError:
+        raise ValueError(f"invalid base62 string: {encoded!r}") from None
+    return value
+
+
+def encode_many(values, width=0):
+    """
+    정수 목록을 한 번에 변환 (bulk 생성, export 등)
+    encode와 같은 결과이며, 값마다 함수 호출 없이 lookup table을 지역 변수로 사용합니다.
+    """
+    pairs, chars = ENCODE_PAIRS, CHARSET
+    encoded_values = []
+    append = encoded_values.append
+    for value in values:
+        if value < 0:
+            raise ValueError("base62 value must be non-negative")
+        encoded = ""
+        while value >= PAIR_BASE:
+            value, remainder = divmod(value, PAIR_BASE)
+            encoded = pairs[remainder] + encoded
+        encoded = (pairs[value] if value >= BASE else chars[value]) + encoded
+        append(encoded.rjust(width, "0") if len(encoded) < width else encoded)
+    return encoded_values
+
+
+def decode_many(encoded_values, max_value=None):
+    """
+    문자열 목록을 한 번에 변환, 올바르지 않거나 max_value를 넘는 값은 None
+    decode와 같은 결과이며, 값마다 함수 호출 없이 lookup table을 지역 변수로 사용합니다.
+    """
+    pairs, chars = DECODE_PAIRS, DECODE_CHARS
+    decoded = []
+    append = decoded.append
+    for encoded in encoded_values:
+        try:
+            start = len(encoded) % 2
+            value = chars[encoded[0]] if start else pairs[encoded[:2]]
+            for index in range(start or 2, len(encoded), 2):
+                value = value * PAIR_BASE + pairs[encoded[index : index + 2]]
+        except (KeyError, IndexError, TypeError):
+            value = None
+        append(None if max_value is not None and value is not None and value > max_value else value)
+    return decoded
@@ -22,6 +22,7 @@ class SERVICE:
     DEBUG = bool(os.getenv("DEBUG", False))
     ACCESS_TOKEN_EXP_MIN = int(os.getenv("ACCESS_TOKEN_EXP_MIN"))
     REFRESH_TOKEN_EXP_DAY = int(os.getenv("REFRESH_TOKEN_EXP_DAY"))
+    JWT_STATELESS = os.getenv("JWT_STATELESS", "False") == "True"
 
 
 class DATABASE:
@@ -34,6 +35,98 @@ class DATABASE:
     DB_PASSWORD = os.getenv("DB_PASSWORD")
     DB_HOST = os.getenv("DB_HOST")
     DB_PORT = os.getenv("DB_PORT")
+    DB_REPLICA_HOSTS = [host.strip() for host in os.getenv("DB_REPLICA_HOSTS", "").split(",") if host.strip()]
+    DB_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", 5))
+    DB_CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", 60))
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 0))
+    DB_POOL_MAX_LIFETIME = int(os.getenv("DB_POOL_MAX_LIFETIME", 3600))
+
+
+class CACHE:
+    """
+    Cache Config
+    """
+
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+    CACHE_LOCATION = os.getenv("CACHE_LOCATION", "short-url")
+    SHORT_URL_LRU_SIZE = int(os.getenv("SHORT_URL_LRU_SIZE", 10000))
+    SHORT_URL_LRU_TTL = int(os.getenv("SHORT_URL_LRU_TTL", 5))
+    SHORT_URL_CACHE_TTL = int(os.getenv("SHORT_URL_CACHE_TTL", 3600))
+    SHORT_URL_NEGATIVE_TTL = int(os.getenv("SHORT_URL_NEGATIVE_TTL", 30))
+    USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 60))
+    SHORT_URL_BLOOM_ENABLED = os.getenv("SHORT_URL_BLOOM_ENABLED", "False") == "True"
+    SHORT_URL_BLOOM_CAPACITY = int(os.getenv("SHORT_URL_BLOOM_CAPACITY", 1000000))
+    SHORT_URL_BLOOM_SNAPSHOT_PATH = os.getenv("SHORT_URL_BLOOM_SNAPSHOT_PATH")
+    SHORT_URL_HOT_KEYS_ENABLED = os.getenv("SHORT_URL_HOT_KEYS_ENABLED", "True") == "True"
+    SHORT_URL_HOT_KEYS_TOP_K = int(os.getenv("SHORT_URL_HOT_KEYS_TOP_K", 100))
+    SHORT_URL_HOT_KEYS_MIN_COUNT = int(os.getenv("SHORT_URL_HOT_KEYS_MIN_COUNT", 100))
+
+
+class CODE:
+    """
+    Short URL Code Generator Config
+    """
+
+    SHORT_URL_CODE_GENERATOR = os.getenv("SHORT_URL_CODE_GENERATOR", "hash")
+    SHORT_URL_WORKER_ID = int(os.getenv("SHORT_URL_WORKER_ID")) if os.getenv("SHORT_URL_WORKER_ID") else None
+    SHORT_URL_BLOCK_SIZE = int(os.getenv("SHORT_URL_BLOCK_SIZE", 1000))
+
+
+class ALIAS:
+    """
+    Short URL Alias Config
+    """
+
+    SHORT_URL_ALIAS_BLOCKED_WORDS = [word.strip() for word in os.getenv("SHORT_URL_ALIAS_BLOCKED_WORDS", "").split(",") if word.strip()]
+
+
+class COUNTER:
+    """
+    Click Counter Config
+    """
+
+    CLICK_COUNTER_BACKEND = os.getenv("CLICK_COUNTER_BACKEND", "local")
+    CLICK_COUNTER_FLUSH_INTERVAL = int(os.getenv("CLICK_COUNTER_FLUSH_INTERVAL", 5))
+    CLICK_COUNTER_MAX_BUFFER = int(os.getenv("CLICK_COUNTER_MAX_BUFFER", 10000))
+    CLICK_COUNTER_SHARDS = int(os.getenv("CLICK_COUNTER_SHARDS", 0))
+
+
+class ANALYTICS:
+    """
+    Click Analytics Config
+    """
+
+    CLICK_ANALYTICS_ENABLED = os.getenv("CLICK_ANALYTICS_ENABLED", "True") == "True"
+    CLICK_ANALYTICS_SINK = os.getenv("CLICK_ANALYTICS_SINK", "db")
+    CLICK_ANALYTICS_FLUSH_INTERVAL = int(os.getenv("CLICK_ANALYTICS_FLUSH_INTERVAL", 5))
+    CLICK_ANALYTICS_BUFFER_SIZE = int(os.getenv("CLICK_ANALYTICS_BUFFER_SIZE", 100000))
+    CLICK_ANALYTICS_NDJSON_DIR = os.getenv("CLICK_ANALYTICS_NDJSON_DIR")
+    CLICK_ANALYTICS_COUNTRY_RESOLVER = os.getenv("CLICK_ANALYTICS_COUNTRY_RESOLVER")
+
+
+class REAPER:
+    """
+    Short URL Reaper Config
+    """
+
+    SHORT_URL_RETENTION_DAYS = int(os.getenv("SHORT_URL_RETENTION_DAYS", 30))
+    SHORT_URL_REAPER_BATCH_SIZE = int(os.getenv("SHORT_URL_REAPER_BATCH_SIZE", 500))
+    SHORT_URL_REAPER_SLEEP = float(os.getenv("SHORT_URL_REAPER_SLEEP", 0.1))
+    SHORT_URL_REAPER_ARCHIVE = os.getenv("SHORT_URL_REAPER_ARCHIVE", "True") == "True"
+
+
+class MONITORING:
+    """
+    Instrumentation, Logging Config
+    """
+
+    INSTRUMENTATION_ENABLED = os.getenv("INSTRUMENTATION_ENABLED", "True") == "True"
+    INSTRUMENTATION_SAMPLE_RATE = float(os.getenv("INSTRUMENTATION_SAMPLE_RATE", 0.01))
+    INSTRUMENTATION_SERVER_TIMING = os.getenv("INSTRUMENTATION_SERVER_TIMING", "True") == "True"
+    INSTRUMENTATION_SLOW_REQUEST_MS = int(os.getenv("INSTRUMENTATION_SLOW_REQUEST_MS", 0))
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+    METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",") if ip.strip()]
+    DB_LOG_LEVEL = os.getenv("DB_LOG_LEVEL", "INFO")
 
 
 class SYSTEM_CODE:
@@ -62,3 +155,8 @@ class SYSTEM_CODE:
     SHORT_URL_NOT_FOUND = (2002, "SHORT_URL_NOT_FOUND")
     EXPIRATION_DATE_INVALID = (2003, "EXPIRATION_DATE_INVALID")
     SHORT_URL_EXPIRED = (2004, "SHORT_URL_EXPIRED")
+    SHORT_URL_CREATE_ERROR = (2005, "SHORT_URL_CREATE_ERROR")
+    BULK_LIMIT_EXCEEDED = (2006, "BULK_LIMIT_EXCEEDED")
+    ALIAS_INVALID = (2007, "ALIAS_INVALID")
+    ALIAS_RESERVED = (2008, "ALIAS_RESERVED")
+    ALIAS_ALREADY = (2009, "ALIAS_ALREADY")
@@ -0,0 +1,110 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Database Router (Read Replica)
+"""
+
+# System
+import random
+import contextvars
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+
+# 현재 read_replica 구간에서 사용할 replica alias (없으면 primary)
+_read_alias = contextvars.ContextVar("db_read_alias", default=None)
+# 현재 요청(context)에서 쓰기가 있었는지 여부, 이후 조회는 primary로 고정
+_pinned = contextvars.ContextVar("db_pinned", default=False)
+
+
+class ReplicaRouter:
+    """
+    Read replica router (DATABASE_ROUTERS)
+
+    쓰기는 항상 primary(default)로 보내고, 조회는 read_replica() 구간 안에서만 replica로 보냅니다.
+    (Redirect 조회, 목록, 통계처럼 복제 지연을 허용하는 조회만 명시적으로 replica 사용)
+    다음 경우에는 read_replica() 구간이어도 primary에서 조회합니다.
+    - 같은 요청(context)에서 이미 쓰기가 있었던 경우 (select_for_update 등 쓰기용 조회 포함)
+    - 쓰기를 한 유저가 STICKY_SECONDS 이내에 다시 요청한 경우 (ReplicaRouterMiddleware가 기록, 생성/삭제 직후 목록 등)
+    """
+
+    STICKY_KEY_PREFIX = "db:sticky"
+
+    @classmethod
+    def _get_config(cls):
+        return settings.DATABASE_REPLICA
+
+    @classmethod
+    def _get_shared(cls):
+        return caches[cls._get_config()["CACHE_ALIAS"]]
+
+    @classmethod
+    def make_sticky_key(cls, user_id):
+        return f"{cls.STICKY_KEY_PREFIX}:{user_id}"
+
+    @classmethod
+    def mark_sticky(cls, user):
+        """
+        유저의 이후 요청을 STICKY_SECONDS 동안 primary에서 조회 (쓰기 직후 복제 지연 동안 자신의 변경이 보이도록)
+        """
+        timeout = cls._get_config()["STICKY_SECONDS"]
+        if cls._get_config()["ALIASES"] and timeout > 0:
+            cls._get_shared().set(cls.make_sticky_key(user.pk), True, timeout=timeout)
+
+    @classmethod
+    def is_sticky(cls, user):
+        return bool(cls._get_shared().get(cls.make_sticky_key(user.pk)))
+
+    @classmethod
+    def get_replica(cls, user=None):
+        """
+        지금 조회에 사용할 replica alias 반환, primary를 사용해야 하면 None
+        """
+        aliases = cls._get_config()["ALIASES"]
+        if not aliases or _pinned.get():
+            return None
+        if user is not None and user.is_authenticated and cls.is_sticky(user):
+            return None
+        return random.choice(aliases)
+
+    @classmethod
+    @contextmanager
+    def read_replica(cls, user=None):
+        """
+        구간 안의 조회를 replica 하나로 보냄 (사용한 alias 또는 None을 반환)
+        구간 안에서 쓰기가 발생하면 이후 조회는 primary로 보냅니다.
+        """
+        alias = cls.get_replica(user=user)
+        token = _read_alias.set(alias)
+        try:
+            yield alias
+        finally:
+            _read_alias.reset(token)
+
+    @classmethod
+    def is_pinned(cls):
+        return _pinned.get()
+
+    @classmethod
+    def reset(cls, **kwargs):
+        """
+        요청 시작 시 쓰기 기록 초기화 (request_started signal, 워커 스레드가 요청 간에 context를 재사용하므로)
+        """
+        _pinned.set(False)
+
+    def db_for_read(self, model, **hints):
+        if _pinned.get():
+            return DEFAULT_DB_ALIAS
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        _pinned.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica는 primary와 같은 데이터이므로 alias가 달라도 관계 허용
+        databases = {DEFAULT_DB_ALIAS, *self._get_config()["ALIASES"]}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
@@ -0,0 +1,90 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Background Flusher
+"""
+
+# System
+import os
+import atexit
+import asyncio
+import logging
+import threading
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+logger = logging.getLogger("django")
+
+# 실행 중인 비동기 작업 (완료 전 GC 방지)
+_tasks = set()
+
+
+def spawn(func, *args):
+    """
+    sync 함수를 스레드에서 실행하고 결과를 기다리지 않음 (fire-and-forget, async view용)
+    """
+    task = asyncio.ensure_future(sync_to_async(func, thread_sensitive=False)(*args))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+class BackgroundFlusher:
+    """
+    메모리에 모아둔 데이터를 주기적으로 flush 하는 백그라운드 스레드
+    워커 프로세스마다 하나의 스레드를 사용하며, 프로세스 종료 시 마지막으로 한 번 더 flush 합니다.
+    fork 이후(gunicorn preload 등) 자식 프로세스에서는 스레드를 새로 시작합니다.
+    """
+
+    def __init__(self, name, flush, interval, flush_at_exit=True):
+        self.name = name
+        self.interval = interval
+        self._flush = flush
+        self._flush_at_exit = flush_at_exit
+        self._pid = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._registered = False
+
+    def start(self):
+        """
+        스레드 시작 (이미 현재 프로세스에서 실행 중이면 무시)
+        interval이 0 이하이면 스레드 없이 flush()를 직접 호출해야 합니다.
+        """
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            if self._flush_at_exit and not self._registered:
+                atexit.register(self.flush)
+                self._registered = True
+
+            if self.interval > 0:
+                thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                thread.start()
+            self._pid = os.getpid()
+
+    def wake(self):
+        """
+        다음 주기를 기다리지 않고 flush 요청
+        """
+        self._wakeup.set()
+
+    def flush(self):
+        """
+        flush 실행 (실패해도 예외를 전파하지 않음)
+        """
+        try:
+            self._flush()
+        except Exception as e:
+            logger.error(f"{self.name} flush failed: {e}")
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+            close_old_connections()
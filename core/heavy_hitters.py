@@ -0,0 +1,105 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Heavy Hitter Tracker (Space-Saving)
+"""
+
+# System
+import heapq
+import threading
+
+
+class SpaceSaving:
+    """
+    Space-Saving 알고리즘으로 가장 많이 등장한 값(heavy hitter)을 추적
+    capacity개의 카운터만 사용하고, 카운터가 가득 차면 가장 작은 카운터를 새 값에 넘겨줍니다.
+    값의 실제 횟수는 [count - error, count] 범위에 있고, 전체 횟수의 1/capacity보다 많이 등장한 값은 반드시 추적됩니다.
+
+    같은 횟수의 값을 bucket으로 묶어(Stream-Summary) add는 값 개수와 관계없이 O(1)입니다.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = max(capacity, 1)
+        self.total = 0
+        # 값 -> [count, error], count -> 해당 count의 값 집합 (dict를 순서 있는 집합으로 사용)
+        self._counters = {}
+        self._buckets = {}
+        self._min = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._counters)
+
+    def __contains__(self, key):
+        return key in self._counters
+
+    def _move(self, key, old, new):
+        bucket = self._buckets[old]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[old]
+            if self._min == old:
+                self._min = new
+        self._buckets.setdefault(new, {})[key] = None
+
+    def add(self, key):
+        """
+        값 하나 추가 후 현재 추정 횟수 반환
+        """
+        with self._lock:
+            self.total += 1
+            counter = self._counters.get(key)
+            if counter is not None:
+                count = counter[0]
+                counter[0] = count + 1
+                self._move(key, count, count + 1)
+                return count + 1
+
+            if len(self._counters) < self.capacity:
+                self._counters[key] = [1, 0]
+                self._buckets.setdefault(1, {})[key] = None
+                self._min = 1
+                return 1
+
+            # 가장 작은 카운터를 넘겨받음 (기존 횟수는 오차로 기록)
+            minimum = self._min
+            bucket = self._buckets[minimum]
+            evicted = next(iter(bucket))
+            del bucket[evicted]
+            del self._counters[evicted]
+            if not bucket:
+                del self._buckets[minimum]
+                self._min = minimum + 1
+            self._counters[key] = [minimum + 1, minimum]
+            self._buckets.setdefault(minimum + 1, {})[key] = None
+            return minimum + 1
+
+    def top(self, k):
+        """
+        추정 횟수가 큰 순서로 최대 k개의 (값, count, error) 반환
+        """
+        with self._lock:
+            items = [(key, count, error) for key, (count, error) in self._counters.items()]
+        return heapq.nlargest(k, items, key=lambda item: item[1])
+
+    def decay(self, factor):
+        """
+        모든 카운터에 factor(0~1)를 곱해 오래된 횟수의 비중을 줄임 (0이 된 카운터는 제거)
+        """
+        with self._lock:
+            counters, self._counters, self._buckets = self._counters, {}, {}
+            self.total = int(self.total * factor)
+            for key, (count, error) in counters.items():
+                count = int(count * factor)
+                if count <= 0:
+                    continue
+                self._counters[key] = [count, int(error * factor)]
+                self._buckets.setdefault(count, {})[key] = None
+            self._min = min(self._buckets, default=0)
+
+    def clear(self):
+        with self._lock:
+            self.total = 0
+            self._counters = {}
+            self._buckets = {}
+            self._min = 0
@@ -0,0 +1,211 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Request Instrumentation
+"""
+
+# System
+import hmac
+import time
+import random
+import logging
+import functools
+from contextvars import ContextVar
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotFound
+from django.views.decorators.http import require_GET
+
+# Project
+from core.metrics import Counter, Histogram, Registry, registry
+
+logger = logging.getLogger("core.instrumentation")
+
+# 현재 요청의 측정 값 (샘플링되지 않은 요청은 None, async view의 sync_to_async 스레드에도 전달됨)
+_current = ContextVar("instrumentation", default=None)
+
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+REQUEST_DURATION = registry.register(
+    Histogram("http_request_duration_seconds", "요청 처리 시간", DURATION_BUCKETS, labelnames=("view", "method", "status"))
+)
+DB_QUERIES = registry.register(Histogram("http_request_db_queries", "요청당 DB 쿼리 수", QUERY_BUCKETS, labelnames=("view",)))
+DB_DURATION = registry.register(Histogram("http_request_db_duration_seconds", "요청당 DB 쿼리 시간", DURATION_BUCKETS, labelnames=("view",)))
+SERIALIZER_DURATION = registry.register(
+    Histogram("http_request_serializer_duration_seconds", "요청당 응답 직렬화 시간", DURATION_BUCKETS, labelnames=("view",))
+)
+CACHE_LOOKUPS = registry.register(Counter("http_request_cache_lookups_total", "캐시 조회 수", labelnames=("view", "cache", "result")))
+
+
+class RequestMetrics:
+    """
+    요청 하나의 측정 값
+    """
+
+    __slots__ = ("started", "db_count", "db_time", "serializer_time", "cache")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_count = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        # (캐시 이름, hit 여부) -> 조회 수
+        self.cache = {}
+
+
+class Instrumentation:
+    """
+    요청별 성능 측정 (전체 시간, DB 쿼리 수와 시간, 캐시 hit/miss, 응답 직렬화 시간)
+
+    SAMPLE_RATE 비율의 요청만 측정하고, 측정하지 않는 요청은 난수 하나와 ContextVar 조회만 합니다.
+    - DB: 모든 DB connection에 execute wrapper를 등록하여(connection_created signal) 측정 중인 요청의 쿼리만 기록
+    - 캐시: ShortURLCache, UserCache 조회 시 cache(name, hit) 호출
+    - 직렬화: CustomRenderer의 응답 본문 직렬화 시간
+    측정한 요청은 Server-Timing 헤더를 붙이고, 워커 프로세스별 histogram에 누적하여 /metrics로 출력합니다.
+    (프로세스마다 따로 누적하므로 워커별로 수집하거나 수집기에서 합산)
+    """
+
+    # 요청마다 settings를 읽지 않도록 보관 (settings 조회는 측정하지 않는 요청 비용의 대부분)
+    _config = None
+
+    @classmethod
+    def _get_config(cls):
+        config = cls._config
+        if config is None:
+            config = cls._config = settings.INSTRUMENTATION
+        return config
+
+    @classmethod
+    def reset(cls, setting=None, **kwargs):
+        """
+        보관한 설정 초기화 (setting_changed signal 수신, 테스트의 override_settings)
+        """
+        if setting in (None, "INSTRUMENTATION"):
+            cls._config = None
+
+    @classmethod
+    def start(cls):
+        """
+        요청 측정 시작, 샘플링되지 않았으면 None 반환
+        """
+        config = cls._get_config()
+        if not config["ENABLED"]:
+            return None
+
+        rate = config["SAMPLE_RATE"]
+        if rate < 1 and random.random() >= rate:
+            return None
+
+        state = RequestMetrics()
+        _current.set(state)
+        return state
+
+    @staticmethod
+    def current():
+        return _current.get()
+
+    @classmethod
+    def finish(cls, state, view, method, status):
+        """
+        요청 측정 종료, histogram에 기록하고 Server-Timing 헤더 값(사용하지 않으면 None) 반환
+        """
+        total = time.perf_counter() - state.started
+        _current.set(None)
+
+        REQUEST_DURATION.observe(total, (view, method, str(status)))
+        DB_QUERIES.observe(state.db_count, (view,))
+        DB_DURATION.observe(state.db_time, (view,))
+        SERIALIZER_DURATION.observe(state.serializer_time, (view,))
+        for (name, hit), count in state.cache.items():
+            CACHE_LOOKUPS.inc(count, (view, name, "hit" if hit else "miss"))
+
+        config = cls._get_config()
+        timing = cls.server_timing(state, total)
+        if config["SLOW_REQUEST_MS"] and total * 1000 >= config["SLOW_REQUEST_MS"]:
+            logger.warning("slow request %s %s %s: %s", method, view, status, timing)
+        return timing if config["SERVER_TIMING"] else None
+
+    @staticmethod
+    def server_timing(state, total):
+        """
+        Server-Timing 헤더 값 (시간 단위 ms)
+        """
+        hits = sum(count for (_, hit), count in state.cache.items() if hit)
+        misses = sum(count for (_, hit), count in state.cache.items() if not hit)
+        return (
+            f"total;dur={total * 1000:.3f}, "
+            f'db;dur={state.db_time * 1000:.3f};desc="{state.db_count} queries", '
+            f'cache;desc="hit={hits} miss={misses}", '
+            f"serializer;dur={state.serializer_time * 1000:.3f}"
+        )
+
+    @staticmethod
+    def execute_wrapper(execute, sql, params, many, context):
+        """
+        DB connection execute wrapper (측정 중인 요청의 쿼리 수, 시간 기록)
+        """
+        state = _current.get()
+        if state is None:
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            state.db_count += 1
+            state.db_time += time.perf_counter() - started
+
+    @classmethod
+    def install(cls, sender=None, connection=None, **kwargs):
+        """
+        connection_created signal 수신, DB connection에 execute wrapper 등록 (connection마다 한 번)
+        """
+        if cls.execute_wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(cls.execute_wrapper)
+
+    @staticmethod
+    def cache(name, hit):
+        """
+        캐시 조회 결과 기록 (hit: DB를 조회하지 않고 응답)
+        """
+        state = _current.get()
+        if state is not None:
+            key = (name, hit)
+            state.cache[key] = state.cache.get(key, 0) + 1
+
+    @staticmethod
+    def serializer(render):
+        """
+        응답 직렬화 함수의 실행 시간을 기록하는 decorator
+        """
+
+        @functools.wraps(render)
+        def wrapper(*args, **kwargs):
+            state = _current.get()
+            if state is None:
+                return render(*args, **kwargs)
+
+            started = time.perf_counter()
+            try:
+                return render(*args, **kwargs)
+            finally:
+                state.serializer_time += time.perf_counter() - started
+
+        return wrapper
+
+
+@require_GET
+def metrics_view(request):
+    """
+    워커 프로세스의 histogram을 Prometheus text format으로 출력
+    METRICS_TOKEN이 설정되어 있고 Authorization: Bearer 값이 일치하며, METRICS_ALLOWED_IPS(기본 localhost)에서 온 요청만 응답하고 나머지는 404
+    (같은 호스트의 reverse proxy 뒤에서는 REMOTE_ADDR이 모두 127.0.0.1이므로 IP 검사만으로는 보호되지 않음)
+    """
+    config = Instrumentation._get_config()
+    token = config["METRICS_TOKEN"]
+    # str끼리 비교하면 ASCII가 아닌 헤더에서 TypeError가 발생하므로 bytes로 비교
+    if not token or not hmac.compare_digest(request.headers.get("Authorization", "").encode(), f"Bearer {token}".encode()):
+        return HttpResponseNotFound()
+    if config["METRICS_ALLOWED_IPS"] and request.META.get("REMOTE_ADDR") not in config["METRICS_ALLOWED_IPS"]:
+        return HttpResponseNotFound()
+    return HttpResponse(registry.render(), content_type=Registry.CONTENT_TYPE)
@@ -14,6 +14,7 @@ from rest_framework.authentication import BaseAuthentication
 # Project
 from core.constants import SERVICE, SYSTEM_CODE
 from core.exception import raise_exception
+from apps.users.cache import UserCache
 from apps.users.models import User
 
 
@@ -37,14 +38,15 @@ class CustomJWTAuthentication(BaseAuthentication):
             return None
 
         # 토큰 검증
-        user = self.validate_token(access_token)
+        user = self.validate_token(access_token, stateless=settings.JWT_AUTH["STATELESS"])
 
         return (user, None)
 
     @classmethod
-    def validate_token(cls, token):
+    def validate_token(cls, token, stateless=False):
         """
         토큰 검증하는 함수
+        stateless이면 만료 전까지 토큰 정보(user_id, email)를 신뢰하고 유저를 조회하지 않습니다.
         """
         try:
             decoded = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
@@ -58,16 +60,20 @@ class CustomJWTAuthentication(BaseAuthentication):
 
         user_id = decoded.get("user_id")
 
-        user = User.objects.filter(id=user_id).first()
+        if stateless:
+            fields = {"id": user_id, "email": decoded.get("email"), "is_active": True}
+        else:
+            fields = UserCache.get(user_id)
 
         # 존재 하지 않는 유저
-        if not user:
+        if not fields:
             raise_exception(code=SYSTEM_CODE.USER_NOT_FOUND, status=status.HTTP_401_UNAUTHORIZED)
         # 활성화 되지 않은 유저
-        if not user.is_active:
+        if not fields["is_active"]:
             raise_exception(code=SYSTEM_CODE.USER_NOT_ACTIVE, status=status.HTTP_401_UNAUTHORIZED)
 
-        return user
+        # 나머지 필드는 접근할 때 조회
+        return UserCache.build_user(fields)
 
     @classmethod
     def create_token(cls, user: User):
@@ -0,0 +1,156 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Prometheus Text Format Metrics
+"""
+
+# System
+import bisect
+import threading
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    label 값 조합(series)별로 값을 저장하는 metric (프로세스 메모리, 스레드 안전)
+    """
+
+    TYPE = None
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _labels(self, labels):
+        return tuple(zip(self.labelnames, labels))
+
+    def render_series(self, labels, value):
+        raise NotImplementedError
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+        with self._lock:
+            series = [(labels, self._copy(value)) for labels, value in self._series.items()]
+        for labels, value in sorted(series, key=lambda item: item[0]):
+            lines += self.render_series(self._labels(labels), value)
+        return lines
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._series = {}
+
+
+class Counter(Metric):
+    """
+    증가만 하는 값
+    """
+
+    TYPE = "counter"
+
+    def inc(self, amount=1, labels=()):
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+    def get(self, labels=()):
+        return self._series.get(labels, 0)
+
+    def render_series(self, labels, value):
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}"]
+
+
+class Histogram(Metric):
+    """
+    고정 bucket 경계로 관측값 분포를 누적 (bucket별 개수, 합계, 개수)
+    관측은 bisect 한 번과 덧셈만 하고, 누적(cumulative) 개수는 출력 시 계산합니다.
+    """
+
+    TYPE = "histogram"
+
+    def __init__(self, name, help, buckets, labelnames=()):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, labels=()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # [bucket별 개수(+Inf 포함), 합계, 개수]
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def get(self, labels=()):
+        """
+        (합계, 개수) 반환
+        """
+        series = self._series.get(labels)
+        return (0, 0) if series is None else (series[1], series[2])
+
+    @staticmethod
+    def _copy(value):
+        return [list(value[0]), value[1], value[2]]
+
+    def render_series(self, labels, value):
+        counts, total, count = value
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+            cumulative += bucket_count
+            lines.append(f"{self.name}_bucket{_format_labels((*labels, ('le', _format_value(float(bound)))))} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class Registry:
+    """
+    metric 목록, Prometheus text format(0.0.4) 출력
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics.values():
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+registry = Registry()
@@ -0,0 +1,102 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Project Middleware
+"""
+
+# System
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+# Project
+from core.db_router import ReplicaRouter
+from core.instrumentation import Instrumentation
+
+
+class InstrumentationMiddleware:
+    """
+    요청별 성능 측정 (Instrumentation), 측정한 요청에 Server-Timing 헤더 추가
+    다른 미들웨어 시간까지 포함하도록 MIDDLEWARE 가장 앞에 두고, async view는 이벤트 루프에서 그대로 처리합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _finish(state, request, response):
+        match = request.resolver_match
+        view = match.view_name if match else "unmatched"
+        timing = Instrumentation.finish(state, view, request.method, response.status_code if response is not None else 500)
+        if timing and response is not None:
+            response["Server-Timing"] = timing
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        state = Instrumentation.start()
+        if state is None:
+            return self.get_response(request)
+
+        response = None
+        try:
+            response = self.get_response(request)
+        finally:
+            self._finish(state, request, response)
+        return response
+
+    async def __acall__(self, request):
+        state = Instrumentation.start()
+        if state is None:
+            return await self.get_response(request)
+
+        response = None
+        try:
+            response = await self.get_response(request)
+        finally:
+            self._finish(state, request, response)
+        return response
+
+
+class ReplicaRouterMiddleware:
+    """
+    요청에서 쓰기가 있었으면 해당 유저를 STICKY_SECONDS 동안 primary에서 조회하도록 기록
+    (유저는 DRF 인증 후 request.user에 설정되므로 응답 시점에 확인)
+    async view(Redirect)가 스레드로 넘어가지 않도록 async도 지원하고, 쓰기가 있었던 요청만 스레드에서 기록합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _mark_sticky(request):
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            ReplicaRouter.mark_sticky(user)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        response = self.get_response(request)
+        if ReplicaRouter.is_pinned():
+            self._mark_sticky(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        # request.user(세션 조회)와 공유 캐시 기록은 sync I/O이므로 스레드에서 실행
+        if ReplicaRouter.is_pinned():
+            await sync_to_async(self._mark_sticky)(request)
+        return response
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CodeSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=50, unique=True, verbose_name="시퀀스 이름"),
+                ),
+                ("next_value", models.BigIntegerField(verbose_name="다음 할당 값")),
+            ],
+            options={
+                "db_table": "code_sequence",
+            },
+        ),
+    ]
@@ -17,3 +17,16 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class CodeSequence(models.Model):
+    """
+    Short URL 코드 블록 할당용 시퀀스
+    워커는 next_value부터 block 크기만큼을 한 번에 예약(lease)해 메모리에서 사용합니다.
+    """
+
+    name = models.CharField(max_length=50, unique=True, verbose_name="시퀀스 이름")
+    next_value = models.BigIntegerField(verbose_name="다음 할당 값")
+
+    class Meta:
+        db_table = "code_sequence"
@@ -5,11 +5,16 @@
 """
 
 # System
+import base64
+from datetime import datetime
+from django.db.models import Q
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 # Project
 from core.constants import SYSTEM_CODE
+from core.exception import raise_exception
 
 
 class CustomPagination(PageNumberPagination):
@@ -40,3 +45,86 @@ class CustomPagination(PageNumberPagination):
         }
 
         return Response(data=payload, status=status)
+
+
+class KeysetPagination:
+    """
+    Keyset(cursor) Pagination
+    (created_at, id) 내림차순으로 정렬하고, 다음 페이지는 OFFSET 없이 마지막 행의 (created_at, id) 이후부터 조회하므로
+    페이지가 깊어져도 조회 시간이 일정합니다.
+    전체 개수(COUNT(*))는 count=true로 요청한 경우에만 조회합니다.
+    """
+
+    page_size = 10
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    count_query_param = "count"
+
+    def encode_cursor(self, obj):
+        value = f"{obj.created_at.isoformat()}|{obj.id}"
+        return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """
+        cursor -> (created_at, id), 올바르지 않으면 INVALID_FORMAT
+        """
+        try:
+            value = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            created_at, pk = value.split("|")
+            return datetime.fromisoformat(created_at), int(pk)
+        except (ValueError, UnicodeDecodeError):
+            raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            raise_exception(code=SYSTEM_CODE.INVALID_FORMAT)
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request):
+        """
+        cursor 다음부터 page_size건 반환 (다음 페이지 존재 여부 확인을 위해 1건 더 조회)
+        """
+        self.request = request
+        self.count = queryset.count() if request.query_params.get(self.count_query_param) == "true" else None
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            created_at, pk = self.decode_cursor(cursor)
+            # created_at <= c 범위 조건으로 (user, ..., created_at) 인덱스를 그대로 이어서 읽음
+            queryset = queryset.filter(Q(created_at__lt=created_at) | Q(id__lt=pk), created_at__lte=created_at)
+
+        page_size = self.get_page_size(request)
+        results = list(queryset.order_by("-created_at", "-id")[: page_size + 1])
+
+        self.next_cursor = self.encode_cursor(results[page_size - 1]) if len(results) > page_size else None
+        return results[:page_size]
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(remove_query_param(url, self.count_query_param), self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, **kwargs):
+
+        status = kwargs.get("status", 200)
+        code = kwargs.get("code", SYSTEM_CODE.SUCCESS)
+        msg = kwargs.get("msg", code[1])
+        data = kwargs.get("data", None)
+
+        payload = {
+            "links": {
+                "next": self.get_next_link(),
+            },
+            "cursor": self.next_cursor,
+            "count": self.count,
+            "data": data,
+            "status_code": status,
+            "msg": msg,
+            "code": code[0],
+        }
+
+        return Response(data=payload, status=status)
@@ -0,0 +1,35 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Custom Parsers
+"""
+
+# System
+import json
+import codecs
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    NDJSON(줄 단위 JSON) 파서
+    본문을 한 번에 읽지 않고 줄 단위로 읽어 JSON 값 목록으로 반환합니다.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        items = []
+        try:
+            for line in codecs.getreader(encoding)(stream):
+                line = line.strip()
+                if line:
+                    items.append(json.loads(line))
+        except ValueError as exc:
+            raise ParseError(f"NDJSON parse error - {exc}")
+        return items
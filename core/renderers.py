@@ -5,33 +5,127 @@
 """
 
 # System
+import json
 from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Project
 from core.constants import SYSTEM_CODE
+from core.instrumentation import Instrumentation
+
+# create_payload(create_response) 응답 본문의 key
+ENVELOPE_KEYS = {"data", "status_code", "msg", "code"}
+
+# 미리 직렬화할 에러 응답 status (SYSTEM_CODE 전체)
+PRERENDER_STATUSES = (400, 500)
+
+# 직렬화한 응답 본문의 뒷부분, data가 비어 있는 응답 전체 ((status_code, msg, code) 기준)
+_tails = {}
+_bodies = {}
+_MAX_CACHED = 1024
+
+_default = JSONEncoder().default
+
+
+def dumps(data):
+    """
+    DRF JSONRenderer와 같은 형식(공백 없음, ensure_ascii=False)의 bytes로 직렬화
+    orjson이 있으면 사용하고, orjson이 처리하지 못하는 값(datetime 등)은 DRF JSONEncoder로 변환합니다.
+    """
+    if orjson is not None:
+        try:
+            body = orjson.dumps(data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # 64bit를 넘는 정수 등은 표준 json으로 처리
+            body = None
+        if body is not None:
+            # DRF JSONRenderer와 같이 JavaScript에서 줄바꿈으로 해석되는 문자 escape
+            if b"\xe2\x80\xa8" in body or b"\xe2\x80\xa9" in body:
+                body = body.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+            return body
+
+    text = json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return text.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+
+def _is_cacheable(key):
+    # ErrorDetail 등 str 하위 타입, dict 메시지는 캐싱하지 않음
+    return type(key[1]) is str and len(_tails) < _MAX_CACHED
+
+
+def _render_tail(key):
+    tail = _tails.get(key)
+    if tail is None:
+        status_code, msg, code = key
+        tail = b',"status_code":' + dumps(status_code) + b',"msg":' + dumps(msg) + b',"code":' + dumps(code) + b"}"
+        if _is_cacheable(key):
+            _tails[key] = tail
+    return tail
+
+
+def render_envelope(payload):
+    """
+    create_payload 형식의 응답 본문 직렬화
+    data만 직렬화하고 (status_code, msg, code) 부분은 캐싱한 bytes를 이어 붙이며,
+    data가 비어 있는 응답(에러 응답 등)은 본문 전체를 캐싱하여 그대로 반환합니다.
+    """
+    key = (payload["status_code"], payload["msg"], payload["code"])
+    data = payload["data"]
+
+    if type(data) is dict and not data:
+        body = _bodies.get(key)
+        if body is None:
+            body = b'{"data":{}' + _render_tail(key)
+            if _is_cacheable(key):
+                _bodies[key] = body
+        return body
+
+    return b'{"data":' + dumps(data) + _render_tail(key)
+
+
+def render_error(code, status=400):
+    """
+    SYSTEM_CODE 에러 응답 본문 (create_payload(code=code, status=status)와 같은 bytes)
+    """
+    body = _bodies.get((status, code[1], code[0]))
+    if body is None:
+        body = render_envelope({"data": {}, "status_code": status, "msg": code[1], "code": code[0]})
+    return body
+
+
+def prerender_errors():
+    """
+    모든 SYSTEM_CODE의 에러 응답 본문을 미리 직렬화 (모듈 로드 시 1회)
+    """
+    for name, value in vars(SYSTEM_CODE).items():
+        if not name.startswith("_") and isinstance(value, tuple):
+            for status in PRERENDER_STATUSES:
+                render_error(value, status=status)
+
+
+prerender_errors()
 
 
 class CustomRenderer(JSONRenderer):
     """
     CustomRenderer를 통해 전역 반환값을 설정
+    create_response 형식의 응답은 render_envelope로, 나머지는 dumps로 직렬화합니다. (orjson, 없으면 표준 json)
+    indent를 요청한 경우(브라우저 등)에는 DRF JSONRenderer를 그대로 사용합니다.
     """
 
-    def render(self, data, accepted_media_type=None, renderer_context=None, **kwargs):
-        response_data = renderer_context.get("response")
-        status = kwargs.get("status", 200)
-        code = kwargs.get("code", SYSTEM_CODE.SUCCESS)
-        msg = kwargs.get("msg", code[1])
-
-        response = {
-            "data": data,
-            "status_code": status,
-            "msg": msg,
-            "code": code[0],
-        }
-        # response = {
-        #     "data": data,
-        #     "status_code": response_data.status_code,
-        #     "msg": response_data.status_text,
-        # }
-
-        return super(CustomRenderer, self).render(response, accepted_media_type, renderer_context)
+    @Instrumentation.serializer
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if type(data) is dict and data.keys() == ENVELOPE_KEYS:
+            return render_envelope(data)
+        return dumps(data)
@@ -5,28 +5,51 @@
 """
 
 # System
+from django.http import HttpResponse
 from rest_framework.response import Response
 
 # Project
 from core.constants import SYSTEM_CODE
+from core.renderers import render_envelope
 
 
-def create_response(**kwargs):
+def create_payload(**kwargs):
     """
-    Custom Response
-    응답 메시지는 이것으로 관리합니다.
+    응답 메시지 본문
     """
 
-    headers = kwargs.get("headers", None)
-    data = kwargs.get("data", {})
     status = kwargs.get("status", 200)
     code = kwargs.get("code", SYSTEM_CODE.SUCCESS)
     msg = kwargs.get("msg", code[1])
     payload = {
-        "data": data,
+        "data": kwargs.get("data", {}),
         "status_code": status,
         "msg": msg,
         "code": code[0],
     }
 
-    return Response(payload, headers=headers, status=status)
+    return payload
+
+
+def create_response(**kwargs):
+    """
+    Custom Response
+    응답 메시지는 이것으로 관리합니다.
+    """
+
+    headers = kwargs.get("headers", None)
+    status = kwargs.get("status", 200)
+
+    return Response(create_payload(**kwargs), headers=headers, status=status)
+
+
+def create_json_response(**kwargs):
+    """
+    DRF를 거치지 않는 view(async view 등)용 Custom Response
+    create_response와 같은 형식의 JSON을 반환합니다.
+    """
+
+    headers = kwargs.get("headers", None)
+    status = kwargs.get("status", 200)
+
+    return HttpResponse(render_envelope(create_payload(**kwargs)), headers=headers, status=status, content_type="application/json")
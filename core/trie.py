@@ -0,0 +1,65 @@
+"""
+    Copyright ⓒ 2024 Dcho, Inc. All Rights Reserved.
+    Author : Dcho (tmdgns743@gmail.com)
+    Description : Word Trie
+"""
+
+
+class Trie:
+    """
+    단어 검사용 Trie (대소문자 구분 없음)
+    단어마다 종류(kind)를 저장하고, 단어 전체가 일치해야 하는 단어(exact)와
+    문자열 어디에 포함되어도 일치하는 단어(exact=False)를 함께 검사합니다.
+    """
+
+    def __init__(self):
+        self.root = {}
+        self.count = 0
+
+    def add(self, word, kind=None, exact=True):
+        """
+        단어 추가 (빈 단어는 무시)
+        """
+        word = word.strip().lower()
+        if not word:
+            return
+
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        if None not in node:
+            self.count += 1
+        node[None] = (kind, exact)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        node = self.root
+        for char in word.lower():
+            node = node.get(char)
+            if node is None:
+                return False
+        return None in node
+
+    def match(self, text):
+        """
+        text에서 처음 일치한 단어의 (단어, kind) 반환, 없으면 None
+        시작 위치마다 Trie를 따라가므로 O(len(text) * 가장 긴 단어 길이)입니다.
+        """
+        text = text.lower()
+        length = len(text)
+        for start in range(length):
+            node = self.root
+            for end in range(start, length):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                value = node.get(None)
+                if value is None:
+                    continue
+                kind, exact = value
+                # exact 단어는 text 전체와 일치할 때만
+                if not exact or (start == 0 and end == length - 1):
+                    return text[start : end + 1], kind
+        return None